@@ -6,24 +6,87 @@ with the Python backend services.
 
 Run with: python bridge/server.py
 """
+if __name__ == "__main__":
+    # Must run before anything else imports socket/ssl/subprocess. Threads are
+    # left unpatched: controller workers block in C extensions (Whisper, TTS,
+    # PortAudio) and need to stay real OS threads.
+    from gevent import monkey
+
+    monkey.patch_all(thread=False)
+
+import gzip
+import itertools
 import logging
 import os
+import queue
 import sys
+import threading
 import time
+from collections import deque
 from datetime import datetime
-from typing import Any, Dict, Optional
+from typing import Any, Deque, Dict, List, Optional, Tuple
 
 # Add project root to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+import psutil  # noqa: E402
 from flask import Flask, jsonify, request  # noqa: E402
+from flask.json.provider import DefaultJSONProvider  # noqa: E402
 from flask_cors import CORS  # noqa: E402
 
+try:
+    import orjson
+
+    ORJSON_AVAILABLE = True
+except ImportError as e:
+    ORJSON_AVAILABLE = False
+    logging.getLogger("code_sergeant.bridge").warning(
+        f"orjson not installed: {e}. Install with: pip install orjson"
+    )
+
+try:
+    import msgspec
+
+    MSGSPEC_AVAILABLE = True
+except ImportError as e:
+    MSGSPEC_AVAILABLE = False
+    logging.getLogger("code_sergeant.bridge").warning(
+        f"msgspec not installed: {e}. Install with: pip install msgspec"
+    )
+
+try:
+    from flask_compress import Compress
+
+    COMPRESS_AVAILABLE = True
+except ImportError as e:
+    COMPRESS_AVAILABLE = False
+    logging.getLogger("code_sergeant.bridge").warning(
+        f"flask-compress not installed: {e}. Install with: pip install flask-compress"
+    )
+
+try:
+    import brotli
+
+    BROTLI_AVAILABLE = True
+except ImportError:
+    BROTLI_AVAILABLE = False
+
+try:
+    from flask_socketio import SocketIO, emit
+
+    SOCKETIO_AVAILABLE = True
+except ImportError as e:
+    SOCKETIO_AVAILABLE = False
+    logging.getLogger("code_sergeant.bridge").warning(
+        f"flask-socketio not installed: {e}. Install with: pip install flask-socketio"
+    )
+
 from code_sergeant.ai_client import create_ai_client  # noqa: E402
 
 # Import Code Sergeant modules
 from code_sergeant.config import load_config, save_config, set_env_var  # noqa: E402
 from code_sergeant.controller import AppController  # noqa: E402
+from code_sergeant.models import BREAK_STATES  # noqa: E402
 from code_sergeant.native_monitor import NativeMonitor  # noqa: E402
 from code_sergeant.tts import TTSService  # noqa: E402
 
@@ -33,9 +96,58 @@ logging.basicConfig(
 )
 logger = logging.getLogger("code_sergeant.bridge")
 
+
+class ORJSONProvider(DefaultJSONProvider):
+    """Flask JSON provider backed by orjson, used by jsonify() and request.json."""
+
+    def dumps(self, obj: Any, **kwargs: Any) -> str:
+        return orjson.dumps(obj, default=self.default).decode()
+
+    def loads(self, s: Any, **kwargs: Any) -> Any:
+        return orjson.loads(s)
+
+    def response(self, *args: Any, **kwargs: Any):
+        # Write orjson's bytes straight into the response, skipping str round-trips
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default), mimetype=self.mimetype
+        )
+
+
 app = Flask(__name__)
+if ORJSON_AVAILABLE:
+    app.json = ORJSONProvider(app)
 CORS(app)
 
+# Compress JSON responses large enough to benefit (config, screen status, ...)
+if COMPRESS_AVAILABLE:
+    app.config["COMPRESS_ALGORITHM"] = ["br", "gzip"] if BROTLI_AVAILABLE else ["gzip"]
+    app.config["COMPRESS_MIN_SIZE"] = 256
+    Compress(app)
+
+# WebSocket push channel; the HTTP endpoints below remain as a polling fallback
+socketio = (
+    SocketIO(app, async_mode="gevent", cors_allowed_origins="*")
+    if SOCKETIO_AVAILABLE
+    else None
+)
+
+if MSGSPEC_AVAILABLE:
+
+    class StatusOut(msgspec.Struct):
+        """/api/status response, encoded straight to JSON bytes by msgspec."""
+
+        session_active: bool
+        focus_time_minutes: int
+        current_goal: Optional[str]
+        personality: str
+        timestamp: str
+
+    _msgspec_encoder = msgspec.json.Encoder()
+
+# How often the push loop samples backend state (seconds)
+PUSH_INTERVAL_SEC = 0.25
+
 # Global state
 controller: Optional[AppController] = None
 config: Dict[str, Any] = {}
@@ -72,6 +184,72 @@ def initialize_services():
     logger.info("Services initialized successfully")
 
 
+# Second-resolution timestamp shared by every response within the same second
+_now_iso_cache = (0, "")
+
+
+def _now_iso() -> str:
+    """Return the current local time as an ISO string, formatted at most once per second."""
+    global _now_iso_cache
+
+    now = int(time.time())
+    if _now_iso_cache[0] != now:
+        _now_iso_cache = (now, datetime.fromtimestamp(now).isoformat())
+    return _now_iso_cache[1]
+
+
+# (controller, capabilities) - controller attributes are fixed after __init__,
+# so optional features are probed once per controller instead of per request
+_caps_cache: Optional[Tuple[Any, Dict[str, bool]]] = None
+
+
+def _caps() -> Dict[str, bool]:
+    """Return which optional controller features are present."""
+    global _caps_cache
+
+    if _caps_cache is None or _caps_cache[0] is not controller:
+        screen_monitor = getattr(controller, "screen_monitor", None)
+        personality_manager = getattr(controller, "personality_manager", None)
+        caps = {
+            "ai_client": hasattr(controller, "ai_client"),
+            "screen_monitor": hasattr(controller, "screen_monitor"),
+            "personality_manager": hasattr(controller, "personality_manager"),
+            "skip_break": hasattr(getattr(controller, "pomodoro", None), "skip_break"),
+            "focus_time_minutes": hasattr(controller, "get_focus_time_minutes"),
+            "vision_backend_status": hasattr(
+                screen_monitor, "get_vision_backend_status"
+            ),
+            "profile_name": hasattr(personality_manager, "get_profile_name"),
+            "available_profiles": hasattr(
+                personality_manager, "get_available_profiles"
+            ),
+        }
+        _caps_cache = (controller, caps)
+    return _caps_cache[1]
+
+
+def _raw_json(body: bytes, status: int = 200):
+    """Wrap an already-encoded JSON body in a fresh response."""
+    return app.response_class(body, status=status, mimetype="application/json")
+
+
+def _encode_json(obj: Any) -> bytes:
+    """Encode obj once with the app's JSON provider."""
+    return app.json.dumps(obj).encode()
+
+
+# Pre-encoded bodies for responses that never change
+_BODY_CONTROLLER_MISSING = _encode_json({"error": "Controller not initialized"})
+_BODY_MONITOR_MISSING = _encode_json({"error": "Native monitor not initialized"})
+_BODY_NO_EVENTS = _encode_json({"events": []})
+_BODY_SESSION_PAUSED = _encode_json({"success": True, "message": "Session paused"})
+_BODY_SESSION_RESUMED = _encode_json({"success": True, "message": "Session resumed"})
+_BODY_BREAK_SKIPPED = _encode_json({"success": True, "message": "Break skipped"})
+_BODY_SPEAKING = _encode_json({"success": True, "message": "Speaking..."})
+_BODY_AUDIO_STOPPED = _encode_json({"success": True, "message": "Audio stopped"})
+_HEALTH_PREFIX = b'{"status":"healthy","timestamp":"'
+
+
 # ============================================================================
 # Status & Health Endpoints
 # ============================================================================
@@ -80,46 +258,78 @@ def initialize_services():
 @app.route("/api/health", methods=["GET"])
 def health_check():
     """Health check endpoint."""
-    return jsonify({"status": "healthy", "timestamp": datetime.now().isoformat()})
+    # The ISO timestamp never needs escaping, so splice it into a fixed template
+    return _raw_json(b"".join((_HEALTH_PREFIX, _now_iso().encode(), b'"}')))
 
 
 @app.route("/api/status", methods=["GET"])
 def get_status():
     """Get current application status."""
     if not controller:
-        return jsonify({"error": "Controller not initialized"}), 500
+        return _raw_json(_BODY_CONTROLLER_MISSING, 500)
+
+    if not MSGSPEC_AVAILABLE:
+        return jsonify({**_status_payload(), "timestamp": _now_iso()})
 
-    # Get state snapshot
     state = controller.get_state_snapshot()
+    status = StatusOut(
+        session_active=state.session_active,
+        focus_time_minutes=_focus_minutes(state),
+        current_goal=state.goal,
+        personality=state.personality_name,
+        timestamp=_now_iso(),
+    )
+    return _raw_json(_msgspec_encoder.encode(status))
 
-    # Calculate focus time from stats
-    focus_time_minutes = 0
-    if state.stats and state.stats.focus_seconds:
-        focus_time_minutes = state.stats.focus_seconds // 60
 
-    return jsonify(
-        {
-            "session_active": state.session_active,
-            "focus_time_minutes": focus_time_minutes,
-            "current_goal": state.goal,
-            "personality": state.personality_name,
-            "timestamp": datetime.now().isoformat(),
-        }
-    )
+def _focus_minutes(state) -> int:
+    """Whole minutes of focus time recorded in a state snapshot."""
+    return (state.stats.focus_seconds or 0) // 60 if state.stats else 0
+
+
+def _status_payload() -> Dict[str, Any]:
+    """Build the session status payload shared by /api/status and the push channel."""
+    # Get state snapshot (reused by the controller until the state changes)
+    state = controller.get_state_snapshot()
+
+    return {
+        "session_active": state.session_active,
+        "focus_time_minutes": _focus_minutes(state),
+        "current_goal": state.goal,
+        "personality": state.personality_name,
+    }
 
 
 @app.route("/api/ai/status", methods=["GET"])
 def get_ai_status():
     """Get AI backend status."""
-    if not controller or not hasattr(controller, "ai_client"):
+    if not controller or not _caps()["ai_client"]:
         return jsonify({"error": "AI client not initialized"}), 500
 
-    ai_status = controller.ai_client.get_status()
+    # Probe first: get_status() checks Ollama too and reuses this cached result,
+    # so the endpoint costs at most one round-trip to the Ollama server
     ollama_available, ollama_msg = controller.ai_client.check_ollama_available()
+    ai_status = controller.ai_client.get_status()
 
     return jsonify({**ai_status, "ollama_server_message": ollama_msg})
 
 
+@app.route("/api/snapshot", methods=["GET"])
+def get_snapshot():
+    """Get status, timer and activity in one response for a full UI refresh."""
+    if not controller:
+        return _raw_json(_BODY_CONTROLLER_MISSING, 500)
+
+    return jsonify(
+        {
+            "status": _status_payload(),
+            "timer": _timer_payload(),
+            "activity": _activity_payload() if native_monitor else None,
+            "timestamp": _now_iso(),
+        }
+    )
+
+
 # ============================================================================
 # Session Management
 # ============================================================================
@@ -129,7 +339,7 @@ def get_ai_status():
 def start_session():
     """Start a new focus session."""
     if not controller:
-        return jsonify({"error": "Controller not initialized"}), 500
+        return _raw_json(_BODY_CONTROLLER_MISSING, 500)
 
     data = request.json or {}
     goal = data.get("goal", "")
@@ -168,7 +378,7 @@ def start_session():
 def end_session():
     """End current focus session."""
     if not controller:
-        return jsonify({"error": "Controller not initialized"}), 500
+        return _raw_json(_BODY_CONTROLLER_MISSING, 500)
 
     try:
         # Get stats before ending session
@@ -180,18 +390,15 @@ def end_session():
         logger.info("Session ended")
 
         # Build summary
-        summary = {}
-        if stats:
-            focus_minutes = stats.focus_seconds // 60 if stats.focus_seconds else 0
-            summary = {
-                "focus_minutes": focus_minutes,
-                "distractions": stats.distractions_count
-                if stats.distractions_count
-                else 0,
-                "pomodoros_completed": stats.pomodoros_completed
-                if stats.pomodoros_completed
-                else 0,
+        summary = (
+            {
+                "focus_minutes": (stats.focus_seconds or 0) // 60,
+                "distractions": stats.distractions_count or 0,
+                "pomodoros_completed": stats.pomodoros_completed or 0,
             }
+            if stats
+            else {}
+        )
 
         return jsonify(
             {"success": True, "message": "Session ended", "summary": summary}
@@ -205,11 +412,11 @@ def end_session():
 def pause_session():
     """Pause current session timer."""
     if not controller:
-        return jsonify({"error": "Controller not initialized"}), 500
+        return _raw_json(_BODY_CONTROLLER_MISSING, 500)
 
     try:
         controller.pause_session()
-        return jsonify({"success": True, "message": "Session paused"})
+        return _raw_json(_BODY_SESSION_PAUSED)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -218,11 +425,11 @@ def pause_session():
 def resume_session():
     """Resume paused session timer."""
     if not controller:
-        return jsonify({"error": "Controller not initialized"}), 500
+        return _raw_json(_BODY_CONTROLLER_MISSING, 500)
 
     try:
         controller.resume_session()
-        return jsonify({"success": True, "message": "Session resumed"})
+        return _raw_json(_BODY_SESSION_RESUMED)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -231,12 +438,12 @@ def resume_session():
 def skip_break():
     """Skip current break."""
     if not controller:
-        return jsonify({"error": "Controller not initialized"}), 500
+        return _raw_json(_BODY_CONTROLLER_MISSING, 500)
 
     try:
-        if controller.pomodoro and hasattr(controller.pomodoro, "skip_break"):
+        if controller.pomodoro and _caps()["skip_break"]:
             controller.pomodoro.skip_break()
-        return jsonify({"success": True, "message": "Break skipped"})
+        return _raw_json(_BODY_BREAK_SKIPPED)
     except Exception as e:
         return jsonify({"error": str(e)}), 500
 
@@ -250,44 +457,35 @@ def skip_break():
 def get_timer():
     """Get current timer state."""
     if not controller:
-        return jsonify({"error": "Controller not initialized"}), 500
+        return _raw_json(_BODY_CONTROLLER_MISSING, 500)
+
+    return jsonify(_timer_payload())
+
 
+def _timer_payload() -> Dict[str, Any]:
+    """Build the timer payload shared by /api/timer and the push channel."""
     pomodoro = getattr(controller, "pomodoro", None)
     if not pomodoro or not pomodoro.state:
-        return jsonify(
-            {
-                "state": "stopped",
-                "remaining_seconds": 0,
-                "total_seconds": 0,
-                "is_break": False,
-                "work_minutes": 25,
-                "break_minutes": 5,
-            }
-        )
+        return {
+            "state": "stopped",
+            "remaining_seconds": 0,
+            "total_seconds": 0,
+            "is_break": False,
+            "work_minutes": 25,
+            "break_minutes": 5,
+        }
 
     pomodoro_state = pomodoro.state
-    is_break = pomodoro_state.current_state in ("short_break", "long_break")
-
-    # Calculate total seconds based on current state
-    if pomodoro_state.current_state == "work":
-        total_seconds = pomodoro_state.work_duration_minutes * 60
-    elif pomodoro_state.current_state == "short_break":
-        total_seconds = pomodoro_state.short_break_minutes * 60
-    elif pomodoro_state.current_state == "long_break":
-        total_seconds = pomodoro_state.long_break_minutes * 60
-    else:
-        total_seconds = 0
+    is_break = pomodoro_state.current_state in BREAK_STATES
 
-    return jsonify(
-        {
-            "state": pomodoro_state.current_state,
-            "remaining_seconds": pomodoro_state.time_remaining_seconds,
-            "total_seconds": total_seconds,
-            "is_break": is_break,
-            "work_minutes": pomodoro_state.work_duration_minutes,
-            "break_minutes": pomodoro_state.short_break_minutes,
-        }
-    )
+    return {
+        "state": pomodoro_state.current_state,
+        "remaining_seconds": pomodoro_state.time_remaining_seconds,
+        "total_seconds": pomodoro_state.total_seconds,
+        "is_break": is_break,
+        "work_minutes": pomodoro_state.work_duration_minutes,
+        "break_minutes": pomodoro_state.short_break_minutes,
+    }
 
 
 # ============================================================================
@@ -299,22 +497,20 @@ def get_timer():
 def get_current_activity():
     """Get current activity."""
     if not native_monitor:
-        return jsonify({"error": "Native monitor not initialized"}), 500
+        return _raw_json(_BODY_MONITOR_MISSING, 500)
+
+    return jsonify(_activity_payload())
 
-    return jsonify(
-        {
-            "app": native_monitor.get_frontmost_app(),
-            "window_title": native_monitor.get_active_window_title(),
-            "idle_seconds": native_monitor.get_idle_seconds(),
-            "is_idle": native_monitor.is_user_idle(),
-        }
-    )
+
+def _activity_payload() -> Dict[str, Any]:
+    """Build the activity payload shared by /api/activity/current and the push channel."""
+    return native_monitor.snapshot()
 
 
 @app.route("/api/screen-monitoring/status", methods=["GET"])
 def get_screen_monitoring_status():
     """Get screen monitoring status."""
-    if not controller or not hasattr(controller, "screen_monitor"):
+    if not controller or not _caps()["screen_monitor"]:
         return jsonify({"enabled": False, "status": "not_initialized"})
 
     sm = controller.screen_monitor
@@ -323,7 +519,7 @@ def get_screen_monitoring_status():
             "enabled": sm.is_enabled(),
             "use_local_vision": sm.use_local_vision,
             "backend_status": sm.get_vision_backend_status()
-            if hasattr(sm, "get_vision_backend_status")
+            if _caps()["vision_backend_status"]
             else "unknown",
             "check_interval_seconds": sm.check_interval,
             "last_analysis": sm.last_analysis.to_dict()
@@ -339,7 +535,7 @@ def toggle_screen_monitoring():
     data = request.json or {}
     enabled = data.get("enabled", True)
 
-    if not controller or not hasattr(controller, "screen_monitor"):
+    if not controller or not _caps()["screen_monitor"]:
         return jsonify({"error": "Screen monitor not available"}), 500
 
     controller.screen_monitor.enable(enabled)
@@ -352,9 +548,42 @@ def toggle_screen_monitoring():
 # ============================================================================
 
 
+# Serialized sanitized config per content encoding, paired with the config dict
+# it was built from. Rebuilt only after PATCH /api/config or when the config
+# object is replaced, so each encoding is compressed once per config change.
+_sanitized_config_cache: Optional[Tuple[Dict[str, Any], Dict[str, bytes]]] = None
+
+
 @app.route("/api/config", methods=["GET"])
 def get_config():
     """Get current config (sanitized - no API keys)."""
+    global _sanitized_config_cache
+
+    if _sanitized_config_cache is None or _sanitized_config_cache[0] is not config:
+        body = _encode_json(_sanitize_config(config))
+        _sanitized_config_cache = (config, {"identity": body})
+
+    bodies = _sanitized_config_cache[1]
+    encodings = ["br", "gzip"] if BROTLI_AVAILABLE else ["gzip"]
+    encoding = request.accept_encodings.best_match(encodings)
+    if not encoding:
+        return _raw_json(bodies["identity"])
+
+    if encoding not in bodies:
+        raw = bodies["identity"]
+        bodies[encoding] = (
+            brotli.compress(raw) if encoding == "br" else gzip.compress(raw)
+        )
+
+    # Content-Encoding is set, so the compression middleware leaves this alone
+    response = _raw_json(bodies[encoding])
+    response.headers["Content-Encoding"] = encoding
+    response.vary.add("Accept-Encoding")
+    return response
+
+
+def _sanitize_config(config: Dict[str, Any]) -> Dict[str, Any]:
+    """Return a shallow copy of config with API keys masked."""
     sanitized = {**config}
 
     # Remove sensitive data
@@ -371,13 +600,13 @@ def get_config():
             else None,
         }
 
-    return jsonify(sanitized)
+    return sanitized
 
 
 @app.route("/api/config", methods=["PATCH"])
 def update_config():
     """Update config values."""
-    global config
+    global config, _sanitized_config_cache
 
     data = request.json or {}
 
@@ -390,6 +619,7 @@ def update_config():
 
     # Save to disk
     save_config(config)
+    _sanitized_config_cache = None
 
     return jsonify({"success": True, "message": "Config updated"})
 
@@ -408,7 +638,7 @@ def set_openai_key():
         set_env_var("OPENAI_API_KEY", api_key)
 
         # Update AI client if available
-        if controller and hasattr(controller, "ai_client"):
+        if controller and _caps()["ai_client"]:
             success = controller.ai_client.set_openai_key(api_key)
             if success:
                 return jsonify(
@@ -430,6 +660,60 @@ def set_openai_key():
 # TTS & Voice
 # ============================================================================
 
+# Speech requests are handed to a daemon worker so the HTTP handler never waits
+# on the TTS service; when the backlog is full the oldest request is dropped.
+TTS_QUEUE_MAXSIZE = 32
+_tts_queue: "queue.Queue[str]" = queue.Queue(maxsize=TTS_QUEUE_MAXSIZE)
+_tts_worker: Optional[threading.Thread] = None
+_tts_worker_lock = threading.Lock()
+
+
+def _tts_worker_loop():
+    """Forward queued speech requests to the TTS service."""
+    while True:
+        text = _tts_queue.get()
+        try:
+            if tts_service:
+                tts_service.speak(text)
+        except Exception as e:
+            logger.error(f"TTS worker failed to speak: {e}")
+        finally:
+            _tts_queue.task_done()
+
+
+def _ensure_tts_worker():
+    """Start the TTS worker thread on first use."""
+    global _tts_worker
+    if _tts_worker is not None and _tts_worker.is_alive():
+        return
+    with _tts_worker_lock:
+        if _tts_worker is None or not _tts_worker.is_alive():
+            _tts_worker = threading.Thread(
+                target=_tts_worker_loop, name="bridge-tts", daemon=True
+            )
+            _tts_worker.start()
+
+
+def _enqueue_speech(text: str):
+    """
+    Queue text for the TTS worker, dropping the oldest entry when full.
+
+    Args:
+        text: Text to speak
+    """
+    _ensure_tts_worker()
+    while True:
+        try:
+            _tts_queue.put_nowait(text)
+            return
+        except queue.Full:
+            try:
+                dropped = _tts_queue.get_nowait()
+                _tts_queue.task_done()
+                logger.warning(f"TTS queue full, dropped: {dropped[:50]}")
+            except queue.Empty:
+                pass
+
 
 @app.route("/api/tts/speak", methods=["POST"])
 def speak():
@@ -443,8 +727,8 @@ def speak():
     if not tts_service:
         return jsonify({"error": "TTS service not initialized"}), 500
 
-    tts_service.speak(text)
-    return jsonify({"success": True, "message": "Speaking..."})
+    _enqueue_speech(text)
+    return _raw_json(_BODY_SPEAKING, 202)
 
 
 @app.route("/api/tts/stop", methods=["POST"])
@@ -452,7 +736,7 @@ def stop_speaking():
     """Stop current TTS audio."""
     if tts_service:
         tts_service.cancel_all()
-    return jsonify({"success": True, "message": "Audio stopped"})
+    return _raw_json(_BODY_AUDIO_STOPPED)
 
 
 # ============================================================================
@@ -463,17 +747,15 @@ def stop_speaking():
 @app.route("/api/personality", methods=["GET"])
 def get_personality():
     """Get current personality profile."""
-    if not controller or not hasattr(controller, "personality_manager"):
+    if not controller or not _caps()["personality_manager"]:
         return jsonify({"error": "Personality manager not available"}), 500
 
     pm = controller.personality_manager
     return jsonify(
         {
-            "name": pm.get_profile_name()
-            if hasattr(pm, "get_profile_name")
-            else "unknown",
+            "name": pm.get_profile_name() if _caps()["profile_name"] else "unknown",
             "available_profiles": pm.get_available_profiles()
-            if hasattr(pm, "get_available_profiles")
+            if _caps()["available_profiles"]
             else [],
         }
     )
@@ -485,7 +767,7 @@ def set_personality():
     data = request.json or {}
     profile_name = data.get("profile", "drill_sergeant")
 
-    if not controller or not hasattr(controller, "personality_manager"):
+    if not controller or not _caps()["personality_manager"]:
         return jsonify({"error": "Personality manager not available"}), 500
 
     try:
@@ -499,15 +781,131 @@ def set_personality():
 # WebSocket (for real-time updates)
 # ============================================================================
 
-# Note: For production, consider using flask-socketio for true WebSocket support
-# This basic implementation uses polling, which works for the MVP
+# Last seen value per channel; a channel only produces an event when it changes
+_last_pushed: Dict[str, Any] = {}
+_push_task_started = False
+
+# Recent change events as (sequence number, event). The push loop and HTTP
+# polling each read from their own cursor, so one never consumes the other's
+# events; the oldest entries fall off once the ring is full
+_event_buffer: Deque[Tuple[int, Dict[str, Any]]] = deque(maxlen=256)
+_event_seq = itertools.count(1)
+# Sequence number of the last event the push loop has emitted (HTTP pollers
+# keep their own and pass it as ?since=)
+_push_cursor = 0
+
+
+def _push_snapshots() -> Dict[str, Dict[str, Any]]:
+    """Collect the current payload for every push channel that has a backend."""
+    snapshots = {}
+    if controller:
+        snapshots["status"] = _status_payload()
+        snapshots["timer"] = _timer_payload()
+    if native_monitor:
+        snapshots["activity"] = _activity_payload()
+    return snapshots
+
+
+def _push_dirty_key(channel: str, payload: Dict[str, Any]) -> Any:
+    """Return the part of a payload that decides whether it changed."""
+    if channel == "activity":
+        # idle_seconds ticks constantly; only push on app/window/idle transitions
+        return (payload["app"], payload["window_title"], payload["is_idle"])
+    return payload
+
+
+def _record_changes() -> None:
+    """Append an event to the buffer for every channel whose value changed."""
+    for channel, payload in _push_snapshots().items():
+        key = _push_dirty_key(channel, payload)
+        if _last_pushed.get(channel) != key:
+            _last_pushed[channel] = key
+            _event_buffer.append((next(_event_seq), {"type": channel, "data": payload}))
+
+
+def _events_since(since: int) -> Tuple[List[Dict[str, Any]], int]:
+    """
+    Return the buffered events newer than a sequence number.
+
+    Args:
+        since: Sequence number of the last event the reader has seen
+
+    Returns:
+        (events oldest first, sequence number to pass as since next time)
+    """
+    # list() copies the ring atomically, so concurrent appends are safe
+    unread = [(seq, event) for seq, event in list(_event_buffer) if seq > since]
+    latest = unread[-1][0] if unread else since
+    return [event for _, event in unread], latest
+
+
+def _push_state_loop():
+    """Background task that emits buffered changes as a single 'multi' batch."""
+    global _push_cursor
+
+    logger.info("WebSocket push loop started")
+    while True:
+        socketio.sleep(PUSH_INTERVAL_SEC)
+        try:
+            _record_changes()
+            events, _push_cursor = _events_since(_push_cursor)
+            if events:
+                socketio.emit("multi", events)
+        except Exception as e:
+            logger.error(f"Push loop error: {e}")
+
+
+if socketio:
+
+    @socketio.on("connect")
+    def on_connect():
+        """Send the full current state to a new client and start the push loop."""
+        global _push_task_started
+
+        if not _push_task_started:
+            _push_task_started = True
+            socketio.start_background_task(_push_state_loop)
+
+        try:
+            for channel, payload in _push_snapshots().items():
+                emit(channel, payload)
+        except Exception as e:
+            logger.error(f"Failed to send initial state: {e}")
+
+
+# Read-only payloads served by /api/poll/<name>, the same ones pushed over
+# Socket.IO: name -> (backend getter, payload builder, body if backend missing)
+_POLL_CHANNELS = {
+    "status": (lambda: controller, _status_payload, _BODY_CONTROLLER_MISSING),
+    "timer": (lambda: controller, _timer_payload, _BODY_CONTROLLER_MISSING),
+    "activity": (lambda: native_monitor, _activity_payload, _BODY_MONITOR_MISSING),
+}
+_BODY_UNKNOWN_CHANNEL = _encode_json({"error": "Unknown poll channel"})
+
+
+@app.route("/api/poll/<name>", methods=["GET"])
+def poll_channel(name: str):
+    """Serve one hot polling payload through a single route and a dict lookup."""
+    channel = _POLL_CHANNELS.get(name)
+    if channel is None:
+        return _raw_json(_BODY_UNKNOWN_CHANNEL, 404)
+
+    backend, build, missing_body = channel
+    if not backend():
+        return _raw_json(missing_body, 500)
+    return jsonify(build())
 
 
 @app.route("/api/events/poll", methods=["GET"])
 def poll_events():
-    """Poll for events (simple alternative to WebSocket)."""
+    """
+    Poll for events (simple alternative to WebSocket).
+
+    Clients pass the "seq" of their previous response as ?since= to receive
+    only newer change events; each client tracks its own position.
+    """
     if not controller:
-        return jsonify({"events": []})
+        return _raw_json(_BODY_NO_EVENTS)
 
     events = []
 
@@ -519,13 +917,18 @@ def poll_events():
                 "data": {
                     "goal": getattr(controller, "session_goal", ""),
                     "elapsed_minutes": controller.get_focus_time_minutes()
-                    if hasattr(controller, "get_focus_time_minutes")
+                    if _caps()["focus_time_minutes"]
                     else 0,
                 },
             }
         )
 
-    return jsonify({"events": events, "timestamp": datetime.now().isoformat()})
+    # Deliver every change since the client's last poll in one response
+    _record_changes()
+    changes, seq = _events_since(request.args.get("since", 0, type=int))
+    events.extend(changes)
+
+    return jsonify({"events": events, "seq": seq, "timestamp": _now_iso()})
 
 
 # ============================================================================
@@ -533,6 +936,43 @@ def poll_events():
 # ============================================================================
 
 
+# Delays between port re-checks after killing a stale server (~0.6s total)
+PORT_RELEASE_BACKOFF_SEC = (0.02, 0.04, 0.08, 0.16, 0.32)
+
+
+def _find_port_listeners(port: int) -> List["psutil.Process"]:
+    """Return the processes listening on a local TCP port."""
+
+    def listens(conn) -> bool:
+        return (
+            bool(conn.laddr)
+            and conn.laddr.port == port
+            and (conn.status == psutil.CONN_LISTEN)
+        )
+
+    try:
+        pids = {
+            c.pid for c in psutil.net_connections(kind="tcp") if c.pid and listens(c)
+        }
+        procs = []
+        for pid in pids:
+            try:
+                procs.append(psutil.Process(pid))
+            except psutil.NoSuchProcess:
+                pass
+        return procs
+    except psutil.AccessDenied:
+        # macOS needs root for the system-wide table; scan the processes we can see
+        procs = []
+        for proc in psutil.process_iter():
+            try:
+                if any(listens(c) for c in proc.net_connections(kind="tcp")):
+                    procs.append(proc)
+            except (psutil.AccessDenied, psutil.NoSuchProcess, psutil.ZombieProcess):
+                continue
+        return procs
+
+
 def check_and_free_port(port: int) -> bool:
     """
     Check if port is in use and attempt to free it if it's a Python process.
@@ -541,67 +981,53 @@ def check_and_free_port(port: int) -> bool:
         True if port is free or was freed, False otherwise
     """
     try:
-        import subprocess
-
         # Find processes using the port
-        result = subprocess.run(
-            ["lsof", "-ti", f":{port}"], capture_output=True, text=True, timeout=2
-        )
-
-        if result.returncode != 0 or not result.stdout.strip():
+        procs = _find_port_listeners(port)
+        if not procs:
             return True  # Port is free
 
-        pids = result.stdout.strip().split("\n")
-
         # Check if any are Python processes (likely stale bridge servers)
-        python_pids = []
-        for pid in pids:
+        python_procs = []
+        for proc in procs:
             try:
-                # Check the command name
-                cmd_result = subprocess.run(
-                    ["ps", "-p", pid, "-o", "comm="],
-                    capture_output=True,
-                    text=True,
-                    timeout=1,
-                )
-                if cmd_result.returncode == 0:
-                    cmd = cmd_result.stdout.strip().lower()
-                    if "python" in cmd or "python3" in cmd:
-                        python_pids.append(pid)
-            except Exception:
+                if "python" in proc.name().lower():
+                    python_procs.append(proc)
+            except psutil.Error:
                 pass
 
-        if python_pids:
+        if python_procs:
             logger.warning(
-                f"Found Python process(es) using port {port}: {', '.join(python_pids)}"
+                f"Found Python process(es) using port {port}: "
+                f"{', '.join(str(p.pid) for p in python_procs)}"
             )
             logger.info("Attempting to free the port...")
 
             # Try to kill Python processes
-            for pid in python_pids:
+            for proc in python_procs:
                 try:
-                    subprocess.run(["kill", "-9", pid], timeout=2, check=False)
-                    logger.info(f"Killed process {pid}")
+                    proc.kill()
+                    logger.info(f"Killed process {proc.pid}")
+                except psutil.NoSuchProcess:
+                    pass
                 except Exception as e:
-                    logger.warning(f"Failed to kill process {pid}: {e}")
-
-            # Wait a moment for port to be released
-            time.sleep(0.5)
-
-            # Verify port is now free
-            result = subprocess.run(
-                ["lsof", "-ti", f":{port}"], capture_output=True, text=True, timeout=2
-            )
-            if result.returncode != 0 or not result.stdout.strip():
-                logger.info("Port is now free!")
-                return True
-            else:
-                logger.warning("Port still in use after kill attempt")
-                return False
+                    logger.warning(f"Failed to kill process {proc.pid}: {e}")
+
+            # Wait for the processes to exit, then re-check with backoff so we
+            # only wait as long as the kernel takes to release the socket
+            psutil.wait_procs(python_procs, timeout=1)
+            for delay in PORT_RELEASE_BACKOFF_SEC:
+                if not _find_port_listeners(port):
+                    logger.info("Port is now free!")
+                    return True
+                time.sleep(delay)
+
+            logger.warning("Port still in use after kill attempt")
+            return False
         else:
             # Non-Python process using the port
             logger.error(
-                f"Port {port} is in use by non-Python process(es): {', '.join(pids)}"
+                f"Port {port} is in use by non-Python process(es): "
+                f"{', '.join(str(p.pid) for p in procs)}"
             )
             return False
 
@@ -642,14 +1068,27 @@ def main():
     logger.info(f"   Status: http://127.0.0.1:{port}/api/health")
     logger.info("=" * 60)
 
+    from gevent.pywsgi import WSGIServer
+
+    if os.environ.get("DEBUG", "false").lower() == "true":
+        app.debug = True
+
+    server_kwargs: Dict[str, Any] = {"log": None}
+    if socketio:
+        try:
+            from geventwebsocket.handler import WebSocketHandler
+
+            server_kwargs["handler_class"] = WebSocketHandler
+        except ImportError as e:
+            logger.warning(
+                f"gevent-websocket not installed: {e}. "
+                "Socket.IO will fall back to long-polling. "
+                "Install with: pip install gevent-websocket"
+            )
+
     try:
-        app.run(
-            host="127.0.0.1",  # Only local connections
-            port=port,
-            debug=os.environ.get("DEBUG", "false").lower() == "true",
-            threaded=True,
-            use_reloader=False,  # Disable reloader for production
-        )
+        # Only local connections; each request is served on its own greenlet
+        WSGIServer(("127.0.0.1", port), app, **server_kwargs).serve_forever()
     except OSError as e:
         if "Address already in use" in str(e):
             logger.error(f"Port {port} is still in use after cleanup attempt!")
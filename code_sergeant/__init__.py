@@ -10,7 +10,7 @@ A self-contained productivity app with:
 
 __version__ = "1.0.0"
 
-from .ai_client import AIClient, create_ai_client
+from .ai_client import AIClient, AsyncAIClient, create_ai_client
 from .controller import AppController
 from .dashboard import DashboardWindow, create_dashboard
 from .menu_bar import CodeSergeantApp
@@ -23,6 +23,7 @@ __all__ = [
     "AppController",
     "NativeMonitor",
     "AIClient",
+    "AsyncAIClient",
     "create_ai_client",
     "MotivationMonitor",
     "ScreenMonitor",
@@ -5,33 +5,496 @@ Provides a consistent interface for:
 - Vision analysis (screen monitoring)
 - Motivation detection
 """
-import base64
+import asyncio
+import functools
+import io
 import json
 import logging
 import os
-from typing import Any, Dict, List, Optional
+import re
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+from .ai_client_parallel import (
+    DEFAULT_MAX_CONCURRENCY,
+    ParallelRequestProcessor,
+    estimate_tokens,
+)
+from .prompt_cache import PromptCache
+from .vision_cache import VisionResultCache, image_fingerprint
+
+if TYPE_CHECKING:
+    from openai import AsyncOpenAI, OpenAI
 
 logger = logging.getLogger("code_sergeant.ai_client")
 
-# Try to import OpenAI
+# Rust-backed parser for model replies; stdlib json is a drop-in fallback
 try:
-    from openai import OpenAI
+    import orjson
 
-    OPENAI_AVAILABLE = True
-    logger.info("OpenAI SDK loaded successfully")
-except ImportError as e:
-    OPENAI_AVAILABLE = False
-    logger.warning(f"OpenAI not installed: {e}. Install with: pip install openai")
+    _loads = orjson.loads
+except ImportError:
+    _loads = json.loads
 
-# Try to import Ollama
+# SIMD base64 encoder for screenshots; stdlib is a drop-in fallback
 try:
-    import ollama
+    import pybase64 as _b64
+except ImportError:
+    import base64 as _b64
 
-    OLLAMA_AVAILABLE = True
-    logger.info("Ollama SDK loaded successfully")
+# Try to import Pillow (used to shrink screenshots before upload)
+try:
+    from PIL import Image
+
+    PIL_AVAILABLE = True
 except ImportError as e:
-    OLLAMA_AVAILABLE = False
-    logger.warning(f"Ollama not installed: {e}. Install with: pip install ollama")
+    PIL_AVAILABLE = False
+    logger.warning(f"Pillow not installed: {e}. Install with: pip install Pillow")
+
+
+# The OpenAI and Ollama SDKs pull in httpx, pydantic and large submodules, so
+# they are imported on first use instead of with this module
+@functools.lru_cache(maxsize=None)
+def _openai_sdk():
+    """Import the OpenAI SDK on first use; None if it isn't installed."""
+    try:
+        import openai
+    except ImportError as e:
+        logger.warning(f"OpenAI not installed: {e}. Install with: pip install openai")
+        return None
+    logger.info("OpenAI SDK loaded successfully")
+    return openai
+
+
+@functools.lru_cache(maxsize=None)
+def _ollama_sdk():
+    """Import the Ollama SDK on first use; None if it isn't installed."""
+    try:
+        import ollama
+    except ImportError as e:
+        logger.warning(f"Ollama not installed: {e}. Install with: pip install ollama")
+        return None
+    logger.info("Ollama SDK loaded successfully")
+    return ollama
+
+
+def __getattr__(name: str) -> Any:
+    """Evaluate OPENAI_AVAILABLE / OLLAMA_AVAILABLE lazily (PEP 562)."""
+    if name == "OPENAI_AVAILABLE":
+        return _openai_sdk() is not None
+    if name == "OLLAMA_AVAILABLE":
+        return _ollama_sdk() is not None
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+# Keep-alive pool and connect retries for the Ollama client's httpx session
+OLLAMA_MAX_CONNECTIONS = 50
+OLLAMA_MAX_KEEPALIVE = 10
+OLLAMA_CONNECT_RETRIES = 2
+# Longer than the 120s screen-check interval so idle sockets survive between
+# calls (httpx defaults to 5s; Ollama's server sets no idle timeout)
+OLLAMA_KEEPALIVE_EXPIRY_SEC = 150.0
+
+# Screenshots are shrunk to this long edge and re-encoded as JPEG before upload;
+# vision models at detail "low" downsample to 512px anyway
+VISION_MAX_EDGE_PX = 1024
+VISION_JPEG_QUALITY = 75
+
+# Keep-alive pool and timeouts for the OpenAI client's httpx session
+OPENAI_MAX_KEEPALIVE = 20
+OPENAI_TIMEOUT_SEC = 30.0
+OPENAI_CONNECT_TIMEOUT_SEC = 5.0
+
+# How long an Ollama availability probe result is reused (seconds)
+OLLAMA_STATUS_TTL_SEC = 10.0
+
+# Completion budget per activity in a batched judgment request
+JUDGE_BATCH_TOKENS_PER_ITEM = 120
+
+# OpenAI Batch API: results within 24h at half the token price
+BATCH_COMPLETION_WINDOW = "24h"
+BATCH_FAILED_STATUSES = frozenset(("failed", "expired", "cancelled"))
+
+# Exact-input result cache: reuse window, and when/what to sweep
+RESULT_CACHE_TTL_SEC = 8.0
+RESULT_CACHE_SWEEP_SIZE = 256
+RESULT_CACHE_MAX_AGE_SEC = 60.0
+
+
+def _ollama_pool_kwargs(async_client: bool = False) -> Dict[str, Any]:
+    """
+    httpx pooling options forwarded through ollama.Client to its session.
+
+    The limits go on the transport itself: httpx ignores a client-level
+    ``limits`` argument whenever a custom transport is supplied.
+
+    Args:
+        async_client: Build an async transport for ollama.AsyncClient
+    """
+    import httpx  # Dependency of the ollama SDK
+
+    transport_cls = httpx.AsyncHTTPTransport if async_client else httpx.HTTPTransport
+    return {
+        "transport": transport_cls(
+            retries=OLLAMA_CONNECT_RETRIES,
+            limits=httpx.Limits(
+                max_connections=OLLAMA_MAX_CONNECTIONS,
+                max_keepalive_connections=OLLAMA_MAX_KEEPALIVE,
+                keepalive_expiry=OLLAMA_KEEPALIVE_EXPIRY_SEC,
+            ),
+        ),
+    }
+
+
+# Returned when the model's judgment/motivation reply isn't valid JSON
+JUDGMENT_PARSE_FALLBACK = {
+    "classification": "unknown",
+    "confidence": 0.5,
+    "reason": "Failed to parse response",
+    "say": "I'm having trouble judging this activity.",
+    "action": "none",
+}
+MOTIVATION_PARSE_FALLBACK = {
+    "state": "productive",
+    "confidence": 0.5,
+    "suggestion": "Keep up the good work!",
+}
+
+
+def _openai_chat_kwargs(
+    messages: List[Dict[str, str]],
+    model: str,
+    temperature: float,
+    max_tokens: int,
+    json_mode: bool,
+) -> Dict[str, Any]:
+    """Build chat.completions.create arguments (shared by sync and async clients)."""
+    kwargs = {
+        "model": model,
+        "messages": messages,
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+    }
+
+    if json_mode:
+        kwargs["response_format"] = {"type": "json_object"}
+    return kwargs
+
+
+def _ollama_chat_kwargs(
+    messages: List[Dict[str, str]],
+    model: str,
+    temperature: float,
+    json_mode: bool,
+) -> Dict[str, Any]:
+    """Build Ollama chat arguments (shared by sync and async clients)."""
+    kwargs = {
+        "model": model,
+        "messages": messages,
+        "options": {"temperature": temperature},
+    }
+
+    if json_mode:
+        kwargs["format"] = "json"
+    return kwargs
+
+
+def _shrink_image(image_bytes: bytes) -> bytes:
+    """
+    Downsample an image to VISION_MAX_EDGE_PX and re-encode it as JPEG.
+
+    Already-small JPEGs, and any input when Pillow is missing or can't read
+    it, are returned unchanged.
+
+    Args:
+        image_bytes: PNG/JPEG image bytes
+
+    Returns:
+        Image bytes to upload
+    """
+    if not PIL_AVAILABLE:
+        return image_bytes
+
+    try:
+        img = Image.open(io.BytesIO(image_bytes))
+        if img.format == "JPEG" and max(img.size) <= VISION_MAX_EDGE_PX:
+            return image_bytes
+
+        img.thumbnail((VISION_MAX_EDGE_PX, VISION_MAX_EDGE_PX), Image.LANCZOS)
+        if img.mode != "RGB":
+            img = img.convert("RGB")  # JPEG has no alpha channel
+        buf = io.BytesIO()
+        img.save(buf, "JPEG", quality=VISION_JPEG_QUALITY, optimize=True)
+        return buf.getvalue()
+    except Exception as e:
+        logger.warning(f"Could not shrink screenshot, sending original: {e}")
+        return image_bytes
+
+
+def _openai_vision_kwargs(img_b64: str, prompt: str) -> Dict[str, Any]:
+    """Build a GPT-4V image analysis request."""
+    # JPEG base64 always starts with the encoded SOI marker
+    mime = "image/jpeg" if img_b64.startswith("/9j/") else "image/png"
+    return {
+        "model": "gpt-4o",  # Vision capable model
+        "messages": [
+            {
+                "role": "user",
+                "content": [
+                    {"type": "text", "text": prompt},
+                    {
+                        "type": "image_url",
+                        "image_url": {
+                            "url": f"data:{mime};base64,{img_b64}",
+                            "detail": "low",  # Use low detail for faster/cheaper
+                        },
+                    },
+                ],
+            }
+        ],
+        "max_tokens": 500,
+    }
+
+
+def _ollama_vision_messages(img_b64: str, prompt: str) -> List[Dict[str, Any]]:
+    """Build a LLaVA image analysis message list."""
+    return [{"role": "user", "content": prompt, "images": [img_b64]}]
+
+
+_JUDGE_RULES = """CLASSIFICATION RULES:
+- "on_task": Activity is directly related to the goal
+- "off_task": Entertainment, social media, games, unrelated browsing
+- "thinking": Idle in productive app (user may be thinking)
+- "idle": User is away
+- "unknown": Ambiguous activity
+
+ALWAYS classify these as "off_task":
+- YouTube, Netflix, Twitch, streaming sites
+- Twitter/X, Facebook, Instagram, TikTok, Reddit
+- Games, shopping sites"""
+
+
+# Static instructions are sent as a constant system message so the prompt
+# prefix is byte-identical across calls (OpenAI prompt caching, Ollama KV reuse)
+_JUDGE_SYSTEM_PROMPT = f"""You are a focus assistant. Judge if the user's current activity matches their goal.
+
+{_JUDGE_RULES}
+
+Return JSON only:
+{{
+  "classification": "on_task" | "off_task" | "thinking" | "idle" | "unknown",
+  "confidence": 0.0-1.0,
+  "reason": "brief explanation",
+  "say": "short phrase (max 15 words)",
+  "action": "none" | "warn" | "yell"
+}}
+"""
+
+_JUDGE_BATCH_SYSTEM_PROMPT = f"""You are a focus assistant. For each activity you are given,
+judge if it matches that activity's goal.
+
+{_JUDGE_RULES}
+
+Return JSON only, with one judgment per activity id:
+{{
+  "judgments": [
+    {{
+      "id": <activity id>,
+      "classification": "on_task" | "off_task" | "thinking" | "idle" | "unknown",
+      "confidence": 0.0-1.0,
+      "reason": "brief explanation",
+      "say": "short phrase (max 15 words)",
+      "action": "none" | "warn" | "yell"
+    }}
+  ]
+}}
+"""
+
+_MOTIVATION_SYSTEM_PROMPT = """Analyze the user's current work state.
+
+Classify their state as ONE of:
+- "flow" - Deep focus, don't interrupt
+- "productive" - Working well, light encouragement OK
+- "struggling" - Stuck or frustrated, needs help
+- "distracted" - Restless, frequent switching
+- "fatigued" - Been working long, needs break
+
+Return JSON only:
+{
+  "state": "flow" | "productive" | "struggling" | "distracted" | "fatigued",
+  "confidence": 0.0-1.0,
+  "suggestion": "brief suggestion for the user"
+}
+"""
+
+
+def _judge_messages(
+    goal: str, app: str, title: str, history: Optional[List[str]]
+) -> List[Dict[str, str]]:
+    """Compose the activity judgment messages."""
+    history_str = ""
+    if history:
+        history_str = f"\nRecent activities: {', '.join(history[-3:])}"
+
+    return [
+        {"role": "system", "content": _JUDGE_SYSTEM_PROMPT},
+        {
+            "role": "user",
+            "content": f"User's goal: {goal}\n\nCurrent activity:\n"
+            f"- App: {app}\n- Window title: {title}{history_str}",
+        },
+    ]
+
+
+# Activities judged locally without an LLM call. Productive apps match on the
+# app name and are checked first, since an editor or terminal title can name
+# anything (a "reddit-api" repo, a "youtube-dl" checkout); distractions match
+# on app or title.
+_OFF_TASK_PATTERN = re.compile(
+    r"(?i)\b(youtube|netflix|twitch|twitter|x\.com|facebook|instagram|tiktok|reddit)\b"
+)
+_ON_TASK_APP_PATTERN = re.compile(
+    r"(?i)\b(code|cursor|terminal|iterm2?|xcode|pycharm|intellij|webstorm|goland)\b"
+)
+
+LOCAL_OFF_TASK_JUDGMENT = {
+    "classification": "off_task",
+    "confidence": 0.99,
+    "reason": "matched blocklist",
+    "say": "Back to work.",
+    "action": "warn",
+}
+
+LOCAL_ON_TASK_JUDGMENT = {
+    "classification": "on_task",
+    "confidence": 0.95,
+    "reason": "matched allowlist",
+    "say": "",
+    "action": "none",
+}
+
+
+def _local_judgment(goal: str, app: str, title: str) -> Optional[Dict[str, Any]]:
+    """
+    Judge clear-cut activities without the LLM.
+
+    A known editor, IDE or terminal is on task whatever its title says; a
+    blocklisted site is off task unless the goal itself names it (e.g.
+    "edit the YouTube video").
+
+    Args:
+        goal: User's stated goal
+        app: Current application name
+        title: Current window title
+
+    Returns:
+        Judgment dict, or None if the LLM should decide
+    """
+    if _ON_TASK_APP_PATTERN.search(app):
+        return dict(LOCAL_ON_TASK_JUDGMENT)
+    match = _OFF_TASK_PATTERN.search(f"{app} {title}")
+    if match and match.group(1).lower() not in goal.lower():
+        return dict(LOCAL_OFF_TASK_JUDGMENT)
+    return None
+
+
+def _judge_batch_messages(items: List[Dict[str, Any]]) -> List[Dict[str, str]]:
+    """Compose one judgment request covering several activities, keyed by index."""
+    activities = json.dumps(
+        [
+            {
+                "id": i,
+                "goal": item["goal"],
+                "app": item["app"],
+                "title": item["title"],
+            }
+            for i, item in enumerate(items)
+        ],
+        ensure_ascii=False,
+    )
+
+    return [
+        {"role": "system", "content": _JUDGE_BATCH_SYSTEM_PROMPT},
+        {"role": "user", "content": f"Activities:\n{activities}"},
+    ]
+
+
+def _motivation_messages(
+    goal: str,
+    focus_minutes: int,
+    idle_seconds: float,
+    app_switches: int,
+    recent_apps: List[str],
+) -> List[Dict[str, str]]:
+    """Compose the motivation state messages."""
+    return [
+        {"role": "system", "content": _MOTIVATION_SYSTEM_PROMPT},
+        {
+            "role": "user",
+            "content": f"Goal: {goal}\n"
+            f"Time on task: {focus_minutes} minutes\n"
+            f"Idle time: {idle_seconds:.0f} seconds\n"
+            f"App switches in last 5 min: {app_switches}\n"
+            f"Recent apps: {', '.join(recent_apps[-5:])}",
+        },
+    ]
+
+
+def _motivation_key(
+    goal: str,
+    focus_minutes: int,
+    idle_seconds: float,
+    app_switches: int,
+    recent_apps: List[str],
+) -> tuple:
+    """Exact-cache key for a motivation state request."""
+    return (
+        goal,
+        focus_minutes,
+        round(idle_seconds),
+        app_switches,
+        tuple(recent_apps[-5:]),
+    )
+
+
+# Sentence end: terminal punctuation followed by whitespace (so "3.14" stays whole)
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
+
+def iter_sentences(deltas: Iterable[str]) -> Iterator[str]:
+    """
+    Regroup streamed text deltas into complete sentences.
+
+    Lets TTS start on the first sentence while the model is still generating.
+
+    Args:
+        deltas: Text fragments, e.g. from AIClient.chat_stream()
+
+    Yields:
+        Stripped sentences, then any trailing partial sentence
+    """
+    buffer = ""
+    for delta in deltas:
+        buffer += delta
+        *sentences, buffer = _SENTENCE_END.split(buffer)
+        for sentence in sentences:
+            if sentence.strip():
+                yield sentence.strip()
+    if buffer.strip():
+        yield buffer.strip()
+
+
+def _openai_http_kwargs() -> Dict[str, Any]:
+    """httpx pooling/timeout options for the OpenAI SDK's default http client."""
+    import httpx  # Dependency of the openai SDK
+
+    return {
+        "limits": httpx.Limits(max_keepalive_connections=OPENAI_MAX_KEEPALIVE),
+        "timeout": httpx.Timeout(
+            OPENAI_TIMEOUT_SEC, connect=OPENAI_CONNECT_TIMEOUT_SEC
+        ),
+    }
 
 
 class AIClient:
@@ -74,22 +537,43 @@ class AIClient:
         self.ollama_vision_model = ollama_vision_model
         self.ollama_base_url = ollama_base_url
 
-        self.openai_client: Optional[OpenAI] = None
+        self.openai_client: Optional["OpenAI"] = None
         self.ollama_client = None
 
-        # Initialize OpenAI if key provided
-        if openai_api_key and OPENAI_AVAILABLE:
+        # Cached (result, expires_at) for check_ollama_available
+        self._ollama_status: Optional[tuple] = None
+        self._ollama_status_lock = threading.Lock()
+
+        # Results reused for byte-identical inputs: key -> (stored_at, result)
+        self._judge_cache: Dict[tuple, tuple] = {}
+        self._motivation_cache: Dict[tuple, tuple] = {}
+
+        # Judgments reused for near-identical window titles under the same goal/app
+        self._judge_semantic_cache = PromptCache()
+
+        # Screen analyses reused for near-identical frames under the same prompt
+        self._vision_cache = VisionResultCache()
+
+        # Initialize OpenAI if key provided (the SDK is only imported then)
+        openai = _openai_sdk() if openai_api_key else None
+        if openai is not None:
             try:
-                self.openai_client = OpenAI(api_key=openai_api_key)
+                self.openai_client = openai.OpenAI(
+                    api_key=openai_api_key,
+                    http_client=openai.DefaultHttpxClient(**_openai_http_kwargs()),
+                )
                 logger.info(f"OpenAI client initialized with model: {openai_model}")
             except Exception as e:
                 logger.error(f"Failed to initialize OpenAI: {e}")
                 self.openai_client = None
 
         # Always try to initialize Ollama as fallback
-        if OLLAMA_AVAILABLE:
+        ollama = _ollama_sdk()
+        if ollama is not None:
             try:
-                self.ollama_client = ollama.Client(host=ollama_base_url)
+                self.ollama_client = ollama.Client(
+                    host=ollama_base_url, **_ollama_pool_kwargs()
+                )
                 logger.info(f"Ollama client initialized at: {ollama_base_url}")
             except Exception as e:
                 logger.warning(f"Failed to initialize Ollama: {e}")
@@ -105,13 +589,22 @@ class AIClient:
         Returns:
             True if successful
         """
+        self.invalidate_ollama_status()
         try:
             self.openai_api_key = api_key
             # Always set env for current process (persistence handled elsewhere)
             os.environ["OPENAI_API_KEY"] = api_key
 
-            if OPENAI_AVAILABLE:
-                self.openai_client = OpenAI(api_key=api_key)
+            openai = _openai_sdk() if self.openai_client is None else None
+            if self.openai_client is not None:
+                # Swap the key in place so the pooled keep-alive connections survive
+                self.openai_client.api_key = api_key
+                logger.info("OpenAI API key updated (client reused)")
+            elif openai is not None:
+                self.openai_client = openai.OpenAI(
+                    api_key=api_key,
+                    http_client=openai.DefaultHttpxClient(**_openai_http_kwargs()),
+                )
                 logger.info("OpenAI API key updated (client initialized)")
             else:
                 # Key is stored, but SDK isn't available yet. App will use Ollama until installed.
@@ -124,6 +617,50 @@ class AIClient:
             logger.error(f"Failed to set OpenAI key: {e}")
             return False
 
+    @staticmethod
+    def _cached_result(cache: Dict[tuple, tuple], key: tuple) -> Optional[dict]:
+        """Return a copy of a result stored under key within RESULT_CACHE_TTL_SEC."""
+        entry = cache.get(key)
+        if entry and time.monotonic() - entry[0] < RESULT_CACHE_TTL_SEC:
+            return dict(entry[1])
+        return None
+
+    @staticmethod
+    def _store_result(cache: Dict[tuple, tuple], key: tuple, result: dict):
+        """Store result under key, sweeping stale entries once the cache grows."""
+        now = time.monotonic()
+        cache[key] = (now, dict(result))
+        if len(cache) > RESULT_CACHE_SWEEP_SIZE:
+            for stale in [
+                k for k, (t, _) in cache.items() if now - t > RESULT_CACHE_MAX_AGE_SEC
+            ]:
+                cache.pop(stale, None)
+
+    def cached_judgment(self, key: tuple) -> Optional[dict]:
+        """
+        Return a judgment stored in the exact-input cache, if still fresh.
+
+        Lets callers that build their own judgment prompt (ActivityJudge) share
+        the cache and TTL judge_activity() uses instead of keeping another.
+
+        Args:
+            key: Hashable description of the judged input
+
+        Returns:
+            Copy of the judgment dict, or None on a miss
+        """
+        return self._cached_result(self._judge_cache, key)
+
+    def store_judgment(self, key: tuple, judgment: dict) -> None:
+        """
+        Store a judgment in the exact-input cache (see cached_judgment).
+
+        Args:
+            key: Hashable description of the judged input
+            judgment: Judgment dict to reuse for the same input
+        """
+        self._store_result(self._judge_cache, key, judgment)
+
     def is_openai_available(self) -> bool:
         """Check if OpenAI is available and configured."""
         return self.openai_client is not None
@@ -137,10 +674,33 @@ class AIClient:
         """
         Check if Ollama server is running and accessible.
 
+        The probe result is reused for OLLAMA_STATUS_TTL_SEC so frequent callers
+        (status polling, vision fallback) don't hit the server every time. A
+        failed Ollama request or a key change drops it early.
+
         Returns:
             Tuple of (is_available: bool, message: str)
         """
-        if not OLLAMA_AVAILABLE:
+        with self._ollama_status_lock:
+            cached = self._ollama_status
+        if cached and cached[1] > time.monotonic():
+            return cached[0]
+
+        # Probe without holding the lock: under gevent the HTTP call yields, and a
+        # second greenlet blocking on a real lock would stall the whole hub
+        result = self._probe_ollama()
+        with self._ollama_status_lock:
+            self._ollama_status = (result, time.monotonic() + OLLAMA_STATUS_TTL_SEC)
+        return result
+
+    def invalidate_ollama_status(self):
+        """Forget the cached availability so the next check probes again."""
+        with self._ollama_status_lock:
+            self._ollama_status = None
+
+    def _probe_ollama(self) -> tuple:
+        """Query the Ollama server once, bypassing the availability cache."""
+        if _ollama_sdk() is None:
             return False, "Ollama SDK not installed. Install with: pip install ollama"
 
         if not self.ollama_client:
@@ -206,6 +766,7 @@ class AIClient:
                 )
             except Exception as e:
                 logger.error(f"Ollama chat also failed: {e}")
+                self.invalidate_ollama_status()
                 raise RuntimeError(f"All AI backends failed: {e}")
 
         raise RuntimeError("No AI backend available")
@@ -219,16 +780,9 @@ class AIClient:
         json_mode: bool,
     ) -> str:
         """Send chat request to OpenAI."""
-        kwargs = {
-            "model": model,
-            "messages": messages,
-            "temperature": temperature,
-            "max_tokens": max_tokens,
-        }
-
-        if json_mode:
-            kwargs["response_format"] = {"type": "json_object"}
-
+        kwargs = _openai_chat_kwargs(
+            messages, model, temperature, max_tokens, json_mode
+        )
         response = self.openai_client.chat.completions.create(**kwargs)
         content = response.choices[0].message.content
 
@@ -243,21 +797,154 @@ class AIClient:
         json_mode: bool,
     ) -> str:
         """Send chat request to Ollama."""
-        kwargs = {
-            "model": model,
-            "messages": messages,
-            "options": {"temperature": temperature},
-        }
-
-        if json_mode:
-            kwargs["format"] = "json"
-
+        kwargs = _ollama_chat_kwargs(messages, model, temperature, json_mode)
         response = self.ollama_client.chat(**kwargs)
         content = response.get("message", {}).get("content", "")
 
         logger.debug(f"Ollama response ({model}): {content[:100]}...")
         return content
 
+    def chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 500,
+    ) -> Iterator[str]:
+        """
+        Stream a chat completion as text deltas.
+
+        Uses OpenAI if available, falls back to Ollama when the OpenAI request
+        can't be started. Pair with iter_sentences() to speak as it generates.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            model: Optional model override
+            temperature: Response temperature (0-2)
+            max_tokens: Maximum response tokens
+
+        Yields:
+            Non-empty content deltas in generation order
+
+        Raises:
+            RuntimeError: If no AI backend is available
+        """
+        if self.openai_client:
+            try:
+                stream = self.openai_client.chat.completions.create(
+                    stream=True,
+                    **_openai_chat_kwargs(
+                        messages,
+                        model or self.openai_model,
+                        temperature,
+                        max_tokens,
+                        False,
+                    ),
+                )
+            except Exception as e:
+                logger.warning(f"OpenAI stream failed: {e}, trying Ollama fallback")
+            else:
+                for chunk in stream:
+                    if chunk.choices and chunk.choices[0].delta.content:
+                        yield chunk.choices[0].delta.content
+                return
+
+        if self.ollama_client:
+            try:
+                stream = self.ollama_client.chat(
+                    stream=True,
+                    **_ollama_chat_kwargs(
+                        messages, model or self.ollama_model, temperature, False
+                    ),
+                )
+            except Exception as e:
+                logger.error(f"Ollama stream also failed: {e}")
+                self.invalidate_ollama_status()
+                raise RuntimeError(f"All AI backends failed: {e}")
+            for chunk in stream:
+                content = chunk["message"]["content"]
+                if content:
+                    yield content
+            return
+
+        raise RuntimeError("No AI backend available")
+
+    def chat_many(
+        self,
+        message_lists: List[List[Dict[str, str]]],
+        temperature: float = 0.7,
+        max_tokens: int = 500,
+        json_mode: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[str]:
+        """
+        Send several chat requests in parallel under the rate limits.
+
+        Requests run through a ParallelRequestProcessor (bounded workers,
+        requests/tokens-per-minute buckets, backoff on 429). A request that
+        still fails on OpenAI is retried on Ollama. Blocks until every request
+        completes, so call it from a worker thread rather than an event loop.
+
+        Args:
+            message_lists: One message list per request
+            temperature: Response temperature (0-2)
+            max_tokens: Maximum response tokens per request
+            json_mode: Whether to request JSON output
+            max_concurrency: Maximum requests in flight
+
+        Returns:
+            Responses in the same order as message_lists
+
+        Raises:
+            RuntimeError: If a request fails on every backend
+        """
+
+        async def send(messages):
+            return await asyncio.to_thread(
+                self._chat_primary, messages, temperature, max_tokens, json_mode
+            )
+
+        processor = ParallelRequestProcessor(max_concurrency=max_concurrency)
+        results = asyncio.run(
+            processor.run(message_lists, send, lambda m: estimate_tokens(m, max_tokens))
+        )
+
+        replies = []
+        for result, messages in zip(results, message_lists):
+            if isinstance(result, Exception):
+                if not (self.openai_client and self.ollama_client):
+                    raise RuntimeError(f"All AI backends failed: {result}")
+                logger.warning(
+                    f"OpenAI batch request failed: {result}, trying Ollama fallback"
+                )
+                try:
+                    result = self._chat_ollama(
+                        messages, self.ollama_model, temperature, json_mode
+                    )
+                except Exception as e:
+                    self.invalidate_ollama_status()
+                    raise RuntimeError(f"All AI backends failed: {e}")
+            replies.append(result)
+        return replies
+
+    def _chat_primary(
+        self,
+        messages: List[Dict[str, str]],
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool,
+    ) -> str:
+        """Send chat request to the preferred backend, without fallback."""
+        if self.openai_client:
+            return self._chat_openai(
+                messages, self.openai_model, temperature, max_tokens, json_mode
+            )
+        if self.ollama_client:
+            return self._chat_ollama(
+                messages, self.ollama_model, temperature, json_mode
+            )
+        raise RuntimeError("No AI backend available")
+
     def analyze_image(
         self,
         image_bytes: bytes,
@@ -273,6 +960,10 @@ class AIClient:
         SMART FALLBACK: If local Ollama fails and OpenAI is available,
         automatically falls back to OpenAI with a warning.
 
+        The image is downsampled to at most 1024px and sent as JPEG. A frame
+        that perceptually matches one analyzed recently with the same prompt
+        reuses that analysis.
+
         Args:
             image_bytes: PNG/JPEG image bytes
             prompt: Analysis prompt
@@ -284,8 +975,19 @@ class AIClient:
         Raises:
             RuntimeError: If all vision backends fail
         """
-        img_b64 = base64.b64encode(image_bytes).decode()
-
+        image_bytes = _shrink_image(image_bytes)
+        fingerprint = image_fingerprint(image_bytes)
+        cached = self._vision_cache.lookup(prompt, fingerprint)
+        if cached is not None:
+            return cached
+
+        img_b64 = _b64.b64encode(image_bytes).decode("ascii")
+        result = self._analyze_image_b64(img_b64, prompt, use_local)
+        self._vision_cache.store(prompt, fingerprint, result)
+        return result
+
+    def _analyze_image_b64(self, img_b64: str, prompt: str, use_local: bool) -> str:
+        """Run analyze_image() against the backends, bypassing the cache."""
         # Try local LLaVA first if requested (privacy-first approach)
         if use_local:
             ollama_available, ollama_msg = self.check_ollama_available()
@@ -295,6 +997,7 @@ class AIClient:
                     return self._analyze_image_ollama(img_b64, prompt)
                 except Exception as e:
                     logger.warning(f"Local vision (LLaVA) failed: {e}")
+                    self.invalidate_ollama_status()
                     # Smart fallback: try OpenAI if available
                     if self.openai_client:
                         logger.info(
@@ -347,7 +1050,7 @@ class AIClient:
         """Analyze image using local LLaVA model."""
         response = self.ollama_client.chat(
             model=self.ollama_vision_model,
-            messages=[{"role": "user", "content": prompt, "images": [img_b64]}],
+            messages=_ollama_vision_messages(img_b64, prompt),
         )
         content = response.get("message", {}).get("content", "")
         logger.debug(f"LLaVA analysis: {content[:100]}...")
@@ -356,23 +1059,7 @@ class AIClient:
     def _analyze_image_openai(self, img_b64: str, prompt: str) -> str:
         """Analyze image using OpenAI GPT-4V."""
         response = self.openai_client.chat.completions.create(
-            model="gpt-4o",  # Vision capable model
-            messages=[
-                {
-                    "role": "user",
-                    "content": [
-                        {"type": "text", "text": prompt},
-                        {
-                            "type": "image_url",
-                            "image_url": {
-                                "url": f"data:image/png;base64,{img_b64}",
-                                "detail": "low",  # Use low detail for faster/cheaper
-                            },
-                        },
-                    ],
-                }
-            ],
-            max_tokens=500,
+            **_openai_vision_kwargs(img_b64, prompt)
         )
         content = response.choices[0].message.content
         logger.debug(f"GPT-4V analysis: {content[:100]}...")
@@ -388,6 +1075,9 @@ class AIClient:
         """
         Judge whether activity matches goal.
 
+        Obvious distractions and productive apps are judged locally; everything
+        else goes to the LLM.
+
         Args:
             goal: User's stated goal
             app: Current application name
@@ -397,55 +1087,246 @@ class AIClient:
         Returns:
             Judgment dict with classification, confidence, action, say
         """
-        history_str = ""
-        if history:
-            history_str = f"\nRecent activities: {', '.join(history[-3:])}"
-
-        prompt = f"""You are a focus assistant. Judge if the current activity matches the user's goal.
+        known, key = self._judgment_without_llm(goal, app, title, history)
+        if known is not None:
+            return known
 
-User's goal: {goal}
+        messages = _judge_messages(goal, app, title, history)
+        response = self.chat(messages, temperature=0.3, json_mode=True)
+        return self._finish_judgment(goal, app, title, key, response)
 
-Current activity:
-- App: {app}
-- Window title: {title}
-{history_str}
+    def _judgment_without_llm(
+        self, goal: str, app: str, title: str, history: Optional[List[str]]
+    ) -> Tuple[Optional[Dict[str, Any]], tuple]:
+        """
+        Settle a judgment locally or from the caches, if possible.
 
-CLASSIFICATION RULES:
-- "on_task": Activity is directly related to the goal
-- "off_task": Entertainment, social media, games, unrelated browsing
-- "thinking": Idle in productive app (user may be thinking)
-- "idle": User is away
-- "unknown": Ambiguous activity
+        Shared by judge_activity() and its async counterpart.
 
-ALWAYS classify these as "off_task":
-- YouTube, Netflix, Twitch, streaming sites
-- Twitter/X, Facebook, Instagram, TikTok, Reddit
-- Games, shopping sites
+        Returns:
+            (judgment or None if the LLM is needed, exact-cache key)
+        """
+        key = (goal, app, title, tuple(history[-3:] if history else ()))
+        local = _local_judgment(goal, app, title)
+        if local is not None:
+            return local, key
+
+        cached = self._cached_result(self._judge_cache, key)
+        if cached is None:
+            cached = self._judge_semantic_cache.lookup((goal, app), title)
+        return cached, key
+
+    def _finish_judgment(
+        self, goal: str, app: str, title: str, key: tuple, response: str
+    ) -> Dict[str, Any]:
+        """
+        Parse an LLM judgment response and cache it.
 
-Return JSON only:
-{{
-  "classification": "on_task" | "off_task" | "thinking" | "idle" | "unknown",
-  "confidence": 0.0-1.0,
-  "reason": "brief explanation",
-  "say": "short phrase (max 15 words)",
-  "action": "none" | "warn" | "yell"
-}}
-"""
+        Shared by judge_activity() and its async counterpart.
 
+        Returns:
+            Judgment dict, or JUDGMENT_PARSE_FALLBACK if the JSON is invalid
+        """
         try:
-            response = self.chat(
-                [{"role": "user", "content": prompt}], temperature=0.3, json_mode=True
-            )
-            return json.loads(response)
+            judgment = _loads(response)
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse judgment JSON: {e}")
-            return {
-                "classification": "unknown",
-                "confidence": 0.5,
-                "reason": "Failed to parse response",
-                "say": "I'm having trouble judging this activity.",
-                "action": "none",
+            return dict(JUDGMENT_PARSE_FALLBACK)
+
+        self._store_result(self._judge_cache, key, judgment)
+        self._judge_semantic_cache.store((goal, app), title, judgment)
+        return judgment
+
+    def judge_activities_batch(
+        self, items: List[Dict[str, Any]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Judge several activities with as few requests as possible.
+
+        Items settled by the local blocklist/allowlist never reach the model.
+        With OpenAI, every uncached item goes into a single request and the
+        judgments are matched back by id. Ollama takes one prompt per request,
+        so it (and a failed OpenAI batch) falls back to concurrent per-item
+        requests through chat_many().
+
+        Args:
+            items: Dicts with 'goal', 'app', 'title' and optional 'history'
+
+        Returns:
+            Judgment dicts in item order
+        """
+        keys = [
+            (
+                item["goal"],
+                item["app"],
+                item["title"],
+                tuple((item.get("history") or [])[-3:]),
+            )
+            for item in items
+        ]
+        results = [
+            _local_judgment(item["goal"], item["app"], item["title"])
+            or self._cached_result(self._judge_cache, key)
+            for item, key in zip(items, keys)
+        ]
+        pending = [i for i, result in enumerate(results) if result is None]
+        if not pending:
+            return results
+
+        batch = [items[i] for i in pending]
+        judged = self._judge_batch_openai(batch) if self.openai_client else None
+        if judged is None:
+            judged = self._judge_each(batch)
+
+        for i, judgment in zip(pending, judged):
+            if judgment is None:
+                results[i] = dict(JUDGMENT_PARSE_FALLBACK)
+                continue
+            results[i] = judgment
+            self._store_result(self._judge_cache, keys[i], judgment)
+        return results
+
+    def _judge_batch_openai(
+        self, batch: List[Dict[str, Any]]
+    ) -> Optional[List[Optional[Dict[str, Any]]]]:
+        """Judge batch in one OpenAI request; None if the request or parse fails."""
+        try:
+            response = self._chat_openai(
+                _judge_batch_messages(batch),
+                self.openai_model,
+                0.3,
+                JUDGE_BATCH_TOKENS_PER_ITEM * len(batch),
+                True,
+            )
+            by_id = {
+                judgment.pop("id"): judgment
+                for judgment in _loads(response)["judgments"]
+                if isinstance(judgment, dict) and "id" in judgment
             }
+        except Exception as e:
+            logger.warning(f"Batched judgment failed: {e}, judging items separately")
+            return None
+
+        return [by_id.get(i) for i in range(len(batch))]
+
+    def _judge_each(
+        self, batch: List[Dict[str, Any]]
+    ) -> List[Optional[Dict[str, Any]]]:
+        """Judge batch with one concurrent request per item."""
+        replies = self.chat_many(
+            [
+                _judge_messages(
+                    item["goal"], item["app"], item["title"], item.get("history")
+                )
+                for item in batch
+            ],
+            temperature=0.3,
+            json_mode=True,
+        )
+
+        judgments = []
+        for reply in replies:
+            try:
+                judgments.append(_loads(reply))
+            except json.JSONDecodeError as e:
+                logger.error(f"Failed to parse judgment JSON: {e}")
+                judgments.append(None)
+        return judgments
+
+    def submit_batch_judgments(self, items: List[Dict[str, Any]]) -> str:
+        """
+        Queue judgments on the OpenAI Batch API for offline processing.
+
+        For non-interactive work (session reports, re-classifying history)
+        where waiting is fine: batches cost half as much and use a separate
+        rate-limit pool. Collect results with poll_batch().
+
+        Args:
+            items: Dicts with 'goal', 'app', 'title' and optional 'history'
+
+        Returns:
+            OpenAI batch id
+
+        Raises:
+            RuntimeError: If OpenAI is not configured
+        """
+        if not self.openai_client:
+            raise RuntimeError("Batch judgments require an OpenAI API key")
+
+        lines = []
+        for i, item in enumerate(items):
+            messages = _judge_messages(
+                item["goal"], item["app"], item["title"], item.get("history")
+            )
+            lines.append(
+                json.dumps(
+                    {
+                        "custom_id": f"judge-{i}",
+                        "method": "POST",
+                        "url": "/v1/chat/completions",
+                        "body": _openai_chat_kwargs(
+                            messages,
+                            self.openai_model,
+                            0.3,
+                            500,
+                            True,
+                        ),
+                    }
+                )
+            )
+
+        batch_file = self.openai_client.files.create(
+            file=("judgments.jsonl", io.BytesIO("\n".join(lines).encode())),
+            purpose="batch",
+        )
+        batch = self.openai_client.batches.create(
+            input_file_id=batch_file.id,
+            endpoint="/v1/chat/completions",
+            completion_window=BATCH_COMPLETION_WINDOW,
+        )
+        logger.info(f"Submitted batch {batch.id} with {len(items)} judgments")
+        return batch.id
+
+    def poll_batch(self, batch_id: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch the results of a batch from submit_batch_judgments().
+
+        Args:
+            batch_id: OpenAI batch id
+
+        Returns:
+            Judgment dicts in submission order, or None while still running
+
+        Raises:
+            RuntimeError: If OpenAI is not configured or the batch did not complete
+        """
+        if not self.openai_client:
+            raise RuntimeError("Batch judgments require an OpenAI API key")
+
+        batch = self.openai_client.batches.retrieve(batch_id)
+        if batch.status in BATCH_FAILED_STATUSES:
+            raise RuntimeError(f"Batch {batch_id} {batch.status}")
+        if batch.status != "completed":
+            return None
+
+        judgments: Dict[int, Dict[str, Any]] = {}
+        if batch.output_file_id:
+            output = self.openai_client.files.content(batch.output_file_id).text
+            for line in output.splitlines():
+                if not line.strip():
+                    continue
+                record = _loads(line)
+                index = int(record["custom_id"].rsplit("-", 1)[1])
+                try:
+                    body = record["response"]["body"]
+                    content = body["choices"][0]["message"]["content"]
+                    judgments[index] = _loads(content)
+                except (KeyError, IndexError, TypeError, json.JSONDecodeError) as e:
+                    logger.error(f"Failed to parse batch judgment {index}: {e}")
+
+        total = batch.request_counts.total if batch.request_counts else 0
+        total = max(total, max(judgments, default=-1) + 1)
+        return [judgments.get(i, dict(JUDGMENT_PARSE_FALLBACK)) for i in range(total)]
 
     def detect_motivation_state(
         self,
@@ -468,41 +1349,36 @@ Return JSON only:
         Returns:
             Dict with state and suggestion
         """
-        prompt = f"""Analyze this user's current work state:
+        key = _motivation_key(
+            goal, focus_minutes, idle_seconds, app_switches, recent_apps
+        )
+        cached = self._cached_result(self._motivation_cache, key)
+        if cached is not None:
+            return cached
 
-Goal: {goal}
-Time on task: {focus_minutes} minutes
-Idle time: {idle_seconds:.0f} seconds
-App switches in last 5 min: {app_switches}
-Recent apps: {', '.join(recent_apps[-5:])}
+        messages = _motivation_messages(
+            goal, focus_minutes, idle_seconds, app_switches, recent_apps
+        )
+        response = self.chat(messages, temperature=0.3, json_mode=True)
+        return self._finish_motivation(key, response)
 
-Classify their state as ONE of:
-- "flow" - Deep focus, don't interrupt
-- "productive" - Working well, light encouragement OK
-- "struggling" - Stuck or frustrated, needs help
-- "distracted" - Restless, frequent switching
-- "fatigued" - Been working long, needs break
+    def _finish_motivation(self, key: tuple, response: str) -> Dict[str, Any]:
+        """
+        Parse an LLM motivation response and cache it.
 
-Return JSON only:
-{{
-  "state": "flow" | "productive" | "struggling" | "distracted" | "fatigued",
-  "confidence": 0.0-1.0,
-  "suggestion": "brief suggestion for the user"
-}}
-"""
+        Shared by detect_motivation_state() and its async counterpart.
 
+        Returns:
+            Motivation dict, or MOTIVATION_PARSE_FALLBACK if the JSON is invalid
+        """
         try:
-            response = self.chat(
-                [{"role": "user", "content": prompt}], temperature=0.3, json_mode=True
-            )
-            return json.loads(response)
+            motivation = _loads(response)
         except json.JSONDecodeError as e:
             logger.error(f"Failed to parse motivation state: {e}")
-            return {
-                "state": "productive",
-                "confidence": 0.5,
-                "suggestion": "Keep up the good work!",
-            }
+            return dict(MOTIVATION_PARSE_FALLBACK)
+
+        self._store_result(self._motivation_cache, key, motivation)
+        return motivation
 
     def get_status(self) -> Dict[str, Any]:
         """Get current AI client status."""
@@ -516,6 +1392,298 @@ Return JSON only:
         }
 
 
+class AsyncAIClient(AIClient):
+    """
+    AIClient variant with awaitable request methods.
+
+    The sync methods are inherited unchanged; the ``a``-prefixed coroutines use
+    AsyncOpenAI / ollama.AsyncClient so several requests can share one event
+    loop instead of queueing behind each other.
+
+    Usage:
+        client = AsyncAIClient(openai_api_key="sk-...")
+        replies = await client.achat_many([messages_a, messages_b])
+    """
+
+    def __init__(self, *args, **kwargs):
+        """Initialize sync clients, then their async counterparts."""
+        super().__init__(*args, **kwargs)
+
+        self.async_openai_client: Optional["AsyncOpenAI"] = None
+        self.async_ollama_client = None
+
+        if self.openai_client is not None:
+            self._init_async_openai(self.openai_api_key)
+
+        if self.ollama_client is not None:
+            try:
+                self.async_ollama_client = _ollama_sdk().AsyncClient(
+                    host=self.ollama_base_url, **_ollama_pool_kwargs(async_client=True)
+                )
+            except Exception as e:
+                logger.warning(f"Failed to initialize async Ollama: {e}")
+                self.async_ollama_client = None
+
+    def _init_async_openai(self, api_key: str):
+        """Create the AsyncOpenAI client for api_key."""
+        openai = _openai_sdk()
+        try:
+            self.async_openai_client = openai.AsyncOpenAI(
+                api_key=api_key,
+                http_client=openai.DefaultAsyncHttpxClient(**_openai_http_kwargs()),
+            )
+        except Exception as e:
+            logger.error(f"Failed to initialize async OpenAI: {e}")
+            self.async_openai_client = None
+
+    def set_openai_key(self, api_key: str) -> bool:
+        """
+        Set or update OpenAI API key for both sync and async clients.
+
+        Args:
+            api_key: OpenAI API key
+
+        Returns:
+            True if successful
+        """
+        success = super().set_openai_key(api_key)
+        if success and self.openai_client is not None:
+            if self.async_openai_client is not None:
+                self.async_openai_client.api_key = api_key
+            else:
+                self._init_async_openai(api_key)
+        return success
+
+    async def achat(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: int = 500,
+        json_mode: bool = False,
+    ) -> str:
+        """
+        Async version of chat(); same OpenAI-then-Ollama fallback.
+
+        Raises:
+            RuntimeError: If no AI backend is available
+        """
+        if self.async_openai_client:
+            try:
+                return await self._achat_openai(
+                    messages,
+                    model or self.openai_model,
+                    temperature,
+                    max_tokens,
+                    json_mode,
+                )
+            except Exception as e:
+                logger.warning(f"OpenAI chat failed: {e}, trying Ollama fallback")
+
+        if self.async_ollama_client:
+            try:
+                return await self._achat_ollama(
+                    messages, model or self.ollama_model, temperature, json_mode
+                )
+            except Exception as e:
+                logger.error(f"Ollama chat also failed: {e}")
+                self.invalidate_ollama_status()
+                raise RuntimeError(f"All AI backends failed: {e}")
+
+        raise RuntimeError("No AI backend available")
+
+    async def _achat_openai(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        temperature: float,
+        max_tokens: int,
+        json_mode: bool,
+    ) -> str:
+        """Send chat request to OpenAI without blocking the loop."""
+        kwargs = _openai_chat_kwargs(
+            messages, model, temperature, max_tokens, json_mode
+        )
+        response = await self.async_openai_client.chat.completions.create(**kwargs)
+        return response.choices[0].message.content
+
+    async def _achat_ollama(
+        self,
+        messages: List[Dict[str, str]],
+        model: str,
+        temperature: float,
+        json_mode: bool,
+    ) -> str:
+        """Send chat request to Ollama without blocking the loop."""
+        kwargs = _ollama_chat_kwargs(messages, model, temperature, json_mode)
+        response = await self.async_ollama_client.chat(**kwargs)
+        return response.get("message", {}).get("content", "")
+
+    async def achat_many(
+        self,
+        message_lists: List[List[Dict[str, str]]],
+        temperature: float = 0.7,
+        max_tokens: int = 500,
+        json_mode: bool = False,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[str]:
+        """
+        Run several chat requests concurrently under the rate limits.
+
+        Async counterpart of chat_many().
+
+        Args:
+            message_lists: One message list per request
+            temperature: Response temperature (0-2)
+            max_tokens: Maximum response tokens per request
+            json_mode: Whether to request JSON output
+            max_concurrency: Maximum requests in flight
+
+        Returns:
+            Responses in the same order as message_lists
+
+        Raises:
+            RuntimeError: If a request fails on every backend
+        """
+
+        async def send(messages):
+            if self.async_openai_client:
+                return await self._achat_openai(
+                    messages, self.openai_model, temperature, max_tokens, json_mode
+                )
+            if self.async_ollama_client:
+                return await self._achat_ollama(
+                    messages, self.ollama_model, temperature, json_mode
+                )
+            raise RuntimeError("No AI backend available")
+
+        processor = ParallelRequestProcessor(max_concurrency=max_concurrency)
+        results = await processor.run(
+            message_lists, send, lambda m: estimate_tokens(m, max_tokens)
+        )
+
+        replies = []
+        for result, messages in zip(results, message_lists):
+            if isinstance(result, Exception):
+                if not (self.async_openai_client and self.async_ollama_client):
+                    raise RuntimeError(f"All AI backends failed: {result}")
+                logger.warning(
+                    f"OpenAI batch request failed: {result}, trying Ollama fallback"
+                )
+                try:
+                    result = await self._achat_ollama(
+                        messages, self.ollama_model, temperature, json_mode
+                    )
+                except Exception as e:
+                    self.invalidate_ollama_status()
+                    raise RuntimeError(f"All AI backends failed: {e}")
+            replies.append(result)
+        return replies
+
+    async def ajudge_activity(
+        self,
+        goal: str,
+        app: str,
+        title: str,
+        history: List[str] = None,
+    ) -> Dict[str, Any]:
+        """Async version of judge_activity()."""
+        known, key = self._judgment_without_llm(goal, app, title, history)
+        if known is not None:
+            return known
+
+        messages = _judge_messages(goal, app, title, history)
+        response = await self.achat(messages, temperature=0.3, json_mode=True)
+        return self._finish_judgment(goal, app, title, key, response)
+
+    async def adetect_motivation_state(
+        self,
+        goal: str,
+        focus_minutes: int,
+        idle_seconds: float,
+        app_switches: int,
+        recent_apps: List[str],
+    ) -> Dict[str, Any]:
+        """Async version of detect_motivation_state()."""
+        key = _motivation_key(
+            goal, focus_minutes, idle_seconds, app_switches, recent_apps
+        )
+        cached = self._cached_result(self._motivation_cache, key)
+        if cached is not None:
+            return cached
+
+        messages = _motivation_messages(
+            goal, focus_minutes, idle_seconds, app_switches, recent_apps
+        )
+        response = await self.achat(messages, temperature=0.3, json_mode=True)
+        return self._finish_motivation(key, response)
+
+    async def aanalyze_image(
+        self,
+        image_bytes: bytes,
+        prompt: str,
+        use_local: bool = True,
+    ) -> str:
+        """
+        Async version of analyze_image(); local LLaVA first, OpenAI fallback.
+
+        Raises:
+            RuntimeError: If all vision backends fail
+        """
+        image_bytes = _shrink_image(image_bytes)
+        fingerprint = image_fingerprint(image_bytes)
+        cached = self._vision_cache.lookup(prompt, fingerprint)
+        if cached is not None:
+            return cached
+
+        img_b64 = _b64.b64encode(image_bytes).decode("ascii")
+        result = await self._aanalyze_image_b64(img_b64, prompt, use_local)
+        self._vision_cache.store(prompt, fingerprint, result)
+        return result
+
+    async def _aanalyze_image_b64(
+        self, img_b64: str, prompt: str, use_local: bool
+    ) -> str:
+        """Run aanalyze_image() against the backends, bypassing the cache."""
+        local_error = None
+
+        if use_local:
+            # The availability probe is sync (and cached); keep it off the loop
+            ollama_available, ollama_msg = await asyncio.to_thread(
+                self.check_ollama_available
+            )
+            if ollama_available and self.async_ollama_client:
+                try:
+                    response = await self.async_ollama_client.chat(
+                        model=self.ollama_vision_model,
+                        messages=_ollama_vision_messages(img_b64, prompt),
+                    )
+                    return response.get("message", {}).get("content", "")
+                except Exception as e:
+                    logger.warning(f"Local vision (LLaVA) failed: {e}")
+                    self.invalidate_ollama_status()
+                    local_error = e
+            else:
+                logger.warning(f"Ollama not available: {ollama_msg}")
+                local_error = ollama_msg
+
+        if self.async_openai_client:
+            try:
+                response = await self.async_openai_client.chat.completions.create(
+                    **_openai_vision_kwargs(img_b64, prompt)
+                )
+                return response.choices[0].message.content
+            except Exception as e:
+                logger.error(f"OpenAI vision failed: {e}")
+                raise RuntimeError(f"Vision analysis failed: {e}")
+
+        if local_error is not None:
+            raise RuntimeError(f"No vision backend available. {local_error}")
+        raise RuntimeError(
+            "No vision backend available. Set up OpenAI API key or install Ollama."
+        )
+
+
 def create_ai_client(config: Dict[str, Any]) -> AIClient:
     """
     Factory function to create AI client from config.
@@ -0,0 +1,181 @@
+"""Rate-limited parallel request processing for batched AI calls.
+
+Follows the shape of OpenAI's api_request_parallel_processor example:
+- A queue feeding a fixed pool of worker coroutines
+- Requests-per-minute and tokens-per-minute token buckets
+- Exponential backoff and requeue on HTTP 429
+"""
+import asyncio
+import logging
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+
+logger = logging.getLogger("code_sergeant.ai_client_parallel")
+
+# Defaults sized for gpt-4o-mini on a low usage tier
+DEFAULT_MAX_CONCURRENCY = 10
+DEFAULT_MAX_REQUESTS_PER_MINUTE = 500
+DEFAULT_MAX_TOKENS_PER_MINUTE = 200_000
+DEFAULT_MAX_ATTEMPTS = 5
+
+# Upper bound on the backoff after a 429 (seconds)
+RETRY_BACKOFF_CAP_SEC = 60
+
+
+def estimate_tokens(messages: List[Dict[str, Any]], max_tokens: int = 500) -> int:
+    """
+    Rough token cost of a chat request (prompt + completion budget).
+
+    Uses the ~4 characters per token rule of thumb rather than a tokenizer.
+
+    Args:
+        messages: Chat messages
+        max_tokens: Completion token budget
+
+    Returns:
+        Estimated tokens consumed by the request
+    """
+    chars = sum(len(str(m.get("content", ""))) for m in messages)
+    return chars // 4 + max_tokens
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Whether error is an HTTP 429 from the OpenAI or Ollama SDK."""
+    status = getattr(error, "status_code", None)
+    if status is None:
+        status = getattr(getattr(error, "response", None), "status_code", None)
+    return status == 429
+
+
+class TokenBucket:
+    """Continuously refilling budget of units per minute."""
+
+    def __init__(self, per_minute: float):
+        """
+        Initialize a full bucket.
+
+        Args:
+            per_minute: Units replenished per minute (also the bucket capacity)
+        """
+        self.capacity = float(per_minute)
+        self.available = float(per_minute)
+        self.rate_per_sec = self.capacity / 60.0
+        self.updated = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    def _refill(self):
+        """Add the units accrued since the last update."""
+        now = time.monotonic()
+        self.available = min(
+            self.capacity, self.available + (now - self.updated) * self.rate_per_sec
+        )
+        self.updated = now
+
+    async def acquire(self, amount: float = 1.0):
+        """
+        Wait until amount units are available, then consume them.
+
+        Args:
+            amount: Units to consume (clamped to the bucket capacity)
+        """
+        amount = min(float(amount), self.capacity)
+        async with self._lock:
+            while True:
+                self._refill()
+                if self.available >= amount:
+                    self.available -= amount
+                    return
+                await asyncio.sleep((amount - self.available) / self.rate_per_sec)
+
+
+class ParallelRequestProcessor:
+    """
+    Run many requests through a bounded worker pool under RPM/TPM limits.
+
+    Usage:
+        processor = ParallelRequestProcessor(max_concurrency=10)
+        results = await processor.run(message_lists, send, estimate_tokens)
+    """
+
+    def __init__(
+        self,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_requests_per_minute: float = DEFAULT_MAX_REQUESTS_PER_MINUTE,
+        max_tokens_per_minute: float = DEFAULT_MAX_TOKENS_PER_MINUTE,
+        max_attempts: int = DEFAULT_MAX_ATTEMPTS,
+    ):
+        """
+        Initialize processor.
+
+        Args:
+            max_concurrency: Number of worker coroutines
+            max_requests_per_minute: Request budget per minute
+            max_tokens_per_minute: Token budget per minute
+            max_attempts: Attempts per request before a 429 is reported as failure
+        """
+        self.max_concurrency = max(1, max_concurrency)
+        self.max_requests_per_minute = max_requests_per_minute
+        self.max_tokens_per_minute = max_tokens_per_minute
+        self.max_attempts = max(1, max_attempts)
+
+    async def run(
+        self,
+        items: Sequence[Any],
+        request_fn: Callable[[Any], Awaitable[Any]],
+        token_cost: Optional[Callable[[Any], int]] = None,
+    ) -> List[Any]:
+        """
+        Send every item through request_fn.
+
+        Args:
+            items: Request payloads
+            request_fn: Coroutine function performing one request
+            token_cost: Estimated tokens for an item (defaults to 1)
+
+        Returns:
+            Results in item order; a failed request's slot holds its exception
+        """
+        if not items:
+            return []
+
+        # Buckets are created here so their locks belong to the running loop
+        request_bucket = TokenBucket(self.max_requests_per_minute)
+        token_bucket = TokenBucket(self.max_tokens_per_minute)
+        results: List[Any] = [None] * len(items)
+        queue: asyncio.Queue = asyncio.Queue()
+        for index, item in enumerate(items):
+            queue.put_nowait((index, item, 0))
+
+        async def worker():
+            while True:
+                index, item, attempt = await queue.get()
+                try:
+                    await request_bucket.acquire(1)
+                    await token_bucket.acquire(token_cost(item) if token_cost else 1)
+                    results[index] = await request_fn(item)
+                except Exception as e:
+                    if is_rate_limit_error(e) and attempt + 1 < self.max_attempts:
+                        delay = min(2**attempt, RETRY_BACKOFF_CAP_SEC)
+                        logger.warning(
+                            f"Rate limited (attempt {attempt + 1}/{self.max_attempts}), "
+                            f"retrying in {delay}s"
+                        )
+                        await asyncio.sleep(delay)
+                        queue.put_nowait((index, item, attempt + 1))
+                    else:
+                        logger.error(f"Parallel request {index} failed: {e}")
+                        results[index] = e
+                finally:
+                    queue.task_done()
+
+        workers = [
+            asyncio.create_task(worker())
+            for _ in range(min(self.max_concurrency, len(items)))
+        ]
+        try:
+            await queue.join()
+        finally:
+            for task in workers:
+                task.cancel()
+            await asyncio.gather(*workers, return_exceptions=True)
+        return results
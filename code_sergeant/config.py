@@ -1,9 +1,14 @@
 """Configuration management for Code Sergeant."""
+import copy
+import functools
 import json
 import logging
 import os
+import re
+from collections import deque
 from pathlib import Path
-from typing import Any, Dict
+from types import MappingProxyType
+from typing import Any, Dict, Mapping, Tuple
 
 # Load environment variables from .env file
 try:
@@ -16,6 +21,22 @@ except ImportError:
 
 logger = logging.getLogger("code_sergeant.config")
 
+# Rust-backed JSON for config.json; stdlib json produces the same layout
+try:
+    import orjson
+
+    _loads = orjson.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj: Any) -> bytes:
+        return json.dumps(obj, indent=2).encode("utf-8")
+
+
 SENSITIVE_CONFIG_KEYS = [
     ("openai", "api_key"),
     ("tts", "elevenlabs_api_key"),
@@ -23,61 +44,62 @@ SENSITIVE_CONFIG_KEYS = [
 ]
 
 
-def _scrub_secrets(config: Dict[str, Any]) -> Dict[str, Any]:
+def _scrub_secrets(config: Mapping[str, Any]) -> Dict[str, Any]:
     """
     Return a copy of config with known secrets removed.
 
     This prevents API keys from being written to disk and from leaking into logs/session dumps.
     """
-    clean = deep_merge({}, config) if isinstance(config, dict) else {}
+    clean = copy.deepcopy(dict(config)) if isinstance(config, Mapping) else {}
     for section, key in SENSITIVE_CONFIG_KEYS:
         if isinstance(clean.get(section), dict) and key in clean[section]:
             clean[section][key] = None
     return clean
 
 
+@functools.lru_cache(maxsize=16)
+def _env_key_pattern(env_key: str) -> "re.Pattern[str]":
+    """Compiled matcher for existing `KEY=...` lines (compiled once per key)."""
+    return re.compile(rf"^{re.escape(env_key)}=.*$", re.MULTILINE)
+
+
 def set_env_var(env_key: str, value: str, env_path: str = ".env") -> None:
     """
     Persist an environment variable to .env securely.
 
-    - Creates the file if missing
-    - Ensures permissions are 0600
-    - Replaces existing key, otherwise appends
+    - Creates the file if missing, with 0600 permissions from the start
+    - Replaces an existing key via an atomic temp-file rename
+    - Otherwise appends a single line without rewriting the file
     - Never logs the secret value
     """
     if not env_key:
         raise ValueError("env_key is required")
 
     value = (value or "").strip()
-    env_file = Path(env_path)
-
-    # Read existing lines (if any)
-    lines: list[str] = []
-    if env_file.exists():
-        try:
-            lines = env_file.read_text().splitlines()
-        except Exception:
-            lines = []
-
-    # Update or append
     new_line = f"{env_key}={value}"
-    found = False
-    updated_lines: list[str] = []
-    for line in lines:
-        if line.startswith(f"{env_key}="):
-            updated_lines.append(new_line)
-            found = True
-        else:
-            updated_lines.append(line)
-
-    if not found:
-        updated_lines.append(new_line)
-
-    env_file.write_text("\n".join(updated_lines) + "\n")
-
-    # Lock down permissions (best-effort)
+    pattern = _env_key_pattern(env_key)
+
+    # O_CREAT with mode 0600 avoids a window where a new file is world-readable
+    fd = os.open(env_path, os.O_RDWR | os.O_CREAT, 0o600)
+    with os.fdopen(fd, "r+", encoding="utf-8") as f:
+        content = f.read()
+        found = pattern.search(content) is not None
+        if not found:
+            # Position is at EOF after the read, so this appends
+            if content and not content.endswith("\n"):
+                f.write("\n")
+            f.write(new_line + "\n")
+
+    if found:
+        tmp_path = f"{env_path}.tmp"
+        fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(pattern.sub(lambda _: new_line, content))
+        os.replace(tmp_path, env_path)
+
+    # Lock down permissions of a pre-existing file (best-effort)
     try:
-        os.chmod(env_file, 0o600)
+        os.chmod(env_path, 0o600)
     except Exception:
         pass
 
@@ -85,70 +107,95 @@ def set_env_var(env_key: str, value: str, env_path: str = ".env") -> None:
     os.environ[env_key] = value
 
 
-DEFAULT_CONFIG = {
-    "poll_interval_sec": 0.5,  # 500ms for real-time activity detection
-    "judge_interval_sec": 10,
-    "cooldown_seconds": 30,
-    "reminder_intervals_sec": [300, 600, 900],  # 5, 10, 15 minutes
-    "voice": {"record_seconds": 3, "sample_rate": 16000, "note_record_seconds": 120},
-    "openai": {
-        "api_key": None,  # Stored in .env as OPENAI_API_KEY (never in config.json)
-        "model": "gpt-4o-mini",
-    },
-    "ollama": {"model": "llama3.2", "base_url": "http://localhost:11434"},
-    "tts": {
-        "provider": "pyttsx3",
-        "rate": 150,
-        "volume": 0.8,
-        "elevenlabs_api_key": None,  # Stored in .env as ELEVENLABS_API_KEY (never in config.json)
-        "voice_id": None,
-        "model_id": "eleven_turbo_v2_5",
-    },
-    "personality": {
-        "name": "sergeant",
-        "wake_word_name": "sergeant",
-        "description": "",
-        "tone": ["strict", "firm", "commanding"],
-    },
-    "voice_activation": {"enabled": False, "sensitivity": 0.5},
-    "pomodoro": {
-        "work_duration_minutes": 25,
-        "short_break_minutes": 5,
-        "long_break_minutes": 15,
-        "auto_start_with_session": False,
-        "pomodoros_until_long_break": 4,
-    },
-    "screen_monitoring": {
-        "enabled": False,
-        "app_blocklist": [
-            "1Password",
-            "Keychain Access",
-            "LastPass",
-            "Bitwarden",
-            "PayPal",
-            "Venmo",
-            "Cash App",
-            "Chase",
-            "Bank of America",
-            "Wells Fargo",
-            "Citibank",
-            "Capital One",
-            "US Bank",
-            "PNC",
-            "TD Bank",
-        ],
-        "blur_regions": [],
-        "use_local_vision": True,
-        "check_interval_seconds": 120,
-    },
-    "motivation": {"enabled": True, "check_interval_minutes": 3},
-}
+# Defaults template. Only the top level is a proxy; the nested sections are
+# plain dicts and lists that must not be mutated in place. Use
+# _default_config() for a copy callers may modify
+DEFAULT_CONFIG: Mapping[str, Any] = MappingProxyType(
+    {
+        "poll_interval_sec": 0.5,  # 500ms for real-time activity detection
+        "judge_interval_sec": 10,
+        "cooldown_seconds": 30,
+        "reminder_intervals_sec": [300, 600, 900],  # 5, 10, 15 minutes
+        "voice": {
+            "record_seconds": 3,
+            "sample_rate": 16000,
+            "note_record_seconds": 120,
+        },
+        "openai": {
+            "api_key": None,  # Stored in .env as OPENAI_API_KEY (never in config.json)
+            "model": "gpt-4o-mini",
+        },
+        "ollama": {"model": "llama3.2", "base_url": "http://localhost:11434"},
+        "tts": {
+            "provider": "pyttsx3",
+            "rate": 150,
+            "volume": 0.8,
+            "elevenlabs_api_key": None,  # Stored in .env as ELEVENLABS_API_KEY (never in config.json)
+            "voice_id": None,
+            "model_id": "eleven_turbo_v2_5",
+        },
+        "personality": {
+            "name": "sergeant",
+            "wake_word_name": "sergeant",
+            "description": "",
+            "tone": ["strict", "firm", "commanding"],
+        },
+        "voice_activation": {"enabled": False, "sensitivity": 0.5},
+        "pomodoro": {
+            "work_duration_minutes": 25,
+            "short_break_minutes": 5,
+            "long_break_minutes": 15,
+            "auto_start_with_session": False,
+            "pomodoros_until_long_break": 4,
+        },
+        "screen_monitoring": {
+            "enabled": False,
+            "app_blocklist": [
+                "1Password",
+                "Keychain Access",
+                "LastPass",
+                "Bitwarden",
+                "PayPal",
+                "Venmo",
+                "Cash App",
+                "Chase",
+                "Bank of America",
+                "Wells Fargo",
+                "Citibank",
+                "Capital One",
+                "US Bank",
+                "PNC",
+                "TD Bank",
+            ],
+            "blur_regions": [],
+            "use_local_vision": True,
+            "check_interval_seconds": 120,
+        },
+        "motivation": {"enabled": True, "check_interval_minutes": 3},
+        # Set show_on_startup false to build the dashboard only when first opened from the menu
+        "dashboard": {"show_on_startup": True},
+    }
+)
+
+
+# Shared stand-in for a missing config section (avoids allocating a fresh {})
+_EMPTY_SECTION: Mapping[str, Any] = MappingProxyType({})
+
+# Parsed configs keyed by path, valid while the file's (mtime_ns, size) is unchanged
+_CONFIG_CACHE: Dict[str, Tuple[Tuple[int, int], Dict[str, Any]]] = {}
+
+
+def _default_config() -> Dict[str, Any]:
+    """Materialize an independent, mutable copy of DEFAULT_CONFIG."""
+    return copy.deepcopy(dict(DEFAULT_CONFIG))
 
 
 def load_config(config_path: str = "config.json") -> Dict[str, Any]:
     """
     Load configuration from file, creating defaults if missing.
 
+    The parsed result is cached until the file's mtime or size changes.
+
     Args:
         config_path: Path to config file
 
@@ -160,34 +207,43 @@ def load_config(config_path: str = "config.json") -> Dict[str, Any]:
     if not config_file.exists():
         logger.info(f"Config file not found at {config_path}, creating defaults")
         save_config(DEFAULT_CONFIG, config_path)
-        return DEFAULT_CONFIG.copy()
+        return _default_config()
 
     try:
-        with open(config_file, "r") as f:
-            config = json.load(f)
+        st = config_file.stat()
+        signature = (st.st_mtime_ns, st.st_size)
+        cached = _CONFIG_CACHE.get(str(config_file))
+        if cached and cached[0] == signature:
+            return copy.deepcopy(cached[1])
 
-        # Validate and merge with defaults (deep merge)
-        validated_config = deep_merge(DEFAULT_CONFIG.copy(), config)
+        config = _loads(config_file.read_bytes())
+
+        # Validate and merge with defaults (deep merge; the template is not modified)
+        validated_config = deep_merge(DEFAULT_CONFIG, config)
 
         # SECURITY: Never keep secrets in config dict (prevents leaking into session logs)
         validated_config = _scrub_secrets(validated_config)
 
+        _CONFIG_CACHE[str(config_file)] = (signature, validated_config)
         logger.info(f"Config loaded from {config_path}")
-        return validated_config
+        return copy.deepcopy(validated_config)
 
     except json.JSONDecodeError as e:
         logger.warning(f"Invalid JSON in config file: {e}. Using defaults.")
         save_config(DEFAULT_CONFIG, config_path)
-        return DEFAULT_CONFIG.copy()
+        return _default_config()
     except Exception as e:
         logger.error(f"Error loading config: {e}. Using defaults.")
-        return DEFAULT_CONFIG.copy()
+        return _default_config()
 
 
-def deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
+def deep_merge(base: Mapping[str, Any], override: Dict[str, Any]) -> Dict[str, Any]:
     """
     Deep merge two dictionaries.
 
+    Neither input is modified. Only the nested dicts that override actually
+    merges into are copied; untouched branches are shared with the inputs.
+
     Args:
         base: Base dictionary
         override: Dictionary to merge on top
@@ -195,16 +251,22 @@ def deep_merge(base: Dict[str, Any], override: Dict[str, Any]) -> Dict[str, Any]
     Returns:
         Merged dictionary
     """
-    result = base.copy()
-    for key, value in override.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = deep_merge(result[key], value)
-        else:
-            result[key] = value
+    result = dict(base)
+    pending = deque([(result, override)])
+    while pending:
+        target, source = pending.popleft()
+        for key, value in source.items():
+            current = target.get(key)
+            if isinstance(current, Mapping) and isinstance(value, dict):
+                merged = dict(current)
+                target[key] = merged
+                pending.append((merged, value))
+            else:
+                target[key] = value
     return result
 
 
-def save_config(config: Dict[str, Any], config_path: str = "config.json") -> None:
+def save_config(config: Mapping[str, Any], config_path: str = "config.json") -> None:
     """
     Save configuration to file.
 
@@ -212,11 +274,11 @@ def save_config(config: Dict[str, Any], config_path: str = "config.json") -> Non
         config: Configuration dictionary
         config_path: Path to save config file
     """
+    _CONFIG_CACHE.pop(str(Path(config_path)), None)
     try:
         # SECURITY: Never write secrets to disk
         config_to_write = _scrub_secrets(config)
-        with open(config_path, "w") as f:
-            json.dump(config_to_write, f, indent=2)
+        Path(config_path).write_bytes(_dumps(config_to_write))
         logger.info(f"Config saved to {config_path}")
     except Exception as e:
         logger.error(f"Error saving config: {e}")
@@ -232,7 +294,7 @@ def get_wake_word(config: Dict[str, Any]) -> str:
     Returns:
         Wake word string (e.g., "hey sergeant")
     """
-    personality = config.get("personality", {})
+    personality = config.get("personality") or _EMPTY_SECTION
     wake_word_name = personality.get("wake_word_name", "sergeant")
     return f"hey {wake_word_name}"
 
@@ -247,7 +309,7 @@ def get_personality_name(config: Dict[str, Any]) -> str:
     Returns:
         Personality name
     """
-    return config.get("personality", {}).get("name", "sergeant")
+    return (config.get("personality") or _EMPTY_SECTION).get("name", "sergeant")
 
 
 def update_personality(
@@ -256,6 +318,7 @@ def update_personality(
     custom_description: str = None,
     custom_wake_word: str = None,
     config_path: str = "config.json",
+    save: bool = True,
 ) -> Dict[str, Any]:
     """
     Update personality settings.
@@ -266,6 +329,8 @@ def update_personality(
         custom_description: Custom description (only for custom personality)
         custom_wake_word: Custom wake word name (only for custom personality)
         config_path: Path to config file
+        save: Write the updated config to config_path (callers that persist
+            it themselves pass False)
 
     Returns:
         Updated configuration
@@ -288,5 +353,6 @@ def update_personality(
             "tone": profile.tone,
         }
 
-    save_config(config, config_path)
+    if save:
+        save_config(config, config_path)
     return config
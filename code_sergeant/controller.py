@@ -1,18 +1,33 @@
 """AppController - manages session state and coordinates workers."""
+import contextlib
+import copy
+import functools
+import itertools
 import logging
 import os
-import queue
+import random
+import sys
 import threading
 import time
-from dataclasses import asdict, dataclass
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from concurrent.futures import wait as wait_futures
+from dataclasses import asdict, dataclass, field
 from datetime import datetime
+from operator import itemgetter
 from pathlib import Path
-from typing import Any, Dict, Optional
+from typing import Any, Callable, Deque, Dict, Iterator, List, Optional, Tuple
 
 from .ai_client import AIClient, create_ai_client
 from .config import get_personality_name, load_config, save_config, update_personality
 from .judge import ActivityJudge
-from .models import ActivityEvent, Judgment, PomodoroState, SessionStats
+from .models import (
+    BREAK_STATES,
+    ActivityEvent,
+    Judgment,
+    PomodoroState,
+    SessionStats,
+)
 from .motivation_monitor import MotivationMonitor
 from .native_monitor import NativeMonitor
 from .personality import PersonalityManager, get_personality_choices
@@ -32,10 +47,193 @@ from .voice import VoiceWorker, WakeWordDetector, run_voice_worker
 
 logger = logging.getLogger("code_sergeant.controller")
 
+# Settling time after an activity change before it is judged
+JUDGE_DEBOUNCE_SEC = 1.0
+
+# Judgments with the same classification and action whose confidence differs
+# by at most this much are treated as repeats of the displayed one
+JUDGMENT_CONFIDENCE_EPSILON = 0.02
+
+# Event types routed to EventQueue's bounded, lock-free update ring
+RING_EVENT_TYPES = frozenset({"activity_update", "judgment_update"})
+UPDATE_RING_SIZE = 64
+
+# Pool size for one-shot tasks (session startup, voice, note-taking)
+TASK_EXECUTOR_WORKERS = 4
+SESSION_STARTUP_TIMEOUT_SEC = 5.0
+
+# Longest wait for in-progress speech to finish before recording
+TTS_DRAIN_TIMEOUT_SEC = 5.0
+
+# Longest wait for a recording to close the mic before the wake word detector
+# reopens it, and the settle time added if it doesn't
+MIC_RELEASE_TIMEOUT_SEC = 1.0
+MIC_RELEASE_GRACE_SEC = 0.3
+
+# Stats ticks are measured in integer nanoseconds
+NS_PER_SEC = 1_000_000_000
+
+# Classification -> (SessionStats field credited, whether it extends the focus
+# streak; thinking counts towards the streak too, idle/off-task reset it)
+STATS_BUCKETS = {
+    "on_task": ("focus_seconds", True),
+    "thinking": ("thinking_seconds", True),
+    "idle": ("idle_seconds", False),
+    "off_task": ("off_task_seconds", False),
+}
+
+# Recent activities kept for judging context
+ACTIVITY_HISTORY_SIZE = 10
+
+# Longer titles are rarely repeated exactly, so interning them would only grow
+# the intern table
+INTERN_TITLE_MAX_LEN = 128
+
+
+@functools.lru_cache(maxsize=128)
+def _format_judgment(classification: str, confidence: float) -> str:
+    """Status text for a judgment, e.g. "on_task (90%)" (few distinct inputs)."""
+    return f"{classification} ({confidence:.0%})"
+
+
+def _is_repeat_judgment(previous: Optional[Judgment], judgment: Judgment) -> bool:
+    """Whether judgment repeats previous (its reason and say text may differ)."""
+    return (
+        previous is not None
+        and previous.classification == judgment.classification
+        and previous.action == judgment.action
+        and abs(previous.confidence - judgment.confidence)
+        <= JUDGMENT_CONFIDENCE_EPSILON
+    )
+
+
+class EventQueue:
+    """
+    Multi-producer, single-consumer event queue drained in batches.
+
+    High-rate status updates (activity and judgment updates) go to a bounded
+    ring that producers append to without locking; if the consumer falls
+    behind, the oldest updates are dropped. Other events are kept in full:
+    producers hold the lock only for an append, and the consumer swaps the
+    pending deque for an empty one and handles the captured batch without
+    locking. Every event is tagged with a sequence number on the way in so a
+    drained batch keeps the order events were queued in across both.
+    """
+
+    def __init__(self):
+        # next() on a count and deque.append/popleft are atomic, so the ring
+        # needs no lock
+        self._seq = itertools.count()
+        self._updates: Deque[Tuple[int, Dict[str, Any]]] = deque(
+            maxlen=UPDATE_RING_SIZE
+        )
+        self._events: Deque[Tuple[int, Dict[str, Any]]] = deque()
+        self._lock = threading.Lock()
+
+    def append(self, event: Dict[str, Any]) -> None:
+        """Queue an event."""
+        if event.get("type") in RING_EVENT_TYPES:
+            self._updates.append((next(self._seq), event))
+            return
+        with self._lock:
+            self._events.append((next(self._seq), event))
+
+    def drain(self) -> List[Dict[str, Any]]:
+        """
+        Take every queued event, leaving the queue empty.
+
+        Returns:
+            Events oldest first, in the order they were queued
+        """
+        batch = []
+        try:
+            while True:
+                batch.append(self._updates.popleft())
+        except IndexError:
+            pass
+
+        with self._lock:
+            events, self._events = self._events, deque()
+        batch.extend(events)
+        # Two sorted runs (give or take racing producers), so this is a merge
+        batch.sort(key=itemgetter(0))
+        return [event for _, event in batch]
+
+    def clear(self) -> None:
+        """Drop every queued event."""
+        self.drain()
+
+    def __len__(self) -> int:
+        return len(self._updates) + len(self._events)
+
+
+@dataclass(frozen=True, slots=True)
+class ControllerConfig:
+    """
+    Flattened, read-only view of the config values the controller reads.
+
+    Built once from the config dict (and rebuilt whenever the controller
+    changes it) so hot paths read a single attribute instead of walking
+    nested dicts with .get() fallbacks. The dict stays the source for writes.
+    """
+
+    poll_interval_sec: float
+    judge_interval_sec: float
+    cooldown_seconds: float
+    reminder_intervals_sec: Tuple[int, ...]
+    voice_record_seconds: float
+    voice_sample_rate: int
+    note_record_seconds: float
+    ollama_model: str
+    ollama_base_url: str
+    voice_activation_enabled: bool
+    wake_word_sensitivity: float
+    pomodoro_auto_start: bool
+    motivation_enabled: bool
+    motivation_check_interval: int
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "ControllerConfig":
+        """
+        Flatten a loaded config dict.
+
+        Args:
+            config: Config as returned by load_config()
+
+        Returns:
+            ControllerConfig snapshot of config
+        """
+        voice = config.get("voice", {})
+        ollama = config.get("ollama", {})
+        voice_activation = config.get("voice_activation", {})
+        motivation = config.get("motivation", {})
+        return cls(
+            poll_interval_sec=config["poll_interval_sec"],
+            judge_interval_sec=config["judge_interval_sec"],
+            cooldown_seconds=config["cooldown_seconds"],
+            reminder_intervals_sec=tuple(config["reminder_intervals_sec"]),
+            voice_record_seconds=voice["record_seconds"],
+            voice_sample_rate=voice["sample_rate"],
+            note_record_seconds=voice.get("note_record_seconds", 120),
+            ollama_model=ollama["model"],
+            ollama_base_url=ollama["base_url"],
+            voice_activation_enabled=voice_activation.get("enabled", False),
+            wake_word_sensitivity=voice_activation.get("sensitivity", 0.5),
+            pomodoro_auto_start=config.get("pomodoro", {}).get(
+                "auto_start_with_session", False
+            ),
+            motivation_enabled=motivation.get("enabled", True),
+            motivation_check_interval=motivation.get("check_interval_minutes", 3),
+        )
+
+
+# Versions stamped on ControllerState assignments (see get_state_snapshot)
+_STATE_VERSIONS = itertools.count(1)
+
 
 @dataclass
 class ControllerState:
-    """Snapshot of controller state for UI rendering."""
+    """Controller state, read by the UI through StateSnapshot views."""
 
     session_active: bool = False
     goal: Optional[str] = None
@@ -47,11 +245,41 @@ class ControllerState:
     personality_name: str = "sergeant"
     wake_word: str = "hey sergeant"
     wake_word_active: bool = False
+    # Stamped by __setattr__ on every assignment
+    _version: int = field(default=0, init=False, repr=False, compare=False)
 
     def __post_init__(self):
         if self.stats is None:
             self.stats = SessionStats()
 
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # Any assignment gets a fresh, process-unique version for snapshot caching
+        super().__setattr__("_version", next(_STATE_VERSIONS))
+
+
+@dataclass(frozen=True, slots=True)
+class StateSnapshot:
+    """
+    Read-only view of ControllerState for UI rendering.
+
+    Returned by get_state_snapshot() and shared between callers until the
+    state changes, so its fields can't be reassigned. stats and
+    pomodoro_state are the live objects, which keeps their counters current
+    between rebuilds.
+    """
+
+    session_active: bool
+    goal: Optional[str]
+    current_activity: Optional[str]
+    last_judgment: Optional[str]
+    last_judgment_obj: Optional[Judgment]
+    stats: SessionStats
+    pomodoro_state: Optional[PomodoroState]
+    personality_name: str
+    wake_word: str
+    wake_word_active: bool
+
 
 class AppController:
     """
@@ -69,24 +297,52 @@ class AppController:
 
     def __init__(self):
         self.state = ControllerState()
-        self.event_queue = queue.Queue()
+        # Last get_state_snapshot() result and the state version it reflects
+        self._snapshot: Optional[StateSnapshot] = None
+        self._snapshot_version = 0
+        # Many producers, one consumer (process_events_tick), drained per tick
+        self.event_queue = EventQueue()
         self.stop_event = threading.Event()
         self.workers: Dict[str, threading.Thread] = {}
 
-        # Load config
+        self._build_dispatch_tables()
+
+        # Load config (dict for writes, flattened snapshot for reads)
         self.config = load_config()
+        self.cfg = ControllerConfig.from_config(self.config)
+
+        # Config writes run here, in order, so callers (often the UI) don't block
+        self._io_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="cfg-io"
+        )
+        # One-shot tasks (session component starts, voice and note-taking
+        # interactions) reuse these threads instead of spawning one per call
+        self._executor = ThreadPoolExecutor(
+            max_workers=TASK_EXECUTOR_WORKERS, thread_name_prefix="cs-worker"
+        )
+        self._startup_futures: List[Future] = []
+        # Microphone priming runs beside the TTS drain for voice and note tasks.
+        # It gets its own thread because those tasks already hold _executor
+        # threads, and waiting on a job queued behind them could stall
+        self._mic_executor = ThreadPoolExecutor(
+            max_workers=1, thread_name_prefix="mic-prime"
+        )
 
         # Initialize personality manager
         self.personality_manager = PersonalityManager(
             self.config,
-            ollama_model=self.config["ollama"]["model"],
-            ollama_base_url=self.config["ollama"]["base_url"],
+            ollama_model=self.cfg.ollama_model,
+            ollama_base_url=self.cfg.ollama_base_url,
         )
 
-        # Update state with personality info
+        # Update state with personality info (state.wake_word is the cached
+        # wake word phrase read by the wake word detector setup)
         self.state.personality_name = self.personality_manager.profile.name
         self.state.wake_word = self.personality_manager.wake_word
 
+        # Phrase candidates per type, resolved once per personality (see _phrase)
+        self._phrase_cache: Dict[str, Tuple[str, ...]] = {}
+
         # Initialize AI client first (OpenAI + Ollama fallback)
         self.ai_client = create_ai_client(self.config)
 
@@ -94,8 +350,8 @@ class AppController:
         self.native_monitor = NativeMonitor()
         self.judge = ActivityJudge(
             ai_client=self.ai_client,  # Use AIClient (prefers OpenAI if available)
-            model=self.config["ollama"]["model"],
-            base_url=self.config["ollama"]["base_url"],
+            model=self.cfg.ollama_model,
+            base_url=self.cfg.ollama_base_url,
             personality_manager=self.personality_manager,
         )
         self.tts_service = TTSService(
@@ -119,30 +375,35 @@ class AppController:
             on_complete=self._on_pomodoro_complete,
         )
 
-        # Voice worker (initialized lazily)
+        # Voice worker (initialized lazily, see _get_voice_worker)
         self.voice_worker: Optional[VoiceWorker] = None
+        self._voice_worker_key: Optional[Tuple[Any, ...]] = None
 
         # Wake word detector
         self.wake_word_detector: Optional[WakeWordDetector] = None
         self._init_wake_word_detector()
 
         # Start wake word detector if enabled (even without session)
-        if self.wake_word_detector and self.config.get("voice_activation", {}).get(
-            "enabled", False
-        ):
+        if self.wake_word_detector and self.cfg.voice_activation_enabled:
             self.wake_word_detector.start()
             self.state.wake_word_active = True
             logger.info("Wake word detection started on initialization")
 
         # Session state
         self.current_activity: Optional[ActivityEvent] = None
-        self.activity_history: list[ActivityEvent] = []
+        self.activity_history: Deque[ActivityEvent] = deque(
+            maxlen=ACTIVITY_HISTORY_SIZE
+        )
         self.last_judgment: Optional[Judgment] = None
-        self.last_yell_time: Optional[float] = None
+        self.last_yell_time: Optional[float] = None  # time.monotonic()
 
         # Drill worker for continuous nagging when off_task
         self.drill_worker: Optional[threading.Thread] = None
         self.drill_stop_event = threading.Event()
+        # Set on activity change so the drill worker re-judges without polling
+        self._drill_wake = threading.Event()
+        # Set on activity change so the judge worker judges without polling
+        self._activity_changed = threading.Event()
         self.drill_interval = (
             1.0  # Drill every 1 second when off_task for fast response
         )
@@ -152,9 +413,7 @@ class AppController:
             ai_client=self.ai_client,
             personality_manager=self.personality_manager,
             tts_service=self.tts_service,
-            check_interval_minutes=self.config.get("motivation", {}).get(
-                "check_interval_minutes", 3
-            ),
+            check_interval_minutes=self.cfg.motivation_check_interval,
         )
 
         # Initialize screen monitor (privacy-focused)
@@ -167,24 +426,69 @@ class AppController:
 
         logger.info("AppController initialized")
 
+    def _build_dispatch_tables(self) -> None:
+        """Build the event and voice command lookup tables used for dispatch."""
+        # Event type -> handler, looked up once per event in _handle_event
+        self._handlers: Dict[str, Callable[[Dict[str, Any]], None]] = {
+            "activity_update": self._handle_activity_update,
+            "judgment_update": self._handle_judgment_update,
+            "stats_tick": self._handle_stats_tick,
+            "reminder_triggered": self._handle_reminder,
+            "voice_command": self._handle_voice_command,
+            "voice_transcript": self._handle_voice_transcript,
+            "wake_word_detected": self._handle_wake_word,
+            "note_taking_triggered": self._handle_note_taking,
+            "error_event": self._handle_error,
+        }
+        # Voice command -> (requires args, handler(args, event))
+        self._voice_commands: Dict[
+            str, Tuple[bool, Callable[[Any, Dict[str, Any]], None]]
+        ] = {
+            "start_session": (True, lambda args, _: self.start_session(args)),
+            "end_session": (False, lambda args, _: self.end_session()),
+            "pause_session": (False, lambda args, _: self.pause_session()),
+            "resume_session": (False, lambda args, _: self.resume_session()),
+            "change_goal": (True, lambda args, _: self.change_goal(args)),
+            "save_note": (
+                True,
+                lambda args, event: self.save_voice_note(
+                    args, event.get("transcript", "")
+                ),
+            ),
+            # User said "take a note" without content - start VAD recording
+            "start_note_taking": (False, lambda args, _: self.start_note_taking()),
+            "report_distraction": (True, lambda args, _: self.report_distraction(args)),
+            "report_phone": (
+                False,
+                lambda args, _: self.report_distraction("Phone usage", is_phone=True),
+            ),
+            "start_pomodoro": (False, lambda args, _: self.pomodoro.start_work()),
+            "pause_pomodoro": (False, lambda args, _: self.pomodoro.pause()),
+            "stop_pomodoro": (False, lambda args, _: self.pomodoro.stop()),
+            "skip_pomodoro": (False, lambda args, _: self.pomodoro.skip()),
+            "status": (False, lambda args, _: self._speak_status()),
+        }
+
     def _init_wake_word_detector(self):
         """Initialize wake word detector if enabled."""
-        if self.config.get("voice_activation", {}).get("enabled", False):
-            wake_words = [self.personality_manager.wake_word]
+        if self.cfg.voice_activation_enabled:
+            wake_words = [self.state.wake_word]
             self.wake_word_detector = WakeWordDetector(
                 wake_words=wake_words,
-                sensitivity=self.config.get("voice_activation", {}).get(
-                    "sensitivity", 0.5
-                ),
+                sensitivity=self.cfg.wake_word_sensitivity,
                 on_wake_word=self._on_wake_word_detected,
                 on_note_taking=self._on_note_taking_triggered,
             )
             logger.info(f"Wake word detector initialized with: {wake_words}")
 
+    def _save_config_async(self) -> None:
+        """Persist a snapshot of the current config on the I/O thread."""
+        self._io_executor.submit(save_config, copy.deepcopy(self.config))
+
     def _on_wake_word_detected(self, wake_word: str):
         """Handle wake word detection."""
         logger.info(f"Wake word detected: {wake_word}")
-        self.event_queue.put(
+        self.event_queue.append(
             {
                 "type": "wake_word_detected",
                 "wake_word": wake_word,
@@ -197,7 +501,7 @@ class AppController:
     def _on_note_taking_triggered(self, wake_word: str):
         """Handle note-taking wake word detection (e.g., 'hey sergeant take a note')."""
         logger.info(f"Note-taking triggered via wake word: {wake_word}")
-        self.event_queue.put(
+        self.event_queue.append(
             {
                 "type": "note_taking_triggered",
                 "wake_word": wake_word,
@@ -207,6 +511,28 @@ class AppController:
         # Start note-taking mode (longer recording)
         self.start_note_taking()
 
+    def _phrase(self, phrase_type: str) -> str:
+        """
+        Pick a phrase of phrase_type for the current personality.
+
+        The candidates are looked up (or, for custom personalities, generated)
+        on first use and reused until the personality changes, so repeated
+        events such as drills don't go back to the personality manager. An
+        empty pool is not cached, so a failed generation is retried next time.
+
+        Args:
+            phrase_type: Type of phrase (session_start, off_task_drill, etc.)
+
+        Returns:
+            A phrase, or "" if the personality has none
+        """
+        pool = self._phrase_cache.get(phrase_type)
+        if pool is None:
+            pool = self.personality_manager.get_phrase_pool(phrase_type)
+            if pool:
+                self._phrase_cache[phrase_type] = pool
+        return random.choice(pool) if pool else ""
+
     def _on_pomodoro_tick(self, state: PomodoroState):
         """Handle pomodoro tick event."""
         self.state.pomodoro_state = state
@@ -217,13 +543,14 @@ class AppController:
 
         # Announce state change
         if new_state == "work":
-            phrase = self.personality_manager.get_phrase("session_start")
-            self.tts_service.speak(phrase or "Work time! Focus up!")
+            self.tts_service.speak(
+                self._phrase("session_start") or "Work time! Focus up!"
+            )
         elif new_state == "short_break":
             self.tts_service.speak("Time for a short break!")
         elif new_state == "long_break":
             self.tts_service.speak("Great work! Time for a long break!")
-        elif new_state == "stopped" and old_state in ("short_break", "long_break"):
+        elif new_state == "stopped" and old_state in BREAK_STATES:
             self.tts_service.speak("Break over! Ready for another round?")
 
     def _on_pomodoro_complete(self, period_type: str):
@@ -252,48 +579,77 @@ class AppController:
 
         # Reset state
         self.current_activity = None
-        self.activity_history = []
+        self.activity_history.clear()
         self.last_judgment = None
         self.last_yell_time = None
+        self._activity_changed.clear()
 
         # Reset judge patterns
         self.judge.reset_patterns()
 
         # Clear event queue
-        while not self.event_queue.empty():
-            try:
-                self.event_queue.get_nowait()
-            except queue.Empty:
-                break
+        self.event_queue.clear()
 
-        # Start workers
+        # Start workers (thread spawns only; end_session joins these)
         self._start_workers()
 
+        # Start the remaining components concurrently, off the caller's thread
+        # (opening the mic or contacting the vision backend can take seconds)
+        startup: Dict[str, Callable[[], None]] = {}
+
         # Auto-start pomodoro if configured
-        if self.config.get("pomodoro", {}).get("auto_start_with_session", False):
-            self.pomodoro.start_work()
+        if self.cfg.pomodoro_auto_start:
+            startup["pomodoro"] = self.pomodoro.start_work
 
         # Start wake word detector if configured
-        if self.wake_word_detector and self.config.get("voice_activation", {}).get(
-            "enabled", False
-        ):
-            self.wake_word_detector.start()
-            self.state.wake_word_active = True
+        if self.wake_word_detector and self.cfg.voice_activation_enabled:
+            startup["wake_word_detector"] = self._start_wake_word_detector
 
         # Start motivation monitor if enabled
-        if self.config.get("motivation", {}).get("enabled", True):
-            self.motivation_monitor.start(goal)
+        if self.cfg.motivation_enabled:
+            startup["motivation_monitor"] = functools.partial(
+                self.motivation_monitor.start, goal
+            )
 
         # Start screen monitor if enabled
         if self.screen_monitor.is_enabled():
-            self.screen_monitor.start(goal)
+            startup["screen_monitor"] = functools.partial(
+                self.screen_monitor.start, goal
+            )
+
+        self._startup_futures = [
+            self._executor.submit(self._run_startup_task, name, task)
+            for name, task in startup.items()
+        ]
 
         # Announce session start
-        phrase = self.personality_manager.get_phrase("session_start")
-        self.tts_service.speak(phrase or "Session started!")
+        self.tts_service.speak(self._phrase("session_start") or "Session started!")
 
         logger.info("Session started")
 
+    def _start_wake_word_detector(self) -> None:
+        """Start wake word detection and reflect it in state."""
+        self.wake_word_detector.start()
+        self.state.wake_word_active = True
+
+    @staticmethod
+    def _run_startup_task(name: str, task: Callable[[], None]) -> None:
+        """Run one session component start on the startup executor, logging errors."""
+        try:
+            task()
+            logger.debug(f"Started {name}")
+        except Exception as e:
+            logger.error(f"Error starting {name}: {e}", exc_info=True)
+
+    def _wait_for_startup(self) -> None:
+        """Wait for the current session's component starts to finish."""
+        futures, self._startup_futures = self._startup_futures, []
+        if not futures:
+            return
+        _, pending = wait_futures(futures, timeout=SESSION_STARTUP_TIMEOUT_SEC)
+        if pending:
+            logger.warning(f"{len(pending)} session component(s) still starting")
+
     def end_session(self) -> None:
         """End the current session and stop all workers."""
         if not self.state.session_active:
@@ -302,8 +658,13 @@ class AppController:
 
         logger.info("Ending session")
 
+        # Let components still starting finish, so stopping them below sticks
+        self._wait_for_startup()
+
         # Signal workers to stop
         self.stop_event.set()
+        self.native_monitor.wake()
+        self._activity_changed.set()
 
         # Stop drill worker and cancel all pending TTS
         self._stop_drill_worker()
@@ -326,12 +687,7 @@ class AppController:
         self.screen_monitor.stop()
 
         # Wait for workers to stop (with timeout)
-        for name, worker in self.workers.items():
-            if worker.is_alive():
-                logger.info(f"Waiting for worker {name} to stop...")
-                worker.join(timeout=5.0)
-                if worker.is_alive():
-                    logger.warning(f"Worker {name} did not stop within timeout")
+        self._join_workers(timeout=5.0)
 
         # Update stats
         if self.state.stats.start_time:
@@ -355,8 +711,9 @@ class AppController:
         # Speak summary
         if self.state.stats.start_time and self.state.stats.end_time:
             focus_minutes = int(self.state.stats.focus_seconds / 60)
-            phrase = self.personality_manager.get_phrase("session_end")
-            summary = phrase or get_session_summary_template().format(
+            summary = self._phrase(
+                "session_end"
+            ) or get_session_summary_template().format(
                 focus_minutes=focus_minutes,
                 distractions=self.state.stats.distractions_count,
             )
@@ -380,42 +737,66 @@ class AppController:
             return
 
         self.drill_stop_event.clear()
+        self._drill_wake.clear()
 
-        def drill_loop():
-            """Continuously nag the user until they focus."""
-            logger.info("Drill worker started - will nag every 5 seconds until focused")
-
-            # Wait a bit before first drill (initial warning was already spoken)
-            time.sleep(self.drill_interval)
-
-            while not self.drill_stop_event.is_set() and self.state.session_active:
-                # Check if still off_task
-                if (
-                    self.state.last_judgment_obj
-                    and self.state.last_judgment_obj.classification == "off_task"
-                ):
-                    # Get a drill phrase and speak it
-                    phrase = self.personality_manager.get_phrase("off_task_drill")
-                    if phrase:
-                        logger.info(f"Drilling: {phrase[:50]}...")
-                        self.tts_service.speak(phrase)
-
-                    # Wait for next drill
-                    self.drill_stop_event.wait(self.drill_interval)
-                else:
-                    # User is back on task, stop drilling
-                    logger.info("User back on task, stopping drill")
-                    break
-
-            logger.info("Drill worker stopped")
-
-        self.drill_worker = threading.Thread(target=drill_loop, daemon=True)
+        self.drill_worker = threading.Thread(target=self._drill_loop, daemon=True)
         self.drill_worker.start()
 
+    def _drill_loop(self) -> None:
+        """Continuously nag the user until they focus."""
+        logger.info("Drill worker started - will nag every 5 seconds until focused")
+
+        # Wait a bit before first drill (initial warning was already spoken)
+        self._drill_pause()
+
+        while not self.drill_stop_event.is_set() and self.state.session_active:
+            # Check if still off_task
+            if (
+                self.state.last_judgment_obj
+                and self.state.last_judgment_obj.classification == "off_task"
+            ):
+                # Get a drill phrase and speak it
+                phrase = self._phrase("off_task_drill")
+                if phrase:
+                    logger.info(f"Drilling: {phrase[:50]}...")
+                    self.tts_service.speak(phrase)
+
+                # Wait for next drill
+                self._drill_pause()
+            else:
+                # User is back on task, stop drilling
+                logger.info("User back on task, stopping drill")
+                break
+
+        logger.info("Drill worker stopped")
+
+    def _drill_pause(self) -> None:
+        """
+        Wait out one drill interval on the drill worker thread.
+
+        An activity change (see _handle_activity_update) wakes the wait early
+        and is judged right here, so a return to work ends the drill at once
+        instead of at the next judge worker pass. The wait resumes if the user
+        is still off task, keeping the drill cadence.
+        """
+        deadline = time.monotonic() + self.drill_interval
+        while not self.drill_stop_event.is_set():
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not self._drill_wake.wait(remaining):
+                return
+            self._drill_wake.clear()
+            if self.drill_stop_event.is_set():
+                return
+            self._trigger_immediate_judgment()
+            judgment = self.state.last_judgment_obj
+            if not judgment or judgment.classification != "off_task":
+                return
+
     def _stop_drill_worker(self) -> None:
         """Stop the drill worker thread and cancel all pending/playing audio."""
         if self.drill_worker and self.drill_worker.is_alive():
             self.drill_stop_event.set()
+            self._drill_wake.set()
             # Cancel all TTS (stop current audio + clear queue)
             self.tts_service.cancel_all()
             self.drill_worker.join(timeout=2.0)
@@ -425,37 +806,38 @@ class AppController:
         """
         Trigger an immediate judgment of current activity.
 
-        Used when activity changes while drilling to quickly stop
-        drilling if user returns to productive work.
+        Runs on the drill worker when the activity changes while drilling,
+        to quickly stop drilling if user returns to productive work.
         """
-        if not self.state.session_active or not self.current_activity:
+        # Read once: the event thread may replace it while we judge
+        activity = self.current_activity
+        if not self.state.session_active or not activity:
             return
 
         try:
             # Perform judgment immediately
             judgment = self.judge.judge(
                 goal=self.state.goal or "",
-                activity=self.current_activity,
-                history=self.activity_history,
+                activity=activity,
+                history=list(self.activity_history),
                 last_yell_time=self.last_yell_time,
-                cooldown_seconds=self.config["cooldown_seconds"],
+                cooldown_seconds=self.cfg.cooldown_seconds,
             )
 
             if judgment:
                 # Update judgment state directly (skip event queue for speed)
                 self.last_judgment = judgment
-                self.state.last_judgment = (
-                    f"{judgment.classification} ({judgment.confidence:.0%})"
+                self.state.last_judgment = _format_judgment(
+                    judgment.classification, judgment.confidence
                 )
                 self.state.last_judgment_obj = judgment
 
-                logger.info(
-                    f"Immediate judgment: {judgment.classification} ({judgment.confidence:.0%})"
-                )
+                logger.info(f"Immediate judgment: {self.state.last_judgment}")
 
                 # If now on_task or thinking, stop drilling immediately
+                # (signal only: this runs on the drill thread, which can't join itself)
                 if judgment.classification in ("on_task", "thinking"):
-                    self._stop_drill_worker()
+                    self.drill_stop_event.set()
                     # Cancel all TTS (stop current audio + clear queue)
                     self.tts_service.cancel_all()
                     logger.info("Stopped drilling - user back on task")
@@ -522,8 +904,10 @@ class AppController:
             add_distraction_log(self.state.stats, reason, is_phone)
             self.state.stats.distractions_count += 1
 
-            phrase = self.personality_manager.get_phrase("off_task_warning")
-            self.tts_service.speak(phrase or "Thanks for being honest. Let's refocus!")
+            self.tts_service.speak(
+                self._phrase("off_task_warning")
+                or "Thanks for being honest. Let's refocus!"
+            )
 
     def set_personality(
         self,
@@ -541,13 +925,20 @@ class AppController:
         """
         # Update config
         self.config = update_personality(
-            self.config, personality_name, custom_description, custom_wake_word
+            self.config,
+            personality_name,
+            custom_description,
+            custom_wake_word,
+            save=False,
         )
+        self.cfg = ControllerConfig.from_config(self.config)
+        self._save_config_async()
 
         # Update personality manager
         self.personality_manager.set_personality(
             personality_name, custom_description, custom_wake_word
         )
+        self._phrase_cache = {}
 
         # Update state
         self.state.personality_name = self.personality_manager.profile.name
@@ -555,7 +946,7 @@ class AppController:
 
         # Update wake word detector
         if self.wake_word_detector:
-            self.wake_word_detector.set_wake_words([self.personality_manager.wake_word])
+            self.wake_word_detector.set_wake_words([self.state.wake_word])
 
         # Update judge
         self.judge.set_personality_manager(self.personality_manager)
@@ -568,7 +959,8 @@ class AppController:
     def toggle_wake_word(self, enabled: bool) -> None:
         """Toggle wake word detection."""
         self.config["voice_activation"]["enabled"] = enabled
-        save_config(self.config)
+        self.cfg = ControllerConfig.from_config(self.config)
+        self._save_config_async()
 
         if enabled:
             if not self.wake_word_detector:
@@ -589,16 +981,15 @@ class AppController:
         """
         Process pending events from the queue (non-blocking).
         Called periodically from UI thread.
+
+        The queue is drained in one swap; events arriving meanwhile wait for
+        the next tick.
         """
-        try:
-            while True:
-                try:
-                    event = self.event_queue.get_nowait()
-                    self._handle_event(event)
-                except queue.Empty:
-                    break
-        except Exception as e:
-            logger.error(f"Error processing events: {e}", exc_info=True)
+        for event in self.event_queue.drain():
+            try:
+                self._handle_event(event)
+            except Exception as e:
+                logger.error(f"Error processing events: {e}", exc_info=True)
 
     def _handle_event(self, event: Dict[str, Any]) -> None:
         """
@@ -609,22 +1000,9 @@ class AppController:
         """
         event_type = event.get("type")
 
-        if event_type == "activity_update":
-            self._handle_activity_update(event)
-        elif event_type == "judgment_update":
-            self._handle_judgment_update(event)
-        elif event_type == "reminder_triggered":
-            self._handle_reminder(event)
-        elif event_type == "voice_command":
-            self._handle_voice_command(event)
-        elif event_type == "voice_transcript":
-            self._handle_voice_transcript(event)
-        elif event_type == "wake_word_detected":
-            self._handle_wake_word(event)
-        elif event_type == "note_taking_triggered":
-            self._handle_note_taking(event)
-        elif event_type == "error_event":
-            self._handle_error(event)
+        handler = self._handlers.get(event_type)
+        if handler:
+            handler(event)
         else:
             logger.warning(f"Unknown event type: {event_type}")
 
@@ -635,12 +1013,18 @@ class AppController:
             # Convert dict to ActivityEvent if needed
             activity = ActivityEvent(**activity)
 
-        self.current_activity = activity
-        self.activity_history.append(activity)
+        # The same few apps/titles recur all session: share one string each
+        if activity:
+            if isinstance(activity.app, str):
+                activity.app = sys.intern(activity.app)
+            if (
+                isinstance(activity.title, str)
+                and len(activity.title) < INTERN_TITLE_MAX_LEN
+            ):
+                activity.title = sys.intern(activity.title)
 
-        # Keep only last 10 activities
-        if len(self.activity_history) > 10:
-            self.activity_history.pop(0)
+        self.current_activity = activity
+        self.activity_history.append(activity)  # Oldest entry drops off at maxlen
 
         # Update UI state
         if activity:
@@ -653,11 +1037,12 @@ class AppController:
         # Record app change for motivation monitor
         if activity:
             self.motivation_monitor.record_app_change(activity.app)
+            self._activity_changed.set()
 
-        # If drill worker is active, trigger immediate judgment check
-        # This ensures we stop drilling IMMEDIATELY when user returns to productive app
+        # If drill worker is active, wake it to re-judge immediately (on its own
+        # thread) so drilling stops as soon as the user returns to a productive app
         if self.drill_worker and self.drill_worker.is_alive():
-            self._trigger_immediate_judgment()
+            self._drill_wake.set()
 
     def _handle_judgment_update(self, event: Dict[str, Any]) -> None:
         """Handle judgment update event."""
@@ -665,19 +1050,30 @@ class AppController:
         if isinstance(judgment, dict):
             judgment = Judgment(**judgment)
 
+        if judgment:
+            # Judgments come one per activity change, so each off-task one is a
+            # new distraction even when it repeats the last judgment
+            if judgment.classification == "off_task":
+                self.state.stats.distractions_count += 1
+
+            # A repeat is already displayed, its drill worker is already running
+            # (or stopped) and its warning was already spoken
+            if _is_repeat_judgment(self.last_judgment, judgment):
+                return
+
         self.last_judgment = judgment
 
         if judgment:
-            self.state.last_judgment = (
-                f"{judgment.classification} ({judgment.confidence:.0%})"
+            self.state.last_judgment = _format_judgment(
+                judgment.classification, judgment.confidence
             )
             self.state.last_judgment_obj = judgment
+            logger.debug(f"Judgment updated: {self.state.last_judgment}")
 
             # Update stats based on judgment
             if judgment.classification == "off_task":
-                self.state.stats.distractions_count += 1
                 if judgment.action == "yell":
-                    self.last_yell_time = time.time()
+                    self.last_yell_time = time.monotonic()
 
                 # Start continuous drilling when off_task (RED status)
                 self._start_drill_worker()
@@ -690,13 +1086,16 @@ class AppController:
                 if judgment.say:
                     self.tts_service.speak(judgment.say)
 
-        logger.debug(f"Judgment updated: {self.state.last_judgment}")
+    def _handle_stats_tick(self, event: Dict[str, Any]) -> None:
+        """Handle stats tick event: credit elapsed time to the latest judgment."""
+        if self.state.session_active and self.current_activity and self.last_judgment:
+            self._accumulate_stats(self.last_judgment, event.get("seconds", 0))
 
     def _handle_reminder(self, event: Dict[str, Any]) -> None:
         """Handle reminder event."""
         message = event.get("message")
         if not message:
-            message = self.personality_manager.get_phrase("reminder")
+            message = self._phrase("reminder")
         logger.info(f"Reminder: {message}")
         self.tts_service.speak(message)
 
@@ -707,35 +1106,11 @@ class AppController:
 
         logger.info(f"Voice command: {command} (args: {args})")
 
-        if command == "start_session" and args:
-            self.start_session(args)
-        elif command == "end_session":
-            self.end_session()
-        elif command == "pause_session":
-            self.pause_session()
-        elif command == "resume_session":
-            self.resume_session()
-        elif command == "change_goal" and args:
-            self.change_goal(args)
-        elif command == "save_note" and args:
-            self.save_voice_note(args, event.get("transcript", ""))
-        elif command == "start_note_taking":
-            # User said "take a note" without content - start VAD recording
-            self.start_note_taking()
-        elif command == "report_distraction" and args:
-            self.report_distraction(args)
-        elif command == "report_phone":
-            self.report_distraction("Phone usage", is_phone=True)
-        elif command == "start_pomodoro":
-            self.pomodoro.start_work()
-        elif command == "pause_pomodoro":
-            self.pomodoro.pause()
-        elif command == "stop_pomodoro":
-            self.pomodoro.stop()
-        elif command == "skip_pomodoro":
-            self.pomodoro.skip()
-        elif command == "status":
-            self._speak_status()
+        entry = self._voice_commands.get(command)
+        if entry:
+            requires_args, handler = entry
+            if args or not requires_args:
+                handler(args, event)
 
     def _handle_voice_transcript(self, event: Dict[str, Any]) -> None:
         """Handle voice transcript (non-command)."""
@@ -776,25 +1151,123 @@ class AppController:
 
         self.tts_service.speak(status)
 
-    def start_voice_interaction(self) -> None:
-        """Start voice interaction (push-to-talk or wake word triggered)."""
-        # Stop wake word detector to avoid microphone conflicts
-        wake_word_was_active = self.state.wake_word_active
-        if self.wake_word_detector and wake_word_was_active:
-            self.wake_word_detector.stop()
-            self.state.wake_word_active = False
-            logger.info("Wake word detector paused for voice interaction")
+    def _get_voice_worker(self) -> VoiceWorker:
+        """
+        Get the shared voice worker, building it on first use.
 
-        # Initialize voice worker if needed
-        if not self.voice_worker:
+        Keeps the Whisper model and Ollama clients loaded between voice and
+        note-taking interactions; rebuilt only if its config changes.
+
+        Returns:
+            VoiceWorker for the current config
+        """
+        key = (
+            self.cfg.voice_record_seconds,
+            self.cfg.voice_sample_rate,
+            self.cfg.ollama_model,
+            self.cfg.ollama_base_url,
+        )
+        if self.voice_worker is None or self._voice_worker_key != key:
             self.voice_worker = VoiceWorker(
-                record_seconds=self.config["voice"]["record_seconds"],
-                sample_rate=self.config["voice"]["sample_rate"],
-                ollama_model=self.config["ollama"]["model"],
-                ollama_base_url=self.config["ollama"]["base_url"],
+                record_seconds=self.cfg.voice_record_seconds,
+                sample_rate=self.cfg.voice_sample_rate,
+                ollama_model=self.cfg.ollama_model,
+                ollama_base_url=self.cfg.ollama_base_url,
                 tts_service=self.tts_service,
                 personality_manager=self.personality_manager,
+                ai_client=self.ai_client,
             )
+            self._voice_worker_key = key
+        return self.voice_worker
+
+    def _prepare_recording(self, voice_worker: VoiceWorker) -> int:
+        """
+        Drain TTS and prime the microphone concurrently before recording.
+
+        The two are independent, so the delay before recording is the longer
+        of them rather than their sum.
+
+        Args:
+            voice_worker: Worker about to record
+
+        Returns:
+            Number of pending TTS messages cleared
+        """
+        mic_future = self._mic_executor.submit(voice_worker.prime_microphone)
+
+        cleared = self.tts_service.clear_queue()
+        self.tts_service.wait_for_completion(timeout=TTS_DRAIN_TIMEOUT_SEC)
+
+        _, pending = wait_futures([mic_future], timeout=TTS_DRAIN_TIMEOUT_SEC)
+        if pending:
+            logger.warning("Microphone still priming, recording anyway")
+        return cleared
+
+    def _wait_for_mic_release(self, voice_worker: VoiceWorker) -> None:
+        """
+        Wait until voice_worker has closed the microphone.
+
+        Falls back to a short fixed pause only if the release isn't signalled
+        in time, since reopening a device still held can fail.
+
+        Args:
+            voice_worker: Worker that was recording
+        """
+        if not voice_worker.mic_released.wait(timeout=MIC_RELEASE_TIMEOUT_SEC):
+            logger.warning("Microphone not released in time, pausing before resume")
+            time.sleep(MIC_RELEASE_GRACE_SEC)
+
+    def _pause_wake_word(self, purpose: str) -> bool:
+        """
+        Stop the wake word detector so a recording can use the microphone.
+
+        Args:
+            purpose: What the mic is needed for, for logging
+
+        Returns:
+            Whether the detector was active (pass to _mic_exclusive to resume it)
+        """
+        wake_word_was_active = self.state.wake_word_active
+        if self.wake_word_detector and wake_word_was_active:
+            self.wake_word_detector.stop()
+            self.state.wake_word_active = False
+            logger.info(f"Wake word detector paused for {purpose}")
+        return wake_word_was_active
+
+    @contextlib.contextmanager
+    def _mic_exclusive(
+        self, voice_worker: VoiceWorker, wake_word_was_active: bool, purpose: str
+    ) -> Iterator[int]:
+        """
+        Hold the microphone for a recording on a worker thread.
+
+        On entry drains TTS and primes the mic (see _prepare_recording); on
+        exit, however the body ends, resumes the wake word detector once the
+        mic has been released if _pause_wake_word() stopped it.
+
+        Args:
+            voice_worker: Worker that will record
+            wake_word_was_active: Result of _pause_wake_word()
+            purpose: What the mic is needed for, for logging
+
+        Yields:
+            Number of pending TTS messages cleared
+        """
+        try:
+            yield self._prepare_recording(voice_worker)
+        finally:
+            if wake_word_was_active and self.wake_word_detector:
+                self._wait_for_mic_release(voice_worker)
+                self.wake_word_detector.start()
+                self.state.wake_word_active = True
+                logger.info(f"Wake word detector resumed after {purpose}")
+
+    def start_voice_interaction(self) -> None:
+        """Start voice interaction (push-to-talk or wake word triggered)."""
+        # Stop wake word detector now to avoid microphone conflicts
+        wake_word_was_active = self._pause_wake_word("voice interaction")
+
+        voice_worker = self._get_voice_worker()
 
         # Get current context
         goal = self.state.goal
@@ -802,32 +1275,23 @@ class AppController:
 
         # Run voice worker in thread
         def voice_thread():
-            try:
-                # Clear any pending TTS messages before recording
-                self.tts_service.clear_queue()
-                self.tts_service.wait_for_completion(timeout=5.0)
+            with self._mic_exclusive(
+                voice_worker, wake_word_was_active, "voice interaction"
+            ):
+                try:
+                    run_voice_worker(
+                        voice_worker, goal, current_activity_str, self.event_queue
+                    )
+                except PermissionError:
+                    # Re-raise permission errors (logged by _submit_task)
+                    raise
+                except Exception as e:
+                    logger.error(f"Voice interaction error: {e}")
+                    self.event_queue.append(
+                        {"type": "error_event", "message": f"Voice error: {e}"}
+                    )
 
-                run_voice_worker(
-                    self.voice_worker, goal, current_activity_str, self.event_queue
-                )
-            except PermissionError:
-                # Re-raise permission errors so UI can handle them
-                raise
-            except Exception as e:
-                logger.error(f"Voice interaction error: {e}")
-                self.event_queue.put(
-                    {"type": "error_event", "message": f"Voice error: {e}"}
-                )
-            finally:
-                # Resume wake word detector if it was active
-                if wake_word_was_active and self.wake_word_detector:
-                    time.sleep(0.3)  # Brief pause before resuming
-                    self.wake_word_detector.start()
-                    self.state.wake_word_active = True
-                    logger.info("Wake word detector resumed after voice interaction")
-
-        thread = threading.Thread(target=voice_thread, daemon=True)
-        thread.start()
+        self._submit_task("Voice interaction", voice_thread)
         logger.info("Voice interaction started")
 
     def start_note_taking(self) -> None:
@@ -837,221 +1301,147 @@ class AppController:
         Uses voice activity detection to record until silence is detected
         (after speech) or max duration is reached.
         """
-        # Stop wake word detector to avoid microphone conflicts
-        wake_word_was_active = self.state.wake_word_active
-        if self.wake_word_detector and wake_word_was_active:
-            self.wake_word_detector.stop()
-            self.state.wake_word_active = False
-            logger.info("Wake word detector paused for note-taking")
+        # Stop wake word detector now to avoid microphone conflicts
+        wake_word_was_active = self._pause_wake_word("note-taking")
 
         # Note-taking max duration (default 2 minutes since we wait for stop phrase)
-        max_note_duration = self.config.get("voice", {}).get("note_record_seconds", 120)
-
-        # Initialize voice worker for note-taking
-        note_worker = VoiceWorker(
-            record_seconds=max_note_duration,  # Fallback duration
-            sample_rate=self.config["voice"]["sample_rate"],
-            ollama_model=self.config["ollama"]["model"],
-            ollama_base_url=self.config["ollama"]["base_url"],
-            tts_service=self.tts_service,
-            personality_manager=self.personality_manager,
-        )
+        max_note_duration = self.cfg.note_record_seconds
+
+        # Note length is passed to record_note, so the voice worker is shared
+        note_worker = self._get_voice_worker()
 
         def note_taking_thread():
-            try:
-                # IMPORTANT: Clear any pending TTS messages (warnings/drills) before recording
-                # to prevent them from bleeding into the note transcript
-                cleared = self.tts_service.clear_queue()
+            # IMPORTANT: Silence pending TTS (warnings/drills) before recording
+            # to prevent them from bleeding into the note transcript
+            with self._mic_exclusive(
+                note_worker, wake_word_was_active, "note-taking"
+            ) as cleared:
                 if cleared > 0:
                     logger.info(
                         f"Cleared {cleared} pending TTS messages before note-taking"
                     )
+                try:
+                    # Announce note-taking mode and start recording as soon as the
+                    # instructions have actually finished playing
+                    prompt = self.tts_service.enqueue(
+                        "Go ahead. Say 'end note' when you're done."
+                    )
+                    wait_futures([prompt], timeout=10.0)
+
+                    # Record until user says stop phrase (e.g., "end note")
+                    logger.info(
+                        f"Note-taking: Recording until stop phrase (max {max_note_duration}s)..."
+                    )
+                    transcript = note_worker.record_note(max_duration=max_note_duration)
+
+                    if transcript and transcript.strip():
+                        # Save the note
+                        self.save_voice_note(transcript.strip())
+                        logger.info(f"Note saved: {transcript[:50]}...")
+                    else:
+                        self.tts_service.speak("I didn't catch that. Try again.")
+                        logger.warning("Note-taking: Empty transcript")
+
+                except PermissionError:
+                    raise
+                except Exception as e:
+                    logger.error(f"Note-taking error: {e}")
+                    self.tts_service.speak(
+                        "Sorry, there was an error saving your note."
+                    )
+                    self.event_queue.append(
+                        {"type": "error_event", "message": f"Note-taking error: {e}"}
+                    )
 
-                # Wait for any currently-speaking TTS to finish
-                self.tts_service.wait_for_completion(timeout=5.0)
+        self._submit_task("Note-taking", note_taking_thread)
+        logger.info("Note-taking mode started")
 
-                # Brief pause to ensure audio playback fully stops
-                time.sleep(0.3)
+    def _submit_task(self, name: str, task: Callable[[], None]) -> Future:
+        """
+        Run a one-shot task on the shared executor.
 
-                # Announce note-taking mode with instructions
-                self.tts_service.speak("Go ahead. Say 'end note' when you're done.")
+        Exceptions that escape the task are logged, since nothing waits on
+        the returned future.
 
-                # Wait for the instruction TTS to actually finish speaking
-                self.tts_service.wait_for_completion(timeout=10.0)
-                time.sleep(0.5)  # Additional buffer for audio system
+        Args:
+            name: Task name for logs
+            task: Callable to run
 
-                # Record until user says stop phrase (e.g., "end note")
-                logger.info(
-                    f"Note-taking: Recording until stop phrase (max {max_note_duration}s)..."
-                )
-                transcript = note_worker.record_note(max_duration=max_note_duration)
-
-                if transcript and transcript.strip():
-                    # Save the note
-                    self.save_voice_note(transcript.strip())
-                    logger.info(f"Note saved: {transcript[:50]}...")
-                else:
-                    self.tts_service.speak("I didn't catch that. Try again.")
-                    logger.warning("Note-taking: Empty transcript")
-
-            except PermissionError:
-                raise
-            except Exception as e:
-                logger.error(f"Note-taking error: {e}")
-                self.tts_service.speak("Sorry, there was an error saving your note.")
-                self.event_queue.put(
-                    {"type": "error_event", "message": f"Note-taking error: {e}"}
-                )
-            finally:
-                # Resume wake word detector if it was active
-                if wake_word_was_active and self.wake_word_detector:
-                    time.sleep(0.3)  # Brief pause before resuming
-                    self.wake_word_detector.start()
-                    self.state.wake_word_active = True
-                    logger.info("Wake word detector resumed after note-taking")
-
-        thread = threading.Thread(target=note_taking_thread, daemon=True)
-        thread.start()
-        logger.info("Note-taking mode started")
+        Returns:
+            Future of the task
+        """
 
-    def _start_workers(self):
-        """Start all worker threads."""
+        def log_failure(future: Future) -> None:
+            if not future.cancelled() and future.exception():
+                logger.error(f"{name} failed: {future.exception()}")
 
-        # ActivityPoller worker
-        def activity_poller_loop():
-            logger.info("ActivityPoller started")
-            poll_interval = self.config["poll_interval_sec"]
-            last_activity = None
+        future = self._executor.submit(task)
+        future.add_done_callback(log_failure)
+        return future
 
-            while not self.stop_event.is_set():
-                try:
-                    activity = self.native_monitor.get_current_activity()
-
-                    # Only emit if activity changed
-                    if last_activity is None or (
-                        activity.app != last_activity.app
-                        or activity.title != last_activity.title
-                    ):
-                        self.event_queue.put(
-                            {"type": "activity_update", "activity": activity}
-                        )
-                        last_activity = activity
+    def shutdown(self) -> None:
+        """
+        Stop everything before the app exits.
 
-                except Exception as e:
-                    logger.error(f"Error in ActivityPoller: {e}")
-                    self.event_queue.put(
-                        {
-                            "type": "error_event",
-                            "message": f"Activity polling error: {e}",
-                        }
-                    )
+        Ends any active session, stops wake word detection and app-switch
+        notifications, flushes pending config saves and releases the task pool.
+        """
+        if self.state.session_active:
+            self.end_session()
 
-                self.stop_event.wait(timeout=poll_interval)
+        if self.wake_word_detector:
+            self.wake_word_detector.stop()
+            self.state.wake_word_active = False
 
-            logger.info("ActivityPoller stopped")
+        self.native_monitor.stop()
 
-        # JudgeWorker
-        def judge_worker_loop():
-            logger.info("JudgeWorker started")
-            judge_interval = self.config["judge_interval_sec"]
-            last_judged_activity_id = None
-            current_judgment = None
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._mic_executor.shutdown(wait=False, cancel_futures=True)
+        self._io_executor.shutdown(wait=True)
+        logger.info("AppController shut down")
 
-            while not self.stop_event.is_set():
-                try:
-                    # Judge if activity changed or on interval
-                    if self.current_activity:
-                        # Use a simple ID to track if activity changed
-                        current_activity_id = (
-                            f"{self.current_activity.app}:{self.current_activity.title}"
-                            if self.current_activity
-                            else None
-                        )
-
-                        # Only re-judge if activity changed
-                        if (
-                            last_judged_activity_id != current_activity_id
-                            or last_judged_activity_id is None
-                        ):
-                            current_judgment = self.judge.judge(
-                                goal=self.state.goal or "",
-                                activity=self.current_activity,
-                                history=self.activity_history,
-                                last_yell_time=self.last_yell_time,
-                                cooldown_seconds=self.config["cooldown_seconds"],
-                            )
-
-                            self.event_queue.put(
-                                {
-                                    "type": "judgment_update",
-                                    "judgment": current_judgment,
-                                }
-                            )
-
-                            last_judged_activity_id = current_activity_id
-
-                        # Update stats based on classification AND action
-                        if current_judgment:
-                            if current_judgment.action in ("warn", "yell"):
-                                self.state.stats.off_task_seconds += judge_interval
-                            elif current_judgment.classification == "on_task":
-                                self.state.stats.focus_seconds += judge_interval
-                                # Update focus streak
-                                self.state.stats.current_focus_streak_seconds += (
-                                    judge_interval
-                                )
-                                if (
-                                    self.state.stats.current_focus_streak_seconds
-                                    > self.state.stats.best_focus_streak_seconds
-                                ):
-                                    self.state.stats.best_focus_streak_seconds = (
-                                        self.state.stats.current_focus_streak_seconds
-                                    )
-                            elif current_judgment.classification == "thinking":
-                                self.state.stats.thinking_seconds += judge_interval
-                                # Thinking counts towards focus streak
-                                self.state.stats.current_focus_streak_seconds += (
-                                    judge_interval
-                                )
-                                if (
-                                    self.state.stats.current_focus_streak_seconds
-                                    > self.state.stats.best_focus_streak_seconds
-                                ):
-                                    self.state.stats.best_focus_streak_seconds = (
-                                        self.state.stats.current_focus_streak_seconds
-                                    )
-                            elif current_judgment.classification == "idle":
-                                self.state.stats.idle_seconds += judge_interval
-                                # Reset focus streak on idle
-                                self.state.stats.current_focus_streak_seconds = 0
-                            elif current_judgment.classification == "off_task":
-                                self.state.stats.off_task_seconds += judge_interval
-                                # Reset focus streak on off-task
-                                self.state.stats.current_focus_streak_seconds = 0
+    def _join_workers(self, timeout: float) -> None:
+        """
+        Join all live workers concurrently.
 
-                except Exception as e:
-                    logger.error(f"Error in JudgeWorker: {e}")
-                    self.event_queue.put(
-                        {"type": "error_event", "message": f"Judge error: {e}"}
-                    )
+        Shutdown waits at most ``timeout`` overall instead of ``timeout`` per
+        worker.
+
+        Args:
+            timeout: Seconds to wait for each worker
+        """
+        alive = {name: w for name, w in self.workers.items() if w.is_alive()}
+        if not alive:
+            return
 
-                self.stop_event.wait(timeout=judge_interval)
+        logger.info(f"Waiting for workers to stop: {', '.join(alive)}")
+        with ThreadPoolExecutor(
+            max_workers=len(alive), thread_name_prefix="join"
+        ) as executor:
+            list(executor.map(lambda w: w.join(timeout=timeout), alive.values()))
 
-            logger.info("JudgeWorker stopped")
+        for name, worker in alive.items():
+            if worker.is_alive():
+                logger.warning(f"Worker {name} did not stop within timeout")
 
+    def _start_workers(self):
+        """Start all worker threads."""
         # ReminderWorker
         reminder_worker = ReminderWorker(
-            intervals_sec=self.config["reminder_intervals_sec"],
+            intervals_sec=list(self.cfg.reminder_intervals_sec),
             event_queue=self.event_queue,
             stop_event=self.stop_event,
         )
 
         # Start worker threads
         self.workers["activity_poller"] = threading.Thread(
-            target=activity_poller_loop, daemon=True
+            target=self._activity_poller_loop, daemon=True
         )
         self.workers["judge_worker"] = threading.Thread(
-            target=judge_worker_loop, daemon=True
+            target=self._judge_worker_loop, daemon=True
+        )
+        self.workers["stats_worker"] = threading.Thread(
+            target=self._stats_worker_loop, daemon=True
         )
         self.workers["reminder_worker"] = threading.Thread(
             target=reminder_worker.run, daemon=True
@@ -1061,25 +1451,174 @@ class AppController:
             worker.start()
             logger.info(f"Started worker: {name}")
 
-    def get_state_snapshot(self) -> ControllerState:
+    def _activity_poller_loop(self) -> None:
+        """ActivityPoller: emit an activity_update whenever the activity changes."""
+        logger.info("ActivityPoller started")
+        # Loop-invariant lookups bound once
+        stop_event = self.stop_event
+        native_monitor = self.native_monitor
+        put = self.event_queue.append
+        poll_interval = self.cfg.poll_interval_sec
+        last_identity = None
+
+        while not stop_event.is_set():
+            try:
+                activity = native_monitor.get_current_activity()
+
+                # Only emit if activity changed (identity hashes app + title)
+                if activity.identity != last_identity:
+                    put({"type": "activity_update", "activity": activity})
+                    last_identity = activity.identity
+
+            except Exception as e:
+                logger.error("Error in ActivityPoller: %s", e)
+                put(
+                    {
+                        "type": "error_event",
+                        "message": f"Activity polling error: {e}",
+                    }
+                )
+
+            # Wakes early on an app switch; still polls every interval
+            # to catch window title changes, which have no notification
+            native_monitor.wait_for_change(timeout=poll_interval)
+
+        logger.info("ActivityPoller stopped")
+
+    def _judge_worker_loop(self) -> None:
+        """JudgeWorker: judge the current activity only when it changes."""
+        logger.info("JudgeWorker started")
+        # Loop-invariant lookups bound once
+        stop_event = self.stop_event
+        activity_changed = self._activity_changed
+        judge = self.judge
+        put = self.event_queue.append
+        cooldown_seconds = self.cfg.cooldown_seconds
+        last_judged_activity_id = None
+
+        while not stop_event.is_set():
+            activity_changed.wait()
+            # Let rapid switches / title flicker settle before judging
+            if stop_event.wait(timeout=JUDGE_DEBOUNCE_SEC):
+                break
+            activity_changed.clear()
+
+            try:
+                activity = self.current_activity
+                if not activity:
+                    continue
+
+                # Skip if the user flickered back to the last judged activity
+                current_activity_id = activity.identity
+                if current_activity_id == last_judged_activity_id:
+                    continue
+
+                judgment = judge.judge(
+                    goal=self.state.goal or "",
+                    activity=activity,
+                    history=list(self.activity_history),
+                    last_yell_time=self.last_yell_time,
+                    cooldown_seconds=cooldown_seconds,
+                )
+                put({"type": "judgment_update", "judgment": judgment})
+                last_judged_activity_id = current_activity_id
+
+            except Exception as e:
+                logger.error("Error in JudgeWorker: %s", e)
+                put({"type": "error_event", "message": f"Judge error: {e}"})
+
+        logger.info("JudgeWorker stopped")
+
+    def _stats_worker_loop(self) -> None:
+        """
+        StatsWorker: post one stats_tick event per judge interval.
+
+        The event thread credits each tick to the latest judgment, so stats
+        are only ever mutated there. Ticks carry the measured elapsed time in
+        whole seconds, with the sub-second remainder carried to the next tick,
+        so late wakeups under load don't drift the totals.
+        """
+        logger.info("StatsWorker started")
+        stop_event = self.stop_event
+        put = self.event_queue.append
+        judge_interval = self.cfg.judge_interval_sec
+        last_tick_ns = time.monotonic_ns()
+        carry_ns = 0
+
+        while not stop_event.wait(timeout=judge_interval):
+            now_ns = time.monotonic_ns()
+            seconds, carry_ns = divmod(now_ns - last_tick_ns + carry_ns, NS_PER_SEC)
+            last_tick_ns = now_ns
+            put({"type": "stats_tick", "seconds": seconds})
+
+        logger.info("StatsWorker stopped")
+
+    def _accumulate_stats(self, judgment: Judgment, seconds: float) -> None:
+        """
+        Credit elapsed session time to the bucket for a judgment.
+
+        Args:
+            judgment: Judgment in effect for the elapsed time
+            seconds: Elapsed time to credit
+        """
+        stats = self.state.stats
+        # A warning or yell counts as off-task whatever the classification
+        if judgment.action in ("warn", "yell"):
+            stats.off_task_seconds += seconds
+            return
+
+        entry = STATS_BUCKETS.get(judgment.classification)
+        if entry is None:
+            return
+        bucket, extends_streak = entry
+        setattr(stats, bucket, getattr(stats, bucket) + seconds)
+        if extends_streak:
+            stats.current_focus_streak_seconds += seconds
+            stats.best_focus_streak_seconds = max(
+                stats.best_focus_streak_seconds, stats.current_focus_streak_seconds
+            )
+        else:
+            stats.current_focus_streak_seconds = 0
+
+    def get_state_snapshot(self) -> StateSnapshot:
         """
         Get current state snapshot for UI rendering.
 
+        The snapshot is rebuilt only when the state has been assigned to since
+        the last call (or the judgment/pomodoro objects changed), so frequent
+        UI polling doesn't allocate a new one each time. It is frozen, so the
+        callers sharing it can't change it under each other.
+
         Returns:
-            ControllerState snapshot
+            StateSnapshot of the current state
         """
-        return ControllerState(
-            session_active=self.state.session_active,
-            goal=self.state.goal,
-            current_activity=self.state.current_activity,
-            last_judgment=self.state.last_judgment,
+        state = self.state
+        # Read before building: a concurrent update then just forces a rebuild
+        version = state._version
+        pomodoro_state = self.pomodoro.state if self.pomodoro else None
+        snapshot = self._snapshot
+        if (
+            snapshot is not None
+            and self._snapshot_version == version
+            and snapshot.last_judgment_obj is self.last_judgment
+            and snapshot.pomodoro_state is pomodoro_state
+        ):
+            return snapshot
+
+        snapshot = StateSnapshot(
+            session_active=state.session_active,
+            goal=state.goal,
+            current_activity=state.current_activity,
+            last_judgment=state.last_judgment,
             last_judgment_obj=self.last_judgment,
-            stats=self.state.stats,
-            pomodoro_state=self.pomodoro.state if self.pomodoro else None,
-            personality_name=self.state.personality_name,
-            wake_word=self.state.wake_word,
-            wake_word_active=self.state.wake_word_active,
+            stats=state.stats,
+            pomodoro_state=pomodoro_state,
+            personality_name=state.personality_name,
+            wake_word=state.wake_word,
+            wake_word_active=state.wake_word_active,
         )
+        self._snapshot, self._snapshot_version = snapshot, version
+        return snapshot
 
     def get_pomodoro_display(self) -> str:
         """Get pomodoro timer display string."""
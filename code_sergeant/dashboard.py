@@ -3,18 +3,23 @@
 A native macOS window for session management with modern dark theme
 and smooth animations for appearing/disappearing.
 """
+import contextlib
+import inspect
 import logging
-import threading
+import math
+import weakref
 from dataclasses import dataclass
-from typing import Callable, Optional
+from typing import Any, Callable, Dict, Iterator, Optional, Tuple
 
 logger = logging.getLogger("code_sergeant.dashboard")
 
 # Import PyObjC frameworks
 try:
     from AppKit import (
+        NSAnimationContext,
         NSApp,
         NSApplication,
+        NSApplicationDidChangeScreenParametersNotification,
         NSBackingStoreBuffered,
         NSBezelStyleRounded,
         NSBox,
@@ -24,12 +29,16 @@ try:
         NSColor,
         NSFocusRingTypeNone,
         NSFont,
+        NSFontAttributeName,
+        NSForegroundColorAttributeName,
         NSImage,
         NSLayoutAttributeHeight,
         NSLayoutAttributeWidth,
         NSLeftTextAlignment,
         NSLineBreakByTruncatingTail,
         NSMakeRect,
+        NSMutableParagraphStyle,
+        NSParagraphStyleAttributeName,
         NSProgressIndicator,
         NSProgressIndicatorStyleBar,
         NSRoundedBezelStyle,
@@ -41,16 +50,31 @@ try:
         NSUserInterfaceLayoutOrientationVertical,
         NSView,
         NSViewHeightSizable,
+        NSViewLayerContentsRedrawOnSetNeedsDisplay,
         NSViewWidthSizable,
         NSWindow,
         NSWindowStyleMaskClosable,
         NSWindowStyleMaskMiniaturizable,
         NSWindowStyleMaskTitled,
     )
-    from Foundation import NSDefaultRunLoopMode, NSObject, NSRunLoop, NSTimer
+    from Foundation import (
+        NSDefaultRunLoopMode,
+        NSMutableAttributedString,
+        NSNotificationCenter,
+        NSObject,
+        NSRunLoop,
+        NSTimer,
+        NSValue,
+    )
     from Quartz import (
         CABasicAnimation,
+        CAMediaTimingFunction,
         CATransaction,
+        CATransform3DConcat,
+        CATransform3DIdentity,
+        CATransform3DMakeScale,
+        CATransform3DMakeTranslation,
+        kCAFillModeForwards,
         kCAMediaTimingFunctionEaseInEaseOut,
     )
 
@@ -61,6 +85,69 @@ except ImportError as e:
     logger.warning(f"PyObjC not available for dashboard: {e}")
 
 
+@contextlib.contextmanager
+def _batched_ui_changes() -> Iterator[None]:
+    """Commit the layer changes made in the block as one transaction, unanimated."""
+    CATransaction.begin()
+    CATransaction.setDisableActions_(True)
+    try:
+        yield
+    finally:
+        CATransaction.commit()
+
+
+# Fixed text around the two counts in the stats label
+STATS_FOCUS_PREFIX = "Focus: "
+STATS_DISTRACTIONS_PREFIX = " min | Distractions: "
+
+
+def _set_string(control, value: str):
+    """
+    Set a control's string value, skipping the write if it already matches.
+
+    Every setter marks the view dirty and schedules a display pass, even
+    when the value is unchanged.
+
+    Args:
+        control: NSControl to update
+        value: New string value
+    """
+    if control.stringValue() != value:
+        control.setStringValue_(value)
+
+
+def _set_enabled(control, enabled: bool):
+    """
+    Enable or disable a control, skipping the write if it already matches.
+
+    Args:
+        control: NSControl to update
+        enabled: New enabled state
+    """
+    if control.isEnabled() != enabled:
+        control.setEnabled_(enabled)
+
+
+def _callback_ref(callback: Optional[Callable]) -> Callable[[], Optional[Callable]]:
+    """
+    Hold a callback without keeping its owner alive.
+
+    Bound methods are held through a WeakMethod, so the dashboard doesn't pin
+    the object that owns it (the menu bar app passes its own methods). Other
+    callables are held strongly, since nothing else may reference them.
+
+    Args:
+        callback: Callback to hold, or None
+
+    Returns:
+        Zero-argument function returning the callback, or None once its owner
+        has been collected
+    """
+    if inspect.ismethod(callback):
+        return weakref.WeakMethod(callback)
+    return lambda: callback
+
+
 @dataclass
 class DashboardConfig:
     """Configuration for the dashboard window."""
@@ -69,6 +156,8 @@ class DashboardConfig:
     window_height: int = 480
     corner_radius: float = 12.0
     animation_duration: float = 0.3
+    # Content scale at the end of the suck animation
+    suck_scale: float = 0.02
 
     # Colors (dark theme)
     bg_color: tuple = (0.12, 0.12, 0.14, 1.0)  # Dark gray
@@ -78,6 +167,7 @@ class DashboardConfig:
     input_bg: tuple = (0.18, 0.18, 0.20, 1.0)  # Slightly lighter
     button_bg: tuple = (0.25, 0.5, 0.95, 1.0)  # Blue button
     button_secondary: tuple = (0.25, 0.25, 0.28, 1.0)  # Gray button
+    error_bg: tuple = (0.5, 0.2, 0.2, 1.0)  # Goal field flash on empty goal
 
 
 class DashboardWindow:
@@ -100,9 +190,13 @@ class DashboardWindow:
             on_start_session: Callback when session starts (goal, work_minutes, break_minutes)
             on_end_session: Callback when session ends
         """
+        # The window and its subviews are built on first show, which is at
+        # startup unless dashboard.show_on_startup is off (see _ensure_built)
+        self.window = None
+        self._built = False
+
         if not PYOBJC_AVAILABLE:
             logger.error("PyObjC not available - dashboard disabled")
-            self.window = None
             return
 
         self.config = DashboardConfig()
@@ -111,33 +205,136 @@ class DashboardWindow:
 
         # State
         self.is_session_active = False
-        self._original_frame = None
-
-        # UI elements (stored for updates)
-        self._goal_field: Optional[NSTextField] = None
-        self._work_slider: Optional[NSSlider] = None
-        self._break_slider: Optional[NSSlider] = None
-        self._work_label: Optional[NSTextField] = None
-        self._break_label: Optional[NSTextField] = None
-        self._start_button: Optional[NSButton] = None
-        self._end_button: Optional[NSButton] = None
-        self._stats_label: Optional[NSTextField] = None
-        self._status_label: Optional[NSTextField] = None
-
-        # Create window
-        self._create_window()
-        logger.info("Dashboard window created")
+        # Slider values last shown in the duration labels
+        self._work_minutes = 25
+        self._break_minutes = 5
+
+        # NSColor/NSFont instances shared by every subview (see _color/_font)
+        self._colors: Dict[tuple, NSColor] = {}
+        self._fonts: Dict[Tuple[float, bool], NSFont] = {}
+
+        # Window frames for the current screen (see _frames); dropped when
+        # the display configuration changes
+        self._cached_frames: Optional[Dict[str, Any]] = None
+        self._screen_observer = None
+
+        # UI elements (stored for updates); all exist once _built is set, so
+        # methods check _built once instead of testing each widget
+        self._goal_field: NSTextField
+        self._work_slider: NSSlider
+        self._break_slider: NSSlider
+        self._work_label: NSTextField
+        self._break_label: NSTextField
+        self._start_button: NSButton
+        self._end_button: NSButton
+        self._stats_label: NSTextField
+        self._status_label: NSTextField
+        # Styled stats text that _show_stats_counts edits in place
+        self._stats_text: NSMutableAttributedString
+
+        # Last (focus_minutes, distractions, status) shown by update_stats
+        self._last_stats: Optional[tuple] = None
+        # Length of the focus and distraction counts in the stats text
+        self._stats_digits = (1, 1)
+
+    @property
+    def on_start_session(self) -> Optional[Callable[[str, int, int], None]]:
+        """Callback when a session starts (goal, work_minutes, break_minutes)."""
+        return self._on_start_session()
+
+    @on_start_session.setter
+    def on_start_session(self, callback: Optional[Callable[[str, int, int], None]]):
+        self._on_start_session = _callback_ref(callback)
+
+    @property
+    def on_end_session(self) -> Optional[Callable[[], None]]:
+        """Callback when a session ends."""
+        return self._on_end_session()
+
+    @on_end_session.setter
+    def on_end_session(self, callback: Optional[Callable[[], None]]):
+        self._on_end_session = _callback_ref(callback)
+
+    def _ensure_built(self) -> bool:
+        """
+        Build the window and its subviews on first use.
+
+        The menu bar app shows the dashboard on its first tick by default, but
+        with dashboard.show_on_startup off, runs driven from the menu alone
+        never allocate it. State recorded before the first show (session
+        flag, stats) is applied to the new controls.
+
+        Returns:
+            True if the window exists
+        """
+        if not self._built and PYOBJC_AVAILABLE:
+            self._create_window()
+            self._observe_screen_changes()
+            self._built = True
+            logger.info("Dashboard window created")
+
+            self._update_session_ui()
+            stats, self._last_stats = self._last_stats, None
+            if stats:
+                self.update_stats(*stats)
+        return self.window is not None
+
+    def _observe_screen_changes(self):
+        """Invalidate the cached animation frames when displays change."""
+        try:
+            center = NSNotificationCenter.defaultCenter()
+            self._screen_observer = center.addObserverForName_object_queue_usingBlock_(
+                NSApplicationDidChangeScreenParametersNotification,
+                None,
+                None,
+                self._screen_parameters_changed,
+            )
+        except Exception as e:
+            logger.warning(f"Screen change notifications unavailable: {e}")
+
+    def stop(self):
+        """Unsubscribe from display change notifications (e.g. on quit)."""
+        observer, self._screen_observer = self._screen_observer, None
+        if observer is None:
+            return
+
+        try:
+            NSNotificationCenter.defaultCenter().removeObserver_(observer)
+        except Exception as e:
+            logger.warning(f"Error removing screen change observer: {e}")
+
+    def _screen_parameters_changed(self, _notification):
+        """Drop frames computed for the previous display configuration."""
+        self._cached_frames = None
+
+    def _frames(self) -> Dict[str, Any]:
+        """
+        Get the window's frames for the main screen.
+
+        Frames are kept on whole points so layers aren't resampled across
+        pixel boundaries.
+
+        Returns:
+            Dict with "center" (the full-size centered frame)
+        """
+        frames = self._cached_frames
+        if frames is None:
+            screen_frame = NSScreen.mainScreen().frame()
+            width, height = self.config.window_width, self.config.window_height
+            frames = self._cached_frames = {
+                "center": NSMakeRect(
+                    math.floor((screen_frame.size.width - width) / 2),
+                    math.floor((screen_frame.size.height - height) / 2),
+                    width,
+                    height,
+                ),
+            }
+        return frames
 
     def _create_window(self):
         """Create the main dashboard window."""
-        # Calculate center position
-        screen = NSScreen.mainScreen()
-        screen_frame = screen.frame()
-        x = (screen_frame.size.width - self.config.window_width) / 2
-        y = (screen_frame.size.height - self.config.window_height) / 2
-
-        # Create window
-        frame = NSMakeRect(x, y, self.config.window_width, self.config.window_height)
+        # Create window, centered
+        frame = self._frames()["center"]
         style = (
             NSWindowStyleMaskTitled
             | NSWindowStyleMaskClosable
@@ -152,16 +349,41 @@ class DashboardWindow:
         self.window.setBackgroundColor_(self._color(self.config.bg_color))
         self.window.setTitlebarAppearsTransparent_(True)
         self.window.setMovableByWindowBackground_(True)
+        # Background alpha is 1.0, so the window can skip blending
+        self.window.setOpaque_(True)
 
-        # Store original frame for animations
-        self._original_frame = frame
+        # Layer-back the content so the show/hide animations reuse cached layer
+        # contents instead of redrawing every frame; subviews inherit it
+        content_view = self.window.contentView()
+        content_view.setWantsLayer_(True)
+        content_view.setLayerContentsRedrawPolicy_(
+            NSViewLayerContentsRedrawOnSetNeedsDisplay
+        )
+        layer = content_view.layer()
+        layer.setBackgroundColor_(self._color(self.config.bg_color).CGColor())
+        layer.setOpaque_(True)
 
         # Create content
         self._create_content()
 
     def _color(self, rgba: tuple) -> NSColor:
-        """Create NSColor from RGBA tuple."""
-        return NSColor.colorWithRed_green_blue_alpha_(*rgba)
+        """Get the NSColor for an RGBA tuple, creating it on first use."""
+        color = self._colors.get(rgba)
+        if color is None:
+            color = self._colors[rgba] = NSColor.colorWithRed_green_blue_alpha_(*rgba)
+        return color
+
+    def _font(self, size: float, bold: bool = False) -> NSFont:
+        """Get the system font at size, creating it on first use."""
+        key = (size, bold)
+        font = self._fonts.get(key)
+        if font is None:
+            font = self._fonts[key] = (
+                NSFont.boldSystemFontOfSize_(size)
+                if bold
+                else NSFont.systemFontOfSize_(size)
+            )
+        return font
 
     def _create_label(
         self,
@@ -179,11 +401,7 @@ class DashboardWindow:
         label.setEditable_(False)
         label.setSelectable_(False)
 
-        if bold:
-            label.setFont_(NSFont.boldSystemFontOfSize_(size))
-        else:
-            label.setFont_(NSFont.systemFontOfSize_(size))
-
+        label.setFont_(self._font(size, bold))
         label.setTextColor_(self._color(color or self.config.text_color))
         label.setAlignment_(alignment)
 
@@ -199,7 +417,7 @@ class DashboardWindow:
         field.setDrawsBackground_(True)
         field.setBackgroundColor_(self._color(self.config.input_bg))
         field.setTextColor_(self._color(self.config.text_color))
-        field.setFont_(NSFont.systemFontOfSize_(14))
+        field.setFont_(self._font(14))
         field.setFocusRingType_(NSFocusRingTypeNone)
 
         return field
@@ -209,7 +427,7 @@ class DashboardWindow:
         button = NSButton.alloc().init()
         button.setTitle_(title)
         button.setBezelStyle_(NSBezelStyleRounded)
-        button.setFont_(NSFont.boldSystemFontOfSize_(14))
+        button.setFont_(self._font(14, bold=True))
 
         # Note: Button colors are handled by the system in modern macOS
         # For custom colors, would need to use NSButtonCell or layer-backed views
@@ -219,49 +437,58 @@ class DashboardWindow:
     def _create_slider(
         self, min_val: float, max_val: float, default: float
     ) -> NSSlider:
-        """Create a styled slider."""
+        """Create a styled slider that snaps to whole minutes."""
         slider = NSSlider.alloc().init()
         slider.setMinValue_(min_val)
         slider.setMaxValue_(max_val)
         slider.setFloatValue_(default)
         slider.setContinuous_(True)
+        # One tick per minute; AppKit snaps the value, so a drag across a
+        # single minute reports the same integral value
+        slider.setNumberOfTickMarks_(int(max_val - min_val) + 1)
+        slider.setAllowsTickMarkValuesOnly_(True)
+        slider.setAltIncrementValue_(1.0)
 
         return slider
 
     def _create_content(self):
         """Create all dashboard content."""
+        with _batched_ui_changes():
+            self._build_content()
+
+    def _build_content(self):
+        """Build and attach the dashboard subviews."""
         content_view = self.window.contentView()
 
         # Padding
         padding = 24
+        inner_width = self.config.window_width - 2 * padding
         y_offset = self.config.window_height - 60  # Start below title bar
 
+        # Frames are computed up front and the views attached in one
+        # setSubviews_ call at the end, so AppKit invalidates layout once
+        subviews = []
+
         # === Title ===
         title = self._create_label("⚔️ Code Sergeant", size=22, bold=True)
-        title.setFrame_(
-            NSMakeRect(padding, y_offset, self.config.window_width - 2 * padding, 30)
-        )
+        title.setFrame_(NSMakeRect(padding, y_offset, inner_width, 30))
         title.setAlignment_(NSCenterTextAlignment)
-        content_view.addSubview_(title)
+        subviews.append(title)
         y_offset -= 50
 
         # === Goal Section ===
         goal_label = self._create_label(
             "What's your focus goal?", size=13, color=self.config.secondary_text
         )
-        goal_label.setFrame_(
-            NSMakeRect(padding, y_offset, self.config.window_width - 2 * padding, 20)
-        )
-        content_view.addSubview_(goal_label)
+        goal_label.setFrame_(NSMakeRect(padding, y_offset, inner_width, 20))
+        subviews.append(goal_label)
         y_offset -= 40
 
         self._goal_field = self._create_text_field(
             "Enter your goal for this session..."
         )
-        self._goal_field.setFrame_(
-            NSMakeRect(padding, y_offset, self.config.window_width - 2 * padding, 32)
-        )
-        content_view.addSubview_(self._goal_field)
+        self._goal_field.setFrame_(NSMakeRect(padding, y_offset, inner_width, 32))
+        subviews.append(self._goal_field)
         y_offset -= 50
 
         # === Work Duration ===
@@ -269,23 +496,23 @@ class DashboardWindow:
             "Work Duration", size=13, color=self.config.secondary_text
         )
         work_header.setFrame_(NSMakeRect(padding, y_offset, 150, 20))
-        content_view.addSubview_(work_header)
+        subviews.append(work_header)
 
-        self._work_label = self._create_label("25 min", size=13, bold=True)
+        self._work_label = self._create_label(
+            f"{self._work_minutes} min", size=13, bold=True
+        )
         self._work_label.setFrame_(
             NSMakeRect(self.config.window_width - padding - 60, y_offset, 60, 20)
         )
         self._work_label.setAlignment_(NSCenterTextAlignment)
-        content_view.addSubview_(self._work_label)
+        subviews.append(self._work_label)
         y_offset -= 30
 
-        self._work_slider = self._create_slider(15, 60, 25)
-        self._work_slider.setFrame_(
-            NSMakeRect(padding, y_offset, self.config.window_width - 2 * padding, 24)
-        )
+        self._work_slider = self._create_slider(15, 60, self._work_minutes)
+        self._work_slider.setFrame_(NSMakeRect(padding, y_offset, inner_width, 24))
         self._work_slider.setTarget_(self)
         self._work_slider.setAction_(b"workSliderChanged:")
-        content_view.addSubview_(self._work_slider)
+        subviews.append(self._work_slider)
         y_offset -= 40
 
         # === Break Duration ===
@@ -293,52 +520,47 @@ class DashboardWindow:
             "Break Duration", size=13, color=self.config.secondary_text
         )
         break_header.setFrame_(NSMakeRect(padding, y_offset, 150, 20))
-        content_view.addSubview_(break_header)
+        subviews.append(break_header)
 
-        self._break_label = self._create_label("5 min", size=13, bold=True)
+        self._break_label = self._create_label(
+            f"{self._break_minutes} min", size=13, bold=True
+        )
         self._break_label.setFrame_(
             NSMakeRect(self.config.window_width - padding - 60, y_offset, 60, 20)
         )
         self._break_label.setAlignment_(NSCenterTextAlignment)
-        content_view.addSubview_(self._break_label)
+        subviews.append(self._break_label)
         y_offset -= 30
 
-        self._break_slider = self._create_slider(5, 15, 5)
-        self._break_slider.setFrame_(
-            NSMakeRect(padding, y_offset, self.config.window_width - 2 * padding, 24)
-        )
+        self._break_slider = self._create_slider(5, 15, self._break_minutes)
+        self._break_slider.setFrame_(NSMakeRect(padding, y_offset, inner_width, 24))
         self._break_slider.setTarget_(self)
         self._break_slider.setAction_(b"breakSliderChanged:")
-        content_view.addSubview_(self._break_slider)
+        subviews.append(self._break_slider)
         y_offset -= 50
 
         # === Separator ===
         separator = NSBox.alloc().init()
         separator.setBoxType_(NSBoxSeparator)
-        separator.setFrame_(
-            NSMakeRect(padding, y_offset, self.config.window_width - 2 * padding, 1)
-        )
-        content_view.addSubview_(separator)
+        separator.setFrame_(NSMakeRect(padding, y_offset, inner_width, 1))
+        subviews.append(separator)
         y_offset -= 30
 
         # === Status Label ===
         self._status_label = self._create_label("Ready to focus", size=14)
-        self._status_label.setFrame_(
-            NSMakeRect(padding, y_offset, self.config.window_width - 2 * padding, 20)
-        )
+        self._status_label.setFrame_(NSMakeRect(padding, y_offset, inner_width, 20))
         self._status_label.setAlignment_(NSCenterTextAlignment)
-        content_view.addSubview_(self._status_label)
+        subviews.append(self._status_label)
         y_offset -= 30
 
         # === Stats Label ===
         self._stats_label = self._create_label(
             "", size=12, color=self.config.secondary_text
         )
-        self._stats_label.setFrame_(
-            NSMakeRect(padding, y_offset, self.config.window_width - 2 * padding, 40)
-        )
+        self._stats_label.setFrame_(NSMakeRect(padding, y_offset, inner_width, 40))
         self._stats_label.setAlignment_(NSCenterTextAlignment)
-        content_view.addSubview_(self._stats_label)
+        subviews.append(self._stats_label)
+        self._stats_text = self._create_stats_text()
         y_offset -= 60
 
         # === Buttons ===
@@ -350,7 +572,7 @@ class DashboardWindow:
         self._start_button.setFrame_(NSMakeRect(padding, y_offset, button_width, 40))
         self._start_button.setTarget_(self)
         self._start_button.setAction_(b"startSession:")
-        content_view.addSubview_(self._start_button)
+        subviews.append(self._start_button)
 
         self._end_button = self._create_button(
             "End Session", "endSession:", primary=False
@@ -361,98 +583,87 @@ class DashboardWindow:
         self._end_button.setTarget_(self)
         self._end_button.setAction_(b"endSession:")
         self._end_button.setEnabled_(False)
-        content_view.addSubview_(self._end_button)
+        subviews.append(self._end_button)
+
+        content_view.setSubviews_(subviews)
 
     # === Action Methods ===
 
     def workSliderChanged_(self, sender):
         """Handle work duration slider change."""
-        value = int(sender.floatValue())
-        if self._work_label:
+        value = sender.intValue()
+        # Continuous sliders fire per pixel of drag; only minute changes matter
+        if value != self._work_minutes:
+            self._work_minutes = value
             self._work_label.setStringValue_(f"{value} min")
 
     def breakSliderChanged_(self, sender):
         """Handle break duration slider change."""
-        value = int(sender.floatValue())
-        if self._break_label:
+        value = sender.intValue()
+        if value != self._break_minutes:
+            self._break_minutes = value
             self._break_label.setStringValue_(f"{value} min")
 
     def startSession_(self, sender):
         """Handle start session button click."""
-        if not self._goal_field:
-            return
-
         goal = self._goal_field.stringValue()
         if not goal or not goal.strip():
             # Flash the field or show error
-            self._goal_field.setBackgroundColor_(self._color((0.5, 0.2, 0.2, 1.0)))
-
-            # Reset after delay
-            def reset_color():
-                if self._goal_field:
-                    self._goal_field.setBackgroundColor_(
-                        self._color(self.config.input_bg)
-                    )
-
-            threading.Timer(0.5, reset_color).start()
+            self._goal_field.setBackgroundColor_(self._color(self.config.error_bg))
+            self._run_later(0.5, self._reset_goal_color)
             return
 
-        work_minutes = int(self._work_slider.floatValue()) if self._work_slider else 25
-        break_minutes = (
-            int(self._break_slider.floatValue()) if self._break_slider else 5
-        )
+        work_minutes = self._work_minutes
+        break_minutes = self._break_minutes
 
         # Update UI state
         self.is_session_active = True
         self._update_session_ui()
 
         # Callback
-        if self.on_start_session:
-            self.on_start_session(goal.strip(), work_minutes, break_minutes)
+        callback = self.on_start_session
+        if callback:
+            callback(goal.strip(), work_minutes, break_minutes)
 
         logger.info(
             f"Session started: goal='{goal}', work={work_minutes}min, break={break_minutes}min"
         )
 
+    def _reset_goal_color(self):
+        """Restore the goal field background after the empty-goal flash."""
+        self._goal_field.setBackgroundColor_(self._color(self.config.input_bg))
+
     def endSession_(self, sender):
         """Handle end session button click."""
         self.is_session_active = False
         self._update_session_ui()
 
-        if self.on_end_session:
-            self.on_end_session()
+        callback = self.on_end_session
+        if callback:
+            callback()
 
         logger.info("Session ended from dashboard")
 
     def _update_session_ui(self):
         """Update UI based on session state."""
-        if self.is_session_active:
-            if self._start_button:
-                self._start_button.setEnabled_(False)
-            if self._end_button:
-                self._end_button.setEnabled_(True)
-            if self._goal_field:
-                self._goal_field.setEditable_(False)
-            if self._work_slider:
-                self._work_slider.setEnabled_(False)
-            if self._break_slider:
-                self._break_slider.setEnabled_(False)
-            if self._status_label:
-                self._status_label.setStringValue_("🟢 Session Active")
-        else:
-            if self._start_button:
-                self._start_button.setEnabled_(True)
-            if self._end_button:
-                self._end_button.setEnabled_(False)
-            if self._goal_field:
-                self._goal_field.setEditable_(True)
-                self._goal_field.setStringValue_("")
-            if self._work_slider:
-                self._work_slider.setEnabled_(True)
-            if self._break_slider:
-                self._break_slider.setEnabled_(True)
-            if self._status_label:
-                self._status_label.setStringValue_("Ready to focus")
+        if not self._built:
+            return
+        with _batched_ui_changes():
+            self._apply_session_ui()
+
+    def _apply_session_ui(self):
+        """Set each control's enabled state and text for the session state."""
+        active = self.is_session_active
+        for control in (self._work_slider, self._break_slider, self._start_button):
+            _set_enabled(control, not active)
+        _set_enabled(self._end_button, active)
+        if self._goal_field.isEditable() == active:
+            self._goal_field.setEditable_(not active)
+        if not active:
+            _set_string(self._goal_field, "")
+        _set_string(
+            self._status_label, "🟢 Session Active" if active else "Ready to focus"
+        )
 
     def update_stats(self, focus_minutes: int, distractions: int, status: str = None):
         """
@@ -463,12 +674,57 @@ class DashboardWindow:
             distractions: Number of distractions
             status: Optional status string
         """
-        if self._stats_label:
-            self._stats_label.setStringValue_(
-                f"Focus: {focus_minutes} min | Distractions: {distractions}"
-            )
-        if status and self._status_label:
-            self._status_label.setStringValue_(status)
+        # Called on a timer; most ticks repeat the previous values
+        stats = (focus_minutes, distractions, status)
+        last = self._last_stats or (None, None, None)
+        if stats == last:
+            return
+        self._last_stats = stats
+        if not self._built:
+            return
+
+        if stats[:2] != last[:2]:
+            self._show_stats_counts(focus_minutes, distractions)
+        if status:
+            _set_string(self._status_label, status)
+
+    def _create_stats_text(self):
+        """Build the styled stats text that _show_stats_counts edits in place."""
+        paragraph = NSMutableParagraphStyle.alloc().init()
+        paragraph.setAlignment_(NSCenterTextAlignment)
+        attributes = {
+            NSFontAttributeName: self._font(12),
+            NSForegroundColorAttributeName: self._color(self.config.secondary_text),
+            NSParagraphStyleAttributeName: paragraph,
+        }
+        self._stats_digits = (1, 1)
+        return NSMutableAttributedString.alloc().initWithString_attributes_(
+            f"{STATS_FOCUS_PREFIX}0{STATS_DISTRACTIONS_PREFIX}0", attributes
+        )
+
+    def _show_stats_counts(self, focus_minutes: int, distractions: int):
+        """
+        Write new counts into the stats text and show it.
+
+        Only the two number spans are replaced; they inherit the existing
+        font, color and alignment instead of the label re-styling a fresh
+        string each tick.
+
+        Args:
+            focus_minutes: Minutes of focus time
+            distractions: Number of distractions
+        """
+        focus, distracted = str(focus_minutes), str(distractions)
+        focus_start = len(STATS_FOCUS_PREFIX)
+        distractions_start = focus_start + len(focus) + len(STATS_DISTRACTIONS_PREFIX)
+        self._stats_text.replaceCharactersInRange_withString_(
+            (focus_start, self._stats_digits[0]), focus
+        )
+        self._stats_text.replaceCharactersInRange_withString_(
+            (distractions_start, self._stats_digits[1]), distracted
+        )
+        self._stats_digits = (len(focus), len(distracted))
+        self._stats_label.setAttributedStringValue_(self._stats_text)
 
     # === Window Management ===
 
@@ -479,13 +735,14 @@ class DashboardWindow:
         Args:
             animate: Whether to animate the appearance
         """
-        if not self.window:
+        if not self._ensure_built():
             return
 
         if animate:
             self._animate_unsuck()
         else:
-            self.window.center()
+            self.window.setAlphaValue_(1.0)
+            self.window.setFrame_display_(self._frames()["center"], False)
             self.window.makeKeyAndOrderFront_(None)
             NSApp.activateIgnoringOtherApps_(True)
 
@@ -509,57 +766,100 @@ class DashboardWindow:
         if not self.window:
             return
 
-        # Get target position (top-right, near menu bar)
-        screen = NSScreen.mainScreen()
-        screen_frame = screen.frame()
-        target_x = screen_frame.size.width - 50
-        target_y = screen_frame.size.height - 30
+        # Shrink the content toward the menu bar corner, hiding once finished
+        self._animate_content(shrink=True, on_done=self._hide_after_suck)
 
-        # Store current frame for later
-        self._original_frame = self.window.frame()
+        logger.debug("Dashboard suck animation started")
 
-        # Animate to small size at menu bar position
-        target_frame = NSMakeRect(target_x, target_y, 10, 10)
+    def _hide_after_suck(self):
+        """Order the window out once the suck animation has finished."""
+        if self.window:
+            self.window.orderOut_(None)
 
-        self.window.setFrame_display_animate_(target_frame, True, True)
+    def _shrunk_transform(self):
+        """Transform scaling the content into its top-right (menu bar) corner."""
+        bounds = self.window.contentView().bounds()
+        scale = self.config.suck_scale
+        # Layer-backed view layers scale about their origin; translating by the
+        # shrunk-away size keeps the top-right corner fixed
+        return CATransform3DConcat(
+            CATransform3DMakeScale(scale, scale, 1.0),
+            CATransform3DMakeTranslation(
+                bounds.size.width * (1 - scale), bounds.size.height * (1 - scale), 0.0
+            ),
+        )
 
-        # Hide after animation
-        def hide_after():
-            if self.window:
-                self.window.orderOut_(None)
+    def _animate_content(
+        self, shrink: bool, on_done: Optional[Callable[[], None]] = None
+    ) -> None:
+        """
+        Scale the content layer in or out of the menu bar corner, fading the window.
 
-        threading.Timer(0.3, hide_after).start()
+        The window frame never changes, so nothing is resized, laid out or
+        redrawn per frame: Core Animation transforms the already-rendered
+        layer on the render server and the call returns immediately.
 
-        logger.debug("Dashboard suck animation started")
+        Args:
+            shrink: True to shrink away (hide), False to grow back (show)
+            on_done: Called on the main thread when the animation completes
+        """
+        layer = self.window.contentView().layer()
+        timing = CAMediaTimingFunction.functionWithName_(
+            kCAMediaTimingFunctionEaseInEaseOut
+        )
+        shrunk = NSValue.valueWithCATransform3D_(self._shrunk_transform())
+        identity = NSValue.valueWithCATransform3D_(CATransform3DIdentity)
+
+        animation = CABasicAnimation.animationWithKeyPath_("transform")
+        animation.setFromValue_(identity if shrink else shrunk)
+        animation.setToValue_(shrunk if shrink else identity)
+        animation.setDuration_(self.config.animation_duration)
+        animation.setTimingFunction_(timing)
+        # Hold the end state until the completion handler has run
+        animation.setFillMode_(kCAFillModeForwards)
+        animation.setRemovedOnCompletion_(False)
+
+        def animate(context):
+            context.setDuration_(self.config.animation_duration)
+            context.setTimingFunction_(timing)
+            layer.addAnimation_forKey_(animation, "suck")
+            self.window.animator().setAlphaValue_(0.0 if shrink else 1.0)
+
+        def finished():
+            if on_done:
+                on_done()
+            layer.removeAnimationForKey_("suck")
+
+        NSAnimationContext.runAnimationGroup_completionHandler_(animate, finished)
+
+    def _run_later(self, delay: float, callback: Callable[[], None]):
+        """
+        Run callback on the main run loop after delay seconds.
+
+        AppKit objects may only be touched on the main thread, so delayed UI
+        updates use an NSTimer rather than a background timer thread.
+
+        Args:
+            delay: Seconds to wait
+            callback: UI update to run
+        """
+        NSTimer.scheduledTimerWithTimeInterval_repeats_block_(
+            delay, False, lambda _timer: callback()
+        )
 
     def _animate_unsuck(self):
         """Animate window 'unsucking' from menu bar to center."""
         if not self.window:
             return
 
-        # Calculate center position
-        screen = NSScreen.mainScreen()
-        screen_frame = screen.frame()
-        center_x = (screen_frame.size.width - self.config.window_width) / 2
-        center_y = (screen_frame.size.height - self.config.window_height) / 2
-
-        # Start from small size at menu bar
-        start_x = screen_frame.size.width - 50
-        start_y = screen_frame.size.height - 30
-        start_frame = NSMakeRect(start_x, start_y, 10, 10)
-
-        # Target frame (centered)
-        target_frame = NSMakeRect(
-            center_x, center_y, self.config.window_width, self.config.window_height
-        )
-
-        # Set start position (no animation)
-        self.window.setFrame_display_(start_frame, False)
+        # Place the window centered at full size but transparent, then grow the
+        # content out of the menu bar corner as it fades in
+        self.window.setFrame_display_(self._frames()["center"], False)
+        self.window.setAlphaValue_(0.0)
         self.window.makeKeyAndOrderFront_(None)
         NSApp.activateIgnoringOtherApps_(True)
 
-        # Animate to center
-        self.window.setFrame_display_animate_(target_frame, True, True)
+        self._animate_content(shrink=False)
 
         logger.debug("Dashboard unsuck animation started")
 
@@ -571,14 +871,14 @@ class DashboardWindow:
 
     def set_goal(self, goal: str):
         """Set the goal text field value."""
-        if self._goal_field:
+        if self._ensure_built():
             self._goal_field.setStringValue_(goal)
 
     def get_goal(self) -> str:
         """Get the current goal text."""
-        if self._goal_field:
-            return self._goal_field.stringValue()
-        return ""
+        if not self._built:
+            return ""
+        return self._goal_field.stringValue()
 
 
 def create_dashboard(
@@ -75,7 +75,7 @@ class ActivityJudge:
             goal: User's stated goal
             activity: Current activity event
             history: Recent activity history
-            last_yell_time: Timestamp of last yell (for cooldown)
+            last_yell_time: time.monotonic() of last yell (for cooldown)
             cooldown_seconds: Cooldown period in seconds
 
         Returns:
@@ -111,7 +111,7 @@ class ActivityJudge:
 
             # Apply cooldown logic
             if judgment.action == "yell" and last_yell_time:
-                time_since_yell = time.time() - last_yell_time
+                time_since_yell = time.monotonic() - last_yell_time
                 if time_since_yell < cooldown_seconds:
                     logger.debug(
                         f"Suppressing yell due to cooldown ({time_since_yell:.1f}s < {cooldown_seconds}s)"
@@ -186,6 +186,10 @@ class ActivityJudge:
         """
         Judge using LLM with strict JSON contract.
 
+        With an AIClient, judgments are reused from its exact-input cache when
+        the user returns to the same goal, app and title; cooldown and
+        personality phrasing are applied by judge() on top.
+
         Args:
             goal: User's goal
             activity: Current activity
@@ -202,6 +206,13 @@ class ActivityJudge:
 
         # Use AIClient if available (preferred - uses OpenAI if configured)
         if self.ai_client:
+            # Three elements, so never equal to judge_activity()'s keys
+            key = (goal, activity.app, activity.title)
+            cached = self.ai_client.cached_judgment(key)
+            if cached is not None:
+                logger.debug(f"Reusing judgment for {activity.app}: {cached}")
+                return self._validate_judgment(cached, activity_context)
+
             try:
                 raw_output = self.ai_client.chat(
                     messages=[{"role": "user", "content": prompt}],
@@ -215,6 +226,7 @@ class ActivityJudge:
 
                 # Validate and create Judgment
                 judgment = self._validate_judgment(judgment_dict, activity_context)
+                self.ai_client.store_judgment(key, judgment_dict)
 
                 logger.debug(
                     f"LLM judgment: {judgment.classification} ({judgment.confidence:.0%})"
@@ -237,6 +249,7 @@ class ActivityJudge:
                     )
                     judgment_dict = self._parse_json_response(raw_output)
                     judgment = self._validate_judgment(judgment_dict, activity_context)
+                    self.ai_client.store_judgment(key, judgment_dict)
                     return judgment
                 except Exception as e2:
                     logger.error(f"Retry also failed: {e2}")
@@ -308,7 +308,7 @@ class CodeSergeantApp(rumps.App):
         # Only show yellow if not already off_task
         if action == "warn" and classification != "off_task":
             if self.current_status != "yellow":
-                self.yellow_flash_start_time = time.time()
+                self.yellow_flash_start_time = time.monotonic()
             self.current_status = "yellow"
             return
 
@@ -331,7 +331,7 @@ class CodeSergeantApp(rumps.App):
         """
         if self.current_status == "yellow" and self.yellow_flash_start_time:
             # Check if we should still flash (within duration)
-            elapsed = time.time() - self.yellow_flash_start_time
+            elapsed = time.monotonic() - self.yellow_flash_start_time
             if elapsed < self.yellow_flash_duration:
                 # Flash every 0.5 seconds (toggle on/off)
                 flash_interval = 0.5
@@ -351,12 +351,13 @@ class CodeSergeantApp(rumps.App):
     # === Dashboard Methods ===
 
     def _show_dashboard_on_startup(self):
-        """Show dashboard window on app startup (called once)."""
+        """Show dashboard window on app startup (called once) unless disabled."""
         if self._dashboard_shown_on_startup:
             return
         self._dashboard_shown_on_startup = True
 
-        if self.dashboard:
+        show = self.controller.config.get("dashboard", {}).get("show_on_startup", True)
+        if self.dashboard and show:
             self.dashboard.show(animate=True)
             logger.info("Dashboard shown on startup")
 
@@ -732,16 +733,14 @@ class CodeSergeantApp(rumps.App):
 
     def _on_quit(self, _):
         """Handle Quit menu item click."""
-        # End session if active
-        if self.controller.state.session_active:
-            self.controller.end_session()
+        # End session if active, stop wake word detector, flush config saves
+        self.controller.shutdown()
+
+        if self.dashboard:
+            self.dashboard.stop()
 
         # Stop timer
         self.timer.stop()
 
-        # Stop wake word detector
-        if self.controller.wake_word_detector:
-            self.controller.wake_word_detector.stop()
-
         # Quit app
         rumps.quit_application()
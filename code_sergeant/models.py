@@ -1,7 +1,7 @@
 """Data models for Code Sergeant."""
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Literal, Optional
+from typing import List, Literal, Optional, Tuple
 
 
 @dataclass
@@ -20,6 +20,11 @@ class ActivityEvent:
     idle_duration_seconds: float = 0.0
     is_thinking: bool = False  # Inferred from idle + no input but productive context
 
+    @property
+    def identity(self) -> Tuple[str, str]:
+        """(app, title), for loops that only care which activity this is."""
+        return (self.app, self.title)
+
 
 @dataclass
 class Judgment:
@@ -132,6 +137,10 @@ class PersonalityProfile:
         return profiles.get(name, profiles["sergeant"])
 
 
+# Pomodoro states that count as a break
+BREAK_STATES = frozenset(("short_break", "long_break"))
+
+
 @dataclass
 class PomodoroState:
     """State of the pomodoro timer."""
@@ -145,6 +154,30 @@ class PomodoroState:
     pomodoros_until_long_break: int = 4
     is_paused: bool = False
 
+    # Fields that change the period lengths in total_seconds
+    _DURATION_FIELDS = frozenset(
+        ("work_duration_minutes", "short_break_minutes", "long_break_minutes")
+    )
+
+    def __setattr__(self, name, value):
+        super().__setattr__(name, value)
+        # Durations are assigned directly by the UI/bridge; drop the cached table
+        if name in self._DURATION_FIELDS:
+            super().__setattr__("_totals", None)
+
+    @property
+    def total_seconds(self) -> int:
+        """Full length of the current period in seconds (0 when stopped)."""
+        totals = self.__dict__.get("_totals")
+        if totals is None:
+            totals = {
+                "work": self.work_duration_minutes * 60,
+                "short_break": self.short_break_minutes * 60,
+                "long_break": self.long_break_minutes * 60,
+            }
+            super().__setattr__("_totals", totals)
+        return totals.get(self.current_state, 0)
+
     def get_display_time(self) -> str:
         """Get formatted time for display (MM:SS)."""
         minutes = self.time_remaining_seconds // 60
@@ -155,6 +188,6 @@ class PomodoroState:
         """Get emoji for current state."""
         if self.current_state == "work":
             return "🍅"
-        elif self.current_state in ("short_break", "long_break"):
+        elif self.current_state in BREAK_STATES:
             return "☕"
         return ""
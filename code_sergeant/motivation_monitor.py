@@ -78,7 +78,7 @@ class MotivationMonitor:
         self.tts_service = tts_service
         self.check_interval = check_interval_minutes * 60  # Convert to seconds
 
-        # State tracking
+        # State tracking (times are time.monotonic())
         self.current_state: Optional[MotivationState] = None
         self.last_check_time: Optional[float] = None
         self.session_start_time: Optional[float] = None
@@ -107,7 +107,7 @@ class MotivationMonitor:
             goal: Session goal
         """
         self.goal = goal
-        self.session_start_time = time.time()
+        self.session_start_time = time.monotonic()
         self.last_check_time = None
         self.app_switches.clear()
         self.recent_apps.clear()
@@ -135,7 +135,7 @@ class MotivationMonitor:
             app_name: New app name
         """
         if app_name != self.last_app:
-            self.app_switches.append(time.time())
+            self.app_switches.append(time.monotonic())
             self.recent_apps.append(app_name)
             self.last_app = app_name
 
@@ -149,7 +149,7 @@ class MotivationMonitor:
         Returns:
             Number of switches
         """
-        cutoff = time.time() - window_seconds
+        cutoff = time.monotonic() - window_seconds
         return sum(1 for ts in self.app_switches if ts > cutoff)
 
     def _monitor_loop(self):
@@ -175,10 +175,10 @@ class MotivationMonitor:
         if not self.session_start_time:
             return
 
-        self.last_check_time = time.time()
+        self.last_check_time = time.monotonic()
 
         # Gather metrics
-        focus_minutes = int((time.time() - self.session_start_time) / 60)
+        focus_minutes = int((time.monotonic() - self.session_start_time) / 60)
         app_switches = self.get_recent_app_switches(300)  # Last 5 min
         recent_apps = list(self.recent_apps)[-5:] if self.recent_apps else []
 
@@ -420,7 +420,7 @@ class MotivationMonitor:
                 timestamp=datetime.now(),
             )
 
-        focus_minutes = int((time.time() - self.session_start_time) / 60)
+        focus_minutes = int((time.monotonic() - self.session_start_time) / 60)
         app_switches = self.get_recent_app_switches(300)
 
         state = self._detect_state_rules(focus_minutes, app_switches, idle_seconds)
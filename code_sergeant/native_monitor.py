@@ -7,8 +7,10 @@ import logging
 import os
 import subprocess
 import tempfile
+import threading
+import time
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional
 
 from .models import ActivityEvent
 
@@ -16,7 +18,7 @@ logger = logging.getLogger("code_sergeant.native_monitor")
 
 # Import macOS frameworks
 try:
-    from AppKit import NSWorkspace
+    from AppKit import NSWorkspace, NSWorkspaceDidActivateApplicationNotification
     from Quartz import (
         CGEventSourceSecondsSinceLastEventType,
         CGWindowListCopyWindowInfo,
@@ -79,6 +81,17 @@ class NativeMonitor:
     # AFK threshold: user is considered away after this
     AFK_THRESHOLD = 300  # 5 minutes
 
+    # How long a snapshot() result is reused across callers (seconds)
+    SNAPSHOT_TTL = 0.15
+
+    # Quiet period after an app switch so a burst of notifications (and
+    # window title flicker during the switch) yields one wakeup (seconds)
+    CHANGE_DEBOUNCE = 0.1
+
+    # How long the frontmost app's window title is reused while that app stays
+    # frontmost; the window list query is the expensive part of a poll (seconds)
+    TITLE_REFRESH_INTERVAL = 2.0
+
     def __init__(self):
         """Initialize native monitor."""
         if not MACOS_AVAILABLE:
@@ -86,8 +99,81 @@ class NativeMonitor:
 
         self.last_window_title: Optional[str] = None
         self.last_activity_time: Optional[datetime] = None
+
+        # (expires_at, snapshot) shared by concurrent pollers
+        self._snapshot_cache: Optional[tuple] = None
+        self._snapshot_lock = threading.Lock()
+
+        # (app, expires_at, title) for the frontmost app's window title
+        self._title_cache: Optional[tuple] = None
+
+        # Set by the app-activation observer (and wake()), see wait_for_change
+        self._changed = threading.Event()
+        self._app_observer = None
+        self._observe_app_changes()
         logger.info("NativeMonitor initialized")
 
+    def _observe_app_changes(self) -> None:
+        """
+        Subscribe to NSWorkspace app-activation notifications.
+
+        Notifications are delivered on the main run loop, so they only arrive
+        while one is running (e.g. under the menu bar app); otherwise
+        wait_for_change simply times out.
+        """
+        if not MACOS_AVAILABLE:
+            return
+
+        try:
+            center = NSWorkspace.sharedWorkspace().notificationCenter()
+            self._app_observer = center.addObserverForName_object_queue_usingBlock_(
+                NSWorkspaceDidActivateApplicationNotification,
+                None,
+                None,
+                lambda _notification: self._changed.set(),
+            )
+        except Exception as e:
+            logger.warning(f"App activation notifications unavailable: {e}")
+
+    def stop(self) -> None:
+        """Unsubscribe from app-activation notifications (e.g. on shutdown)."""
+        observer, self._app_observer = self._app_observer, None
+        if observer is None:
+            return
+
+        try:
+            center = NSWorkspace.sharedWorkspace().notificationCenter()
+            center.removeObserver_(observer)
+        except Exception as e:
+            logger.warning(f"Error removing app activation observer: {e}")
+
+    def wait_for_change(self, timeout: float) -> bool:
+        """
+        Block until the frontmost app changes or timeout elapses.
+
+        Window title changes within an app have no notification, so callers
+        should still poll when this times out.
+
+        Args:
+            timeout: Most seconds to wait
+
+        Returns:
+            True if woken by an app switch (or wake()), False on timeout
+        """
+        if not self._changed.wait(timeout):
+            return False
+
+        # Coalesce the burst, then make the next snapshot() re-query
+        time.sleep(self.CHANGE_DEBOUNCE)
+        self._changed.clear()
+        self._snapshot_cache = None
+        self._title_cache = None
+        return True
+
+    def wake(self) -> None:
+        """Interrupt a pending wait_for_change (e.g. on shutdown)."""
+        self._changed.set()
+
     def get_frontmost_app(self) -> str:
         """
         Get the currently active (frontmost) application name.
@@ -120,9 +206,27 @@ class NativeMonitor:
         if not MACOS_AVAILABLE:
             return ""
 
-        try:
-            frontmost_app = self.get_frontmost_app()
+        return self._get_window_title_for(self.get_frontmost_app())
 
+    def _cached_window_title(self, frontmost_app: str) -> str:
+        """
+        Window title for frontmost_app, re-queried every TITLE_REFRESH_INTERVAL.
+
+        An app switch (new frontmost_app, or an activation notification seen
+        by wait_for_change) always re-queries.
+        """
+        now = time.monotonic()
+        cached = self._title_cache
+        if cached and cached[0] == frontmost_app and cached[1] > now:
+            return cached[2]
+
+        title = self._get_window_title_for(frontmost_app)
+        self._title_cache = (frontmost_app, now + self.TITLE_REFRESH_INTERVAL, title)
+        return title
+
+    def _get_window_title_for(self, frontmost_app: str) -> str:
+        """Find the title of the first regular window owned by frontmost_app."""
+        try:
             # Get list of on-screen windows
             windows = CGWindowListCopyWindowInfo(
                 kCGWindowListOptionOnScreenOnly, kCGNullWindowID
@@ -180,7 +284,46 @@ class NativeMonitor:
         """
         if threshold_seconds is None:
             threshold_seconds = self.AFK_THRESHOLD
-        return self.get_idle_seconds() > threshold_seconds
+
+        # Reuse the idle time from a fresh snapshot rather than re-querying Quartz
+        cached = self._snapshot_cache
+        if cached and cached[0] > time.monotonic():
+            idle_seconds = cached[1]["idle_seconds"]
+        else:
+            idle_seconds = self.get_idle_seconds()
+        return idle_seconds > threshold_seconds
+
+    def snapshot(self) -> Dict[str, Any]:
+        """
+        Get frontmost app, window title and idle state in one pass.
+
+        The frontmost app is looked up once and shared with the window title
+        query, and the result is reused for SNAPSHOT_TTL so several pollers
+        hitting the bridge at once don't each cross into AppKit/Quartz.
+
+        Returns:
+            Dict with app, window_title, idle_seconds and is_idle
+        """
+        with self._snapshot_lock:
+            cached = self._snapshot_cache
+            if cached and cached[0] > time.monotonic():
+                return dict(cached[1])
+
+            if MACOS_AVAILABLE:
+                app = self.get_frontmost_app()
+                window_title = self._cached_window_title(app)
+            else:
+                app, window_title = "Unknown", ""
+            idle_seconds = self.get_idle_seconds()
+
+            snapshot = {
+                "app": app,
+                "window_title": window_title,
+                "idle_seconds": idle_seconds,
+                "is_idle": idle_seconds > self.AFK_THRESHOLD,
+            }
+            self._snapshot_cache = (time.monotonic() + self.SNAPSHOT_TTL, snapshot)
+            return dict(snapshot)
 
     def is_productive_app(self, app_name: str) -> bool:
         """
@@ -233,9 +376,9 @@ class NativeMonitor:
             )
 
         try:
-            # Get current app and window
+            # Get current app and window (title cached while the app is unchanged)
             app = self.get_frontmost_app()
-            title = self.get_active_window_title()
+            title = self._cached_window_title(app)
 
             # Get idle time
             idle_seconds = self.get_idle_seconds()
@@ -254,9 +397,10 @@ class NativeMonitor:
                 and self.is_productive_app(app)
             ):
                 is_thinking = True
-                logger.debug(
-                    f"Detected thinking state: idle {idle_seconds:.0f}s in {app}"
-                )
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        f"Detected thinking state: idle {idle_seconds:.0f}s in {app}"
+                    )
 
             # Calculate last input time
             last_input_time = self.last_activity_time
@@ -276,10 +420,12 @@ class NativeMonitor:
                 is_thinking=is_thinking,
             )
 
-            logger.debug(
-                f"Current activity: {app} — {title[:50] if title else 'No title'} "
-                f"(AFK: {is_afk}, thinking: {is_thinking}, idle: {idle_seconds:.0f}s)"
-            )
+            # Runs every poll: skip building the message unless it's logged
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    f"Current activity: {app} — {title[:50] if title else 'No title'} "
+                    f"(AFK: {is_afk}, thinking: {is_thinking}, idle: {idle_seconds:.0f}s)"
+                )
             return activity
 
         except Exception as e:
@@ -1,14 +1,20 @@
 """Personality system for Code Sergeant."""
+import functools
 import logging
 import random
-from typing import Any, Dict, List, Optional
-
-import ollama
+import re
+from typing import Any, Dict, List, Optional, Tuple
 
 from .models import Judgment, PersonalityProfile
 
 logger = logging.getLogger("code_sergeant.personality")
 
+# Variations generated per phrase type for a custom personality's phrase pool
+CUSTOM_PHRASE_POOL_SIZE = 5
+
+# Leading "1.", "2)", "-" or "*" on a generated line
+_LIST_MARKER = re.compile(r"^\s*(?:\d+[.)]|[-*•])\s*")
+
 
 # Predefined phrase templates for each personality
 PERSONALITY_PHRASES = {
@@ -232,13 +238,20 @@ class PersonalityManager:
         """
         self.config = config
         self.ollama_model = ollama_model
-        self.ollama_client = ollama.Client(host=ollama_base_url)
+        self.ollama_base_url = ollama_base_url
         self._current_profile: Optional[PersonalityProfile] = None
         self._load_profile()
         logger.info(
             f"PersonalityManager initialized with profile: {self._current_profile.name}"
         )
 
+    @functools.cached_property
+    def ollama_client(self):
+        """Ollama client, created (and the SDK imported) on first use."""
+        import ollama
+
+        return ollama.Client(host=self.ollama_base_url)
+
     def _load_profile(self):
         """Load personality profile from config."""
         personality_config = self.config.get("personality", {})
@@ -309,55 +322,109 @@ class PersonalityManager:
         # For custom personality or missing phrases, generate with LLM
         return self._generate_phrase(phrase_type, context)
 
-    def _generate_phrase(self, phrase_type: str, context: Dict[str, Any] = None) -> str:
+    def get_phrase_pool(self, phrase_type: str) -> Tuple[str, ...]:
         """
-        Generate a phrase using LLM for custom personalities.
+        Get every phrase get_phrase() may choose from, for callers that cache them.
+
+        Predefined personalities return their templates; custom personalities
+        get CUSTOM_PHRASE_POOL_SIZE variations generated with one LLM call, so
+        a cached pool still varies from one use to the next.
 
         Args:
-            phrase_type: Type of phrase to generate
-            context: Additional context
+            phrase_type: Type of phrase (off_task_drill, reminder, session_start, etc.)
 
         Returns:
-            Generated phrase
+            Candidate phrases, or () if generation failed or produced nothing
+            so the caller can use its own fallback and retry later
         """
+        phrases = PERSONALITY_PHRASES.get(self._current_profile.name, {}).get(
+            phrase_type
+        )
+        if phrases:
+            return tuple(phrases)
+
         try:
-            tone_str = (
-                ", ".join(self._current_profile.tone)
-                if self._current_profile.tone
-                else "neutral"
-            )
-            description = self._current_profile.description or "a helpful assistant"
-
-            phrase_instructions = {
-                "off_task_warning": "Generate a gentle warning for someone who got distracted.",
-                "off_task_yell": "Generate a firm reminder for someone who has been distracted for too long.",
-                "on_task": "Generate encouragement for someone who is focused and doing well.",
-                "thinking": "Generate acknowledgment for someone who is thinking/planning.",
-                "reminder": "Generate a reminder to take a break or stay hydrated.",
-                "session_start": "Generate an encouraging message to start a focus session.",
-                "session_end": "Generate a summary message for completing a focus session.",
-            }
-
-            instruction = phrase_instructions.get(
-                phrase_type, "Generate an appropriate response."
+            generated = self._generate_text(phrase_type, CUSTOM_PHRASE_POOL_SIZE)
+        except Exception as e:
+            logger.warning(f"Failed to generate phrases: {e}")
+            generated = ""
+
+        pool = []
+        for line in generated.splitlines():
+            # Drop list markers the model adds despite the instructions
+            phrase = _LIST_MARKER.sub("", line).strip().strip("\"'")
+            if phrase and phrase not in pool:
+                pool.append(phrase)
+        return tuple(pool[:CUSTOM_PHRASE_POOL_SIZE])
+
+    def _generate_text(self, phrase_type: str, count: int = 1) -> str:
+        """
+        Ask the LLM for count phrases of phrase_type in the current personality.
+
+        Args:
+            phrase_type: Type of phrase to generate
+            count: Number of variations, one per line
+
+        Returns:
+            Raw model response
+        """
+        tone_str = (
+            ", ".join(self._current_profile.tone)
+            if self._current_profile.tone
+            else "neutral"
+        )
+        description = self._current_profile.description or "a helpful assistant"
+
+        phrase_instructions = {
+            "off_task_warning": "Generate a gentle warning for someone who got distracted.",
+            "off_task_yell": "Generate a firm reminder for someone who has been distracted for too long.",
+            "on_task": "Generate encouragement for someone who is focused and doing well.",
+            "thinking": "Generate acknowledgment for someone who is thinking/planning.",
+            "reminder": "Generate a reminder to take a break or stay hydrated.",
+            "session_start": "Generate an encouraging message to start a focus session.",
+            "session_end": "Generate a summary message for completing a focus session.",
+        }
+
+        instruction = phrase_instructions.get(
+            phrase_type, "Generate an appropriate response."
+        )
+        if count > 1:
+            length = (
+                f"Write {count} different versions, one per line, with no "
+                "numbering. Keep each SHORT (1-2 sentences max, under 20 words)."
             )
+        else:
+            length = "Keep your response SHORT (1-2 sentences max, under 20 words)."
 
-            prompt = f"""You are {description}. Your tone is: {tone_str}.
+        prompt = f"""You are {description}. Your tone is: {tone_str}.
 
 {instruction}
 
-Keep your response SHORT (1-2 sentences max, under 20 words).
+{length}
 Respond in character only - no explanations, just the phrase.
 
 Response:"""
 
-            response = self.ollama_client.generate(
-                model=self.ollama_model,
-                prompt=prompt,
-                options={"temperature": 0.8, "num_predict": 50},
-            )
+        response = self.ollama_client.generate(
+            model=self.ollama_model,
+            prompt=prompt,
+            options={"temperature": 0.8, "num_predict": 50 * count},
+        )
+        return response.get("response", "")
 
-            phrase = response.get("response", "").strip()
+    def _generate_phrase(self, phrase_type: str, context: Dict[str, Any] = None) -> str:
+        """
+        Generate a phrase using LLM for custom personalities.
+
+        Args:
+            phrase_type: Type of phrase to generate
+            context: Additional context
+
+        Returns:
+            Generated phrase
+        """
+        try:
+            phrase = self._generate_text(phrase_type).strip()
             # Clean up any quotes
             phrase = phrase.strip("\"'")
 
@@ -5,7 +5,7 @@ import time
 from dataclasses import asdict
 from typing import Any, Callable, Dict, Optional
 
-from .models import PomodoroState
+from .models import BREAK_STATES, PomodoroState
 
 logger = logging.getLogger("code_sergeant.pomodoro")
 
@@ -162,7 +162,7 @@ class PomodoroTimer:
         current = self.state.current_state
         if current == "work":
             self._complete_work()
-        elif current in ("short_break", "long_break"):
+        elif current in BREAK_STATES:
             self._complete_break()
         logger.info(f"Skipped {current}")
 
@@ -203,7 +203,7 @@ class PomodoroTimer:
 
         if current == "work":
             self._complete_work()
-        elif current in ("short_break", "long_break"):
+        elif current in BREAK_STATES:
             self._complete_break()
 
     def _complete_work(self):
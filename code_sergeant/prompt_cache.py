@@ -0,0 +1,144 @@
+"""Similarity cache for repeated LLM judgments.
+
+The user often sits in the same editor window for minutes while the title
+changes only slightly (cursor position, unsaved marker, tab order). Rather than
+re-asking the model, a judgment is reused when a new prompt embeds close enough
+to one answered recently.
+"""
+import logging
+import threading
+import time
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple
+
+import numpy as np
+
+logger = logging.getLogger("code_sergeant.prompt_cache")
+
+# Defaults: cosine similarity needed for a hit, row lifetime, and capacity
+SIMILARITY_THRESHOLD = 0.92
+CACHE_TTL_SEC = 120.0
+CACHE_MAX_ENTRIES = 512
+
+# Width of the hashed character-trigram embedding
+EMBEDDING_DIM = 256
+
+# Cached (embedding, response, stored_at)
+_Row = Tuple[np.ndarray, Dict[str, Any], float]
+
+
+def hashed_trigram_embedding(text: str, dim: int = EMBEDDING_DIM) -> np.ndarray:
+    """
+    Embed text as an L2-normalized bag of hashed character trigrams.
+
+    Cheap, local and deterministic; good at scoring near-identical window
+    titles as similar, which is all the cache needs.
+
+    Args:
+        text: Text to embed
+        dim: Embedding width
+
+    Returns:
+        Unit-length float32 vector (all zeros for empty text)
+    """
+    if not text:
+        return np.zeros(dim, dtype=np.float32)
+
+    padded = f"  {text.lower()} "
+    buckets = [
+        zlib.crc32(padded[i : i + 3].encode()) % dim for i in range(len(padded) - 2)
+    ]
+    vec = np.bincount(buckets, minlength=dim).astype(np.float32)
+    norm = np.linalg.norm(vec)
+    return vec / norm if norm else vec
+
+
+class PromptCache:
+    """
+    LRU cache of responses looked up by embedding similarity.
+
+    Entries are partitioned by an exact key (e.g. goal and app) so only
+    prompts that differ in free text (e.g. window title) can match each other.
+    """
+
+    def __init__(
+        self,
+        threshold: float = SIMILARITY_THRESHOLD,
+        ttl_sec: float = CACHE_TTL_SEC,
+        max_entries: int = CACHE_MAX_ENTRIES,
+        embed_fn: Callable[[str], np.ndarray] = hashed_trigram_embedding,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            threshold: Minimum cosine similarity for a hit
+            ttl_sec: Seconds an entry stays valid
+            max_entries: Capacity before least recently used entries are evicted
+            embed_fn: Maps text to a unit-length vector
+        """
+        self.threshold = threshold
+        self.ttl_sec = ttl_sec
+        self.max_entries = max_entries
+        self.embed_fn = embed_fn
+        self._rows: "OrderedDict[Tuple[Hashable, str], _Row]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, partition: Hashable, text: str) -> Optional[Dict[str, Any]]:
+        """
+        Find a fresh response for a prompt similar to text.
+
+        Args:
+            partition: Exact-match part of the key
+            text: Free-text part of the key
+
+        Returns:
+            Copy of the cached response, or None on a miss
+        """
+        query = self.embed_fn(text)
+        now = time.monotonic()
+        with self._lock:
+            keys = []
+            vectors = []
+            for key, (vec, _, stored_at) in self._rows.items():
+                if key[0] == partition and now - stored_at < self.ttl_sec:
+                    keys.append(key)
+                    vectors.append(vec)
+            if not vectors:
+                return None
+
+            scores = np.stack(vectors) @ query
+            best = int(np.argmax(scores))
+            if scores[best] < self.threshold:
+                return None
+
+            key = keys[best]
+            self._rows.move_to_end(key)
+            logger.debug(f"Prompt cache hit ({scores[best]:.3f}): {text[:50]}")
+            return dict(self._rows[key][1])
+
+    def store(self, partition: Hashable, text: str, response: Dict[str, Any]):
+        """
+        Cache a response, evicting the least recently used entry when full.
+
+        Args:
+            partition: Exact-match part of the key
+            text: Free-text part of the key
+            response: Response to reuse for similar prompts
+        """
+        vec = self.embed_fn(text)
+        with self._lock:
+            key = (partition, text)
+            self._rows[key] = (vec, dict(response), time.monotonic())
+            self._rows.move_to_end(key)
+            while len(self._rows) > self.max_entries:
+                self._rows.popitem(last=False)
+
+    def clear(self):
+        """Drop every cached response."""
+        with self._lock:
+            self._rows.clear()
+
+    def __len__(self) -> int:
+        return len(self._rows)
@@ -19,7 +19,7 @@ class ReminderWorker:
 
         Args:
             intervals_sec: List of reminder intervals in seconds
-            event_queue: Queue to emit events to
+            event_queue: Event queue to append events to
             stop_event: Event to signal stop
         """
         self.intervals_sec = intervals_sec
@@ -34,7 +34,8 @@ class ReminderWorker:
 
         # Track when each reminder should fire
         reminder_times = []
-        start_time = time.time()
+        # Scheduled on the monotonic clock so wall-clock jumps don't skew it
+        start_time = time.monotonic()
 
         for interval in self.intervals_sec:
             reminder_times.append(start_time + interval)
@@ -42,7 +43,7 @@ class ReminderWorker:
         reminder_times.sort()  # Sort by time
 
         while not self.stop_event.is_set():
-            current_time = time.time()
+            current_time = time.monotonic()
 
             # Check if any reminders should fire
             fired = []
@@ -50,11 +51,11 @@ class ReminderWorker:
                 if current_time >= reminder_time:
                     # Fire reminder
                     message = random.choice(self.reminders)
-                    self.event_queue.put(
+                    self.event_queue.append(
                         {
                             "type": "reminder_triggered",
                             "message": message,
-                            "timestamp": current_time,
+                            "timestamp": time.time(),
                         }
                     )
                     logger.info(f"Reminder fired: {message}")
@@ -5,7 +5,8 @@ import queue
 import subprocess
 import tempfile
 import threading
-from typing import Any, Dict, List, Optional
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, List, Optional
 
 import pyttsx3
 
@@ -24,6 +25,10 @@ except ImportError as e:
     )
 
 
+# Pause between back-to-back messages so they don't run into each other
+UTTERANCE_GAP_SEC = 0.1
+
+
 # Common ElevenLabs voices for different personalities
 RECOMMENDED_VOICES = {
     "sergeant": {
@@ -49,6 +54,16 @@ RECOMMENDED_VOICES = {
 }
 
 
+def _notify_done(on_done: Optional[Callable[[], None]]) -> None:
+    """Run a speak() completion callback, never letting it break the caller."""
+    if on_done is None:
+        return
+    try:
+        on_done()
+    except Exception as e:
+        logger.warning(f"TTS completion callback failed: {e}")
+
+
 class TTSService:
     """Non-blocking text-to-speech service with ElevenLabs support."""
 
@@ -91,6 +106,11 @@ class TTSService:
         self._speaking_done = threading.Event()
         self._speaking_done.set()  # Initially not speaking
 
+        # Bumped per enqueued message; cancel_all records the value it cleared
+        # up to so back-to-back cancels with nothing new in between are no-ops
+        self._speak_gen = 0
+        self._cancelled_gen = 0
+
         # Track current audio process for interruption
         self._current_process: Optional[subprocess.Popen] = None
         self._current_temp_file: Optional[str] = None
@@ -355,21 +375,44 @@ class TTSService:
             self.worker_thread.join(timeout=2.0)
             logger.info("TTS worker stopped")
 
-    def speak(self, text: str) -> None:
+    def speak(self, text: str, on_done: Optional[Callable[[], None]] = None) -> None:
         """
         Enqueue text to be spoken (non-blocking).
 
         Args:
             text: Text to speak
+            on_done: Called once the message has finished playing, or when it
+                is dropped/cleared without playing, so waiters never hang
         """
         if not text or not text.strip():
+            _notify_done(on_done)
             return
 
         try:
-            self.speak_queue.put_nowait(text)
+            self.speak_queue.put_nowait((text, on_done))
+            # After the put, so a racing cancel_all can't skip this message
+            self._speak_gen += 1
             logger.debug(f"Enqueued speech: {text[:50]}")
         except queue.Full:
             logger.warning("TTS queue full, dropping message")
+            _notify_done(on_done)
+
+    def enqueue(self, text: str) -> "Future[None]":
+        """
+        Enqueue text to be spoken and return a future for this message alone.
+
+        Unlike wait_for_completion(), which waits on whatever is playing, the
+        future resolves when this message has finished (or was dropped/cleared).
+
+        Args:
+            text: Text to speak
+
+        Returns:
+            Future resolved with None once the message is done
+        """
+        future: "Future[None]" = Future()
+        self.speak(text, on_done=lambda: future.set_result(None))
+        return future
 
     def pause(self) -> None:
         """
@@ -392,13 +435,16 @@ class TTSService:
         Returns:
             Number of messages cleared
         """
-        count = 0
-        try:
-            while True:
-                self.speak_queue.get_nowait()
-                count += 1
-        except queue.Empty:
-            pass
+        # Empty the underlying deque in one step under the queue's own lock
+        # rather than paying a locked get_nowait() per pending message
+        with self.speak_queue.mutex:
+            cleared = list(self.speak_queue.queue)
+            self.speak_queue.queue.clear()
+            self.speak_queue.not_full.notify_all()
+
+        count = len(cleared)
+        for _, on_done in cleared:
+            _notify_done(on_done)
 
         if count > 0:
             logger.info(f"Cleared {count} pending TTS messages")
@@ -458,11 +504,17 @@ class TTSService:
         Stop current audio AND clear the queue.
 
         Use this when context changes (e.g., user returns to on_task)
-        to immediately silence all pending and current speech.
+        to immediately silence all pending and current speech. Does nothing
+        if nothing was enqueued since the last cancel and nothing is playing.
 
         Returns:
             Number of messages cleared from queue
         """
+        gen = self._speak_gen
+        if gen == self._cancelled_gen and not self._speaking.is_set():
+            return 0
+        self._cancelled_gen = gen
+
         # First stop any currently playing audio
         self.stop_current_audio()
 
@@ -553,16 +605,19 @@ class TTSService:
 
                 # Wait for text with timeout to check stop event
                 try:
-                    text = self.speak_queue.get(timeout=0.5)
+                    item = self.speak_queue.get(timeout=0.5)
                 except queue.Empty:
                     continue
 
                 # Check pause again after getting text (might have been paused while waiting)
                 if self._paused.is_set():
                     # Put it back and wait
-                    self.speak_queue.put(text)
+                    self.speak_queue.put(item)
+                    self._speak_gen += 1
                     continue
 
+                text, on_done = item
+
                 # Mark as speaking
                 self._speaking.set()
                 self._speaking_done.clear()
@@ -574,9 +629,13 @@ class TTSService:
                     else:
                         self._speak_pyttsx3(text)
                 finally:
-                    # Mark as done speaking
+                    # Mark as done speaking (providers return once playback ends)
                     self._speaking.clear()
                     self._speaking_done.set()
+                    _notify_done(on_done)
+
+                if not self.speak_queue.empty():
+                    self.stop_event.wait(timeout=UTTERANCE_GAP_SEC)
 
             except Exception as e:
                 logger.error(f"Error in TTS worker loop: {e}")
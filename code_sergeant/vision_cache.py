@@ -0,0 +1,147 @@
+"""Result cache for repeated screenshot analyses.
+
+Screen monitoring captures at fixed intervals, and consecutive frames are often
+near-identical (the user reading code, a blinking cursor, the clock ticking).
+Frames are fingerprinted with a 64-bit difference hash so an analysis can be
+reused for any frame within a few bits of one analyzed recently.
+"""
+import hashlib
+import io
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional, Tuple
+
+logger = logging.getLogger("code_sergeant.vision_cache")
+
+# Try to import Pillow (needed for perceptual hashing)
+try:
+    from PIL import Image
+
+    PIL_AVAILABLE = True
+except ImportError:
+    PIL_AVAILABLE = False
+
+# Defaults: differing bits tolerated for a hit, row lifetime, and capacity
+MAX_HAMMING_DISTANCE = 4
+CACHE_TTL_SEC = 60.0
+CACHE_MAX_ENTRIES = 64
+
+# dHash grid: one bit per horizontal neighbour pair in a 9x8 grayscale thumbnail
+_DHASH_SIZE = (9, 8)
+
+
+def image_fingerprint(image_bytes: bytes) -> int:
+    """
+    Fingerprint an image as a 64-bit difference hash (dHash).
+
+    Each bit records whether a pixel is brighter than its right neighbour in
+    a 9x8 grayscale thumbnail, so small local changes flip only a few bits.
+    Falls back to an 8-byte BLAKE2 digest, which only matches identical
+    bytes, when Pillow is missing or can't read the image.
+
+    Args:
+        image_bytes: PNG/JPEG image bytes
+
+    Returns:
+        64-bit fingerprint
+    """
+    if PIL_AVAILABLE:
+        try:
+            img = Image.open(io.BytesIO(image_bytes))
+            # Lets the JPEG decoder scale down during decode
+            img.draft("L", (_DHASH_SIZE[0] * 4, _DHASH_SIZE[1] * 4))
+            pixels = img.convert("L").resize(_DHASH_SIZE, Image.BILINEAR).tobytes()
+            width = _DHASH_SIZE[0]
+            bits = 0
+            for row in range(0, len(pixels), width):
+                for col in range(row, row + width - 1):
+                    bits = (bits << 1) | (pixels[col] > pixels[col + 1])
+            return bits
+        except Exception as e:
+            logger.debug(f"dHash failed, using exact digest: {e}")
+
+    return int.from_bytes(hashlib.blake2b(image_bytes, digest_size=8).digest(), "big")
+
+
+class VisionResultCache:
+    """
+    LRU cache of image analyses looked up by fingerprint distance.
+
+    Entries are partitioned by prompt so a frame only reuses an answer to the
+    same question.
+    """
+
+    def __init__(
+        self,
+        max_distance: int = MAX_HAMMING_DISTANCE,
+        ttl_sec: float = CACHE_TTL_SEC,
+        max_entries: int = CACHE_MAX_ENTRIES,
+    ):
+        """
+        Initialize cache.
+
+        Args:
+            max_distance: Most fingerprint bits that may differ for a hit
+            ttl_sec: Seconds an entry stays valid
+            max_entries: Capacity before least recently used entries are evicted
+        """
+        self.max_distance = max_distance
+        self.ttl_sec = ttl_sec
+        self.max_entries = max_entries
+        # (prompt, fingerprint) -> (stored_at, result)
+        self._rows: "OrderedDict[Tuple[str, int], Tuple[float, str]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def lookup(self, prompt: str, fingerprint: int) -> Optional[str]:
+        """
+        Find a fresh analysis of a frame close to fingerprint.
+
+        Args:
+            prompt: Analysis prompt
+            fingerprint: image_fingerprint() of the frame
+
+        Returns:
+            Cached analysis, or None on a miss
+        """
+        now = time.monotonic()
+        with self._lock:
+            best_key = None
+            best_distance = self.max_distance + 1
+            for key, (stored_at, _) in self._rows.items():
+                if key[0] != prompt or now - stored_at >= self.ttl_sec:
+                    continue
+                distance = (key[1] ^ fingerprint).bit_count()
+                if distance < best_distance:
+                    best_key, best_distance = key, distance
+            if best_key is None:
+                return None
+
+            self._rows.move_to_end(best_key)
+            logger.debug(f"Vision cache hit (distance {best_distance})")
+            return self._rows[best_key][1]
+
+    def store(self, prompt: str, fingerprint: int, result: str):
+        """
+        Cache an analysis, evicting the least recently used entry when full.
+
+        Args:
+            prompt: Analysis prompt
+            fingerprint: image_fingerprint() of the frame
+            result: Analysis to reuse for similar frames
+        """
+        with self._lock:
+            key = (prompt, fingerprint)
+            self._rows[key] = (time.monotonic(), result)
+            self._rows.move_to_end(key)
+            while len(self._rows) > self.max_entries:
+                self._rows.popitem(last=False)
+
+    def clear(self):
+        """Drop every cached analysis."""
+        with self._lock:
+            self._rows.clear()
+
+    def __len__(self) -> int:
+        return len(self._rows)
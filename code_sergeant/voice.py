@@ -1,20 +1,26 @@
 """Voice recording, transcription, wake word detection, and LLM interaction."""
+import functools
 import json
 import logging
 import re
 import threading
 import time
+from concurrent.futures import wait
 from datetime import datetime
 from typing import Any, Callable, Dict, List, Optional
 
 import numpy as np
-import ollama
 import sounddevice as sd
 from faster_whisper import WhisperModel
 
+from .ai_client import iter_sentences
+
 logger = logging.getLogger("code_sergeant.voice")
 
 
+# Longest wait for the "Listening" announcement to finish before recording
+LISTENING_PROMPT_TIMEOUT_SEC = 3.0
+
 # Voice command patterns
 COMMAND_PATTERNS = {
     "start_session": [
@@ -431,9 +437,16 @@ class VoiceCommandParser:
             ollama_model: Ollama model for complex command parsing
             ollama_base_url: Ollama API base URL
         """
-        self.ollama_client = ollama.Client(host=ollama_base_url)
+        self.ollama_base_url = ollama_base_url
         self.ollama_model = ollama_model
 
+    @functools.cached_property
+    def ollama_client(self):
+        """Ollama client, created (and the SDK imported) on first use."""
+        import ollama
+
+        return ollama.Client(host=self.ollama_base_url)
+
     def parse(self, transcript: str) -> Optional[VoiceCommand]:
         """
         Parse transcript into a command.
@@ -540,6 +553,7 @@ class VoiceWorker:
         ollama_base_url: str = "http://localhost:11434",
         tts_service=None,
         personality_manager=None,
+        ai_client=None,
     ):
         """
         Initialize voice worker.
@@ -551,13 +565,23 @@ class VoiceWorker:
             ollama_base_url: Ollama API base URL
             tts_service: TTSService instance for speaking responses
             personality_manager: PersonalityManager for personality-aware responses
+            ai_client: Optional AIClient; responses are then streamed and spoken
+                sentence by sentence (otherwise generated in full by Ollama)
         """
         self.record_seconds = record_seconds
         self.sample_rate = sample_rate
         self.ollama_model = ollama_model
-        self.ollama_client = ollama.Client(host=ollama_base_url)
+        self.ollama_base_url = ollama_base_url
         self.tts_service = tts_service
         self.personality_manager = personality_manager
+        self.ai_client = ai_client
+
+        # Input device resolved by prime_microphone(), used by the next recording
+        self._primed_input: Optional[Dict[str, Any]] = None
+
+        # Clear while a recording holds the input device, set once it's closed
+        self.mic_released = threading.Event()
+        self.mic_released.set()
 
         # Command parser
         self.command_parser = VoiceCommandParser(ollama_model, ollama_base_url)
@@ -597,6 +621,37 @@ class VoiceWorker:
         "say 'end note'",
     ]
 
+    @functools.cached_property
+    def ollama_client(self):
+        """Ollama client, created (and the SDK imported) on first use."""
+        import ollama
+
+        return ollama.Client(host=self.ollama_base_url)
+
+    def prime_microphone(self) -> bool:
+        """
+        Resolve the default input device ahead of the next recording.
+
+        Lets the PortAudio device lookup run while something else (e.g. TTS
+        draining) is still in progress.
+
+        Returns:
+            True if an input device was found
+        """
+        try:
+            self._primed_input = sd.query_devices(kind="input")
+            logger.debug(f"Microphone primed: {self._primed_input['name']}")
+            return True
+        except Exception as e:
+            logger.warning(f"Could not prime microphone: {e}")
+            self._primed_input = None
+            return False
+
+    def _input_device(self) -> Dict[str, Any]:
+        """Return the primed input device (once), else query the default."""
+        device, self._primed_input = self._primed_input, None
+        return device or sd.query_devices(kind="input")
+
     def record_note(self, max_duration: float = 120.0) -> Optional[str]:
         """
         Record a note until user says a stop phrase (e.g., "end note").
@@ -611,7 +666,7 @@ class VoiceWorker:
             Transcript text (without stop phrase), or None if recording/transcription failed
         """
         try:
-            default_input = sd.query_devices(kind="input")
+            default_input = self._input_device()
             logger.info(f"Using input device: {default_input['name']}")
 
             all_audio_chunks = []
@@ -626,15 +681,7 @@ class VoiceWorker:
 
             while total_samples < max_samples:
                 # Record chunk
-                chunk = sd.rec(
-                    chunk_samples,
-                    samplerate=self.sample_rate,
-                    channels=1,
-                    dtype=np.float32,
-                )
-                sd.wait()
-
-                chunk = chunk.flatten()
+                chunk = self._record_chunk(chunk_samples)
                 all_audio_chunks.append(chunk)
                 total_samples += len(chunk)
 
@@ -723,10 +770,12 @@ class VoiceWorker:
         Returns:
             Tuple of (transcript, command) - command may be None
         """
-        # Announce recording start
+        # Announce recording start, recording once the announcement has played
         if self.tts_service:
-            self.tts_service.speak("Listening")
-            time.sleep(0.5)  # Brief pause after announcement
+            wait(
+                [self.tts_service.enqueue("Listening")],
+                timeout=LISTENING_PROMPT_TIMEOUT_SEC,
+            )
 
         # Record audio
         try:
@@ -762,16 +811,37 @@ class VoiceWorker:
         # Get LLM response for non-command input
         try:
             logger.info("Getting LLM response...")
-            response = self._get_llm_response(transcript, goal, current_activity)
+            response = self._speak_llm_response(transcript, goal, current_activity)
             if response:
                 logger.info(f"LLM response: {response}")
-                if self.tts_service:
-                    self.tts_service.speak(response)
         except Exception as e:
             logger.error(f"LLM response failed: {e}")
 
         return transcript, command
 
+    def _record_chunk(self, samples: int) -> np.ndarray:
+        """
+        Record a fixed number of samples, holding the mic only for the call.
+
+        Args:
+            samples: Number of samples to record
+
+        Returns:
+            1D float32 audio (flattened from (samples, 1) for Whisper)
+        """
+        self.mic_released.clear()
+        try:
+            audio_data = sd.rec(
+                samples,
+                samplerate=self.sample_rate,
+                channels=1,
+                dtype=np.float32,
+            )
+            sd.wait()  # Wait until recording is finished; closes the stream
+        finally:
+            self.mic_released.set()
+        return audio_data.flatten()
+
     def _record_audio(self) -> Optional[np.ndarray]:
         """
         Record audio from microphone.
@@ -782,21 +852,12 @@ class VoiceWorker:
         try:
             # List available devices for debugging
             devices = sd.query_devices()
-            default_input = sd.query_devices(kind="input")
+            default_input = self._input_device()
             logger.debug(f"Available audio devices: {len(devices)}")
             logger.info(f"Using input device: {default_input['name']}")
 
             # Record audio
-            audio_data = sd.rec(
-                int(self.record_seconds * self.sample_rate),
-                samplerate=self.sample_rate,
-                channels=1,
-                dtype=np.float32,
-            )
-            sd.wait()  # Wait until recording is finished
-
-            # Flatten from (samples, 1) to (samples,) for Whisper
-            audio_data = audio_data.flatten()
+            audio_data = self._record_chunk(int(self.record_seconds * self.sample_rate))
 
             # Check audio level
             audio_level = np.abs(audio_data).max()
@@ -842,7 +903,7 @@ class VoiceWorker:
             Audio data as numpy array, or None on error
         """
         try:
-            default_input = sd.query_devices(kind="input")
+            default_input = self._input_device()
             logger.info(f"Using input device: {default_input['name']}")
 
             chunks = []
@@ -860,15 +921,7 @@ class VoiceWorker:
 
             while total_samples < max_samples:
                 # Record chunk
-                chunk = sd.rec(
-                    chunk_samples,
-                    samplerate=self.sample_rate,
-                    channels=1,
-                    dtype=np.float32,
-                )
-                sd.wait()
-
-                chunk = chunk.flatten()
+                chunk = self._record_chunk(chunk_samples)
                 chunks.append(chunk)
                 total_samples += len(chunk)
 
@@ -966,6 +1019,50 @@ class VoiceWorker:
             logger.error(f"Transcription error: {e}", exc_info=True)
             return None
 
+    def _speak_llm_response(
+        self,
+        transcript: str,
+        goal: Optional[str] = None,
+        current_activity: Optional[str] = None,
+    ) -> Optional[str]:
+        """
+        Get the LLM response to user's voice input and speak it.
+
+        With an AIClient the response is streamed and each sentence is queued
+        for TTS as soon as it is complete, so playback overlaps generation.
+
+        Args:
+            transcript: Transcribed user input
+            goal: Current session goal
+            current_activity: Current activity
+
+        Returns:
+            Response text (as far as it got), or None on error
+        """
+        if not self.ai_client:
+            response = self._get_llm_response(transcript, goal, current_activity)
+            if response and self.tts_service:
+                self.tts_service.speak(response)
+            return response
+
+        messages = [
+            {
+                "role": "user",
+                "content": self._response_prompt(transcript, goal, current_activity),
+            }
+        ]
+        sentences = []
+        try:
+            for sentence in iter_sentences(
+                self.ai_client.chat_stream(messages, temperature=0.7, max_tokens=100)
+            ):
+                sentences.append(sentence)
+                if self.tts_service:
+                    self.tts_service.speak(sentence)
+        except Exception as e:
+            logger.error(f"LLM stream failed: {e}")
+        return " ".join(sentences) or None
+
     def _get_llm_response(
         self,
         transcript: str,
@@ -973,7 +1070,7 @@ class VoiceWorker:
         current_activity: Optional[str] = None,
     ) -> Optional[str]:
         """
-        Get LLM response to user's voice input.
+        Get LLM response to user's voice input from Ollama in one piece.
 
         Args:
             transcript: Transcribed user input
@@ -983,6 +1080,31 @@ class VoiceWorker:
         Returns:
             LLM response text, or None on error
         """
+        prompt = self._response_prompt(transcript, goal, current_activity)
+
+        try:
+            response = self.ollama_client.generate(
+                model=self.ollama_model,
+                prompt=prompt,
+                options={
+                    "temperature": 0.7,
+                    "num_predict": 100,  # Limit response length
+                },
+            )
+
+            return response.get("response", "").strip()
+
+        except Exception as e:
+            logger.error(f"LLM call failed: {e}")
+            return None
+
+    def _response_prompt(
+        self,
+        transcript: str,
+        goal: Optional[str] = None,
+        current_activity: Optional[str] = None,
+    ) -> str:
+        """Build the in-character prompt answering the user's voice input."""
         # Build context
         context = ""
         if goal:
@@ -998,7 +1120,7 @@ class VoiceWorker:
             profile = self.personality_manager.profile
             personality_desc = f"You are {profile.wake_word_name.title()}, a focus assistant. {profile.description}"
 
-        prompt = f"""{personality_desc}
+        return f"""{personality_desc}
 
 {context}
 
@@ -1008,22 +1130,6 @@ Respond briefly and in character. Keep it short (1-2 sentences max). Be encourag
 
 Response:"""
 
-        try:
-            response = self.ollama_client.generate(
-                model=self.ollama_model,
-                prompt=prompt,
-                options={
-                    "temperature": 0.7,
-                    "num_predict": 100,  # Limit response length
-                },
-            )
-
-            return response.get("response", "").strip()
-
-        except Exception as e:
-            logger.error(f"LLM call failed: {e}")
-            return None
-
     def _handle_mic_error(self, error: Exception):
         """Handle microphone permission errors gracefully."""
         error_str = str(error).lower()
@@ -1052,14 +1158,14 @@ def run_voice_worker(
         voice_worker: VoiceWorker instance
         goal: Current goal
         current_activity: Current activity string
-        event_queue: Event queue to emit events to
+        event_queue: Event queue to append events to
     """
     try:
         transcript, command = voice_worker.record_and_process(goal, current_activity)
 
         if command:
             # Emit command event
-            event_queue.put(
+            event_queue.append(
                 {
                     "type": "voice_command",
                     "command": command.command_type,
@@ -1070,7 +1176,7 @@ def run_voice_worker(
             )
         elif transcript:
             # Emit transcript event
-            event_queue.put(
+            event_queue.append(
                 {
                     "type": "voice_transcript",
                     "transcript": transcript,
@@ -1082,6 +1188,6 @@ def run_voice_worker(
         raise
     except Exception as e:
         logger.error(f"Voice worker error: {e}")
-        event_queue.put(
+        event_queue.append(
             {"type": "error_event", "message": f"Voice processing error: {e}"}
         )
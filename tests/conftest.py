@@ -10,6 +10,10 @@ This module provides common fixtures used across all test modules:
 
 import os
 import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future
 from datetime import datetime
 from typing import Any, Dict, Optional
 from unittest.mock import MagicMock, Mock, patch
@@ -47,6 +51,7 @@ class MockAIClient:
         self.last_prompt = None
         self.should_fail = False
         self.fail_message = "Mock API failure"
+        self.judgments: Dict[tuple, Dict[str, Any]] = {}
 
     def chat(self, messages: list, **kwargs) -> Dict[str, Any]:
         """Mock chat completion."""
@@ -68,6 +73,15 @@ class MockAIClient:
 
         return {"response": str(self.default_response)}
 
+    def cached_judgment(self, key: tuple) -> Optional[Dict[str, Any]]:
+        """Return a stored judgment (never expires in the mock)."""
+        judgment = self.judgments.get(key)
+        return dict(judgment) if judgment is not None else None
+
+    def store_judgment(self, key: tuple, judgment: Dict[str, Any]) -> None:
+        """Store a judgment for cached_judgment."""
+        self.judgments[key] = dict(judgment)
+
     def get_status(self) -> Dict[str, Any]:
         """Get mock client status."""
         return {
@@ -97,9 +111,17 @@ class MockTTSService:
         self.started = False
         self.stopped = False
 
-    def speak(self, text: str):
-        """Record spoken text."""
+    def speak(self, text: str, on_done=None):
+        """Record spoken text (counts as played immediately)."""
         self.spoken_texts.append(text)
+        if on_done:
+            on_done()
+
+    def enqueue(self, text: str):
+        """Record spoken text and return an already-resolved future."""
+        future = Future()
+        self.speak(text, on_done=lambda: future.set_result(None))
+        return future
 
     def start(self):
         """Start the mock TTS service."""
@@ -144,10 +166,27 @@ class MockNativeMonitor:
         """Get idle time in seconds."""
         return self.idle_seconds
 
+    def wait_for_change(self, timeout: float) -> bool:
+        """Wait out the timeout (no app switch notifications)."""
+        time.sleep(timeout)
+        return False
+
+    def wake(self) -> None:
+        """No pending wait to interrupt."""
+
     def is_user_idle(self, threshold: int = 120) -> bool:
         """Check if user is idle."""
         return self.idle_seconds > threshold
 
+    def snapshot(self) -> dict:
+        """Get app, title and idle state in one call."""
+        return {
+            "app": self.current_app,
+            "window_title": self.current_title,
+            "idle_seconds": self.idle_seconds,
+            "is_idle": self.is_user_idle(),
+        }
+
     def get_current_activity(self) -> ActivityEvent:
         """Get current activity as ActivityEvent."""
         return ActivityEvent(
@@ -373,6 +412,92 @@ def mock_controller_deps(
     }
 
 
+@pytest.fixture
+def make_controller():
+    """
+    Factory for AppController instances built without running __init__.
+
+    Every attribute __init__ sets is filled in, with MagicMocks in place of the
+    services, so tests only override what they exercise.
+
+    Args (of the returned factory):
+        **config_overrides: Merged over DEFAULT_CONFIG for config/cfg
+
+    Returns:
+        Callable returning a fresh AppController
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    from code_sergeant.config import DEFAULT_CONFIG, deep_merge
+    from code_sergeant.controller import (
+        ACTIVITY_HISTORY_SIZE,
+        TASK_EXECUTOR_WORKERS,
+        AppController,
+        ControllerConfig,
+        ControllerState,
+        EventQueue,
+    )
+
+    controllers = []
+
+    def _make(**config_overrides):
+        controller = AppController.__new__(AppController)
+        controller.state = ControllerState()
+        controller._snapshot = None
+        controller._snapshot_version = 0
+        controller.event_queue = EventQueue()
+        controller.stop_event = threading.Event()
+        controller.workers = {}
+        controller._build_dispatch_tables()
+
+        controller.config = deep_merge(DEFAULT_CONFIG, config_overrides)
+        controller.cfg = ControllerConfig.from_config(controller.config)
+        controller._io_executor = ThreadPoolExecutor(max_workers=1)
+        controller._executor = ThreadPoolExecutor(max_workers=TASK_EXECUTOR_WORKERS)
+        controller._startup_futures = []
+        controller._mic_executor = ThreadPoolExecutor(max_workers=1)
+
+        controller.personality_manager = MagicMock()
+        controller._phrase_cache = {}
+        controller.ai_client = MagicMock()
+        controller.native_monitor = MagicMock()
+        controller.judge = MagicMock()
+        controller.tts_service = MagicMock()
+        controller.pomodoro = MagicMock()
+
+        controller.voice_worker = None
+        controller._voice_worker_key = None
+        controller.wake_word_detector = None
+
+        controller.current_activity = None
+        controller.activity_history = deque(maxlen=ACTIVITY_HISTORY_SIZE)
+        controller.last_judgment = None
+        controller.last_yell_time = None
+
+        controller.drill_worker = None
+        controller.drill_stop_event = threading.Event()
+        controller._drill_wake = threading.Event()
+        controller._activity_changed = threading.Event()
+        controller.drill_interval = 1.0
+
+        controller.motivation_monitor = MagicMock()
+        controller.screen_monitor = MagicMock()
+        controller.screen_monitor.is_enabled.return_value = False
+
+        controllers.append(controller)
+        return controller
+
+    yield _make
+
+    for controller in controllers:
+        for executor in (
+            controller._executor,
+            controller._mic_executor,
+            controller._io_executor,
+        ):
+            executor.shutdown(wait=False)
+
+
 # =============================================================================
 # Utility Functions
 # =============================================================================
@@ -63,6 +63,13 @@ class TestHealthEndpoint:
 
         assert "timestamp" in data
 
+    def test_health_timestamp_is_iso(self, client):
+        """Test health timestamp is a parseable ISO string."""
+        response = client.get("/api/health")
+        data = json.loads(response.data)
+
+        assert isinstance(datetime.fromisoformat(data["timestamp"]), datetime)
+
 
 @pytest.mark.integration
 class TestStatusEndpoint:
@@ -93,6 +100,69 @@ class TestStatusEndpoint:
         assert response.status_code == 200
         data = json.loads(response.data)
         assert "session_active" in data
+        assert data["focus_time_minutes"] == 10
+        assert data["current_goal"] == "Test goal"
+        assert "timestamp" in data
+
+
+@pytest.mark.integration
+class TestAIStatusEndpoint:
+    """Tests for /api/ai/status endpoint."""
+
+    def test_ai_status_probes_ollama_once(self, client):
+        """Test status and server message share a single Ollama probe."""
+        from code_sergeant.ai_client import AIClient
+
+        with patch.dict(os.environ, {"OPENAI_API_KEY": ""}):
+            ai_client = AIClient(openai_api_key=None)
+        ai_client.openai_client = None
+        ai_client.ollama_client = MagicMock()
+
+        with patch("bridge.server.controller") as mock_controller:
+            mock_controller.ai_client = ai_client
+            response = client.get("/api/ai/status")
+
+        data = json.loads(response.data)
+        assert response.status_code == 200
+        assert data["ollama_available"] is True
+        assert "ollama_server_message" in data
+        assert ai_client.ollama_client.list.call_count == 1
+
+    def test_ai_status_without_ai_client(self, client):
+        """Test capabilities are re-probed when the controller is swapped."""
+        with patch("bridge.server.controller", Mock(spec=["pomodoro"])):
+            response = client.get("/api/ai/status")
+
+        assert response.status_code == 500
+
+
+@pytest.mark.integration
+class TestSnapshotEndpoint:
+    """Tests for the combined /api/snapshot endpoint."""
+
+    @pytest.fixture
+    def mock_controller(self):
+        """Patch in a controller with a plain state snapshot and no pomodoro."""
+        with patch("bridge.server.controller") as mock_controller:
+            mock_state = Mock()
+            mock_state.session_active = True
+            mock_state.goal = "Test goal"
+            mock_state.personality_name = "sergeant"
+            mock_state.stats = None
+            mock_controller.get_state_snapshot.return_value = mock_state
+            mock_controller.pomodoro = None
+            yield mock_controller
+
+    @patch("bridge.server.native_monitor", None)
+    def test_snapshot_combines_payloads(self, mock_controller, client):
+        """Test snapshot returns status, timer and activity together."""
+        response = client.get("/api/snapshot")
+
+        assert response.status_code == 200
+        data = json.loads(response.data)
+        assert data["status"]["current_goal"] == "Test goal"
+        assert data["timer"]["state"] == "stopped"
+        assert data["activity"] is None
 
 
 @pytest.mark.integration
@@ -153,6 +223,24 @@ class TestSessionEndpoints:
 
             assert response.status_code in [200, 500]
 
+    def test_end_session_summary_defaults_missing_stats(self, client):
+        """Test unset stats fields are reported as zero in the summary."""
+        with patch("bridge.server.controller") as mock_controller:
+            mock_state = Mock()
+            mock_state.stats = Mock(
+                focus_seconds=None, distractions_count=None, pomodoros_completed=3
+            )
+            mock_controller.get_state_snapshot.return_value = mock_state
+
+            response = client.post("/api/session/end")
+
+            assert response.status_code == 200
+            assert response.get_json()["summary"] == {
+                "focus_minutes": 0,
+                "distractions": 0,
+                "pomodoros_completed": 3,
+            }
+
     def test_pause_session(self, client):
         """Test pausing session."""
         with patch("bridge.server.controller") as mock_controller:
@@ -178,6 +266,8 @@ class TestTimerEndpoint:
             response = client.get("/api/timer")
 
             assert response.status_code == 500
+            assert response.mimetype == "application/json"
+            assert json.loads(response.data) == {"error": "Controller not initialized"}
 
     @patch("bridge.server.controller")
     def test_timer_returns_state(self, mock_controller, client):
@@ -189,6 +279,7 @@ class TestTimerEndpoint:
         mock_state.work_duration_minutes = 25
         mock_state.short_break_minutes = 5
         mock_state.long_break_minutes = 15
+        mock_state.total_seconds = 1500
         mock_pomodoro.state = mock_state
         mock_controller.pomodoro = mock_pomodoro
 
@@ -198,6 +289,7 @@ class TestTimerEndpoint:
         data = json.loads(response.data)
         assert "state" in data
         assert "remaining_seconds" in data
+        assert data["total_seconds"] == 1500
 
 
 @pytest.mark.integration
@@ -213,7 +305,9 @@ class TestTTSEndpoints:
         assert response.status_code == 400
 
     def test_speak_with_text(self, client):
-        """Test speak with text."""
+        """Test speak is accepted and handed to the TTS worker."""
+        from bridge import server
+
         with patch("bridge.server.tts_service") as mock_tts:
             response = client.post(
                 "/api/tts/speak",
@@ -221,7 +315,25 @@ class TestTTSEndpoints:
                 content_type="application/json",
             )
 
-            assert response.status_code in [200, 500]
+            assert response.status_code == 202
+            server._tts_queue.join()
+            mock_tts.speak.assert_called_once_with("Hello, world!")
+
+    def test_speak_queue_drops_oldest_when_full(self):
+        """Test a full speech queue keeps the latest requests."""
+        import queue
+
+        from bridge import server
+
+        with patch("bridge.server._ensure_tts_worker"), patch(
+            "bridge.server._tts_queue", queue.Queue(maxsize=2)
+        ):
+            for text in ("one", "two", "three"):
+                server._enqueue_speech(text)
+
+            pending = [server._tts_queue.get_nowait() for _ in range(2)]
+
+        assert pending == ["two", "three"]
 
     def test_stop_speaking(self, client):
         """Test stop speaking."""
@@ -265,6 +377,27 @@ class TestConfigEndpoints:
 
                 assert response.status_code == 200
 
+    def test_get_config_reflects_update(self, client):
+        """Test cached config is rebuilt after a PATCH."""
+        with patch("bridge.server.config", {"test": "value"}):
+            with patch("bridge.server.save_config"):
+                before = json.loads(client.get("/api/config").data)
+                client.patch("/api/config", json={"test": "changed"})
+                after = json.loads(client.get("/api/config").data)
+
+        assert before["test"] == "value"
+        assert after["test"] == "changed"
+
+    def test_get_config_gzip(self, client):
+        """Test config is served compressed when the client accepts gzip."""
+        import gzip
+
+        with patch("bridge.server.config", {"test": "value"}):
+            response = client.get("/api/config", headers={"Accept-Encoding": "gzip"})
+
+        assert response.headers["Content-Encoding"] == "gzip"
+        assert json.loads(gzip.decompress(response.data)) == {"test": "value"}
+
 
 @pytest.mark.integration
 class TestActivityEndpoint:
@@ -280,10 +413,12 @@ class TestActivityEndpoint:
     @patch("bridge.server.native_monitor")
     def test_activity_returns_info(self, mock_monitor, client):
         """Test activity returns current info."""
-        mock_monitor.get_frontmost_app.return_value = "Cursor"
-        mock_monitor.get_active_window_title.return_value = "test.py"
-        mock_monitor.get_idle_seconds.return_value = 5.0
-        mock_monitor.is_user_idle.return_value = False
+        mock_monitor.snapshot.return_value = {
+            "app": "Cursor",
+            "window_title": "test.py",
+            "idle_seconds": 5.0,
+            "is_idle": False,
+        }
 
         response = client.get("/api/activity/current")
 
@@ -332,3 +467,197 @@ class TestConcurrentRequests:
 
         # All should succeed
         assert all(code == 200 for code in responses)
+
+
+@pytest.mark.integration
+class TestWebSocketPush:
+    """Tests for the Socket.IO push channel."""
+
+    @pytest.fixture(autouse=True)
+    def require_socketio(self):
+        from bridge import server
+
+        if not server.SOCKETIO_AVAILABLE:
+            pytest.skip("flask-socketio not installed")
+
+    @patch("bridge.server.native_monitor", None)
+    @patch("bridge.server.controller")
+    def test_connect_sends_initial_state(self, mock_controller, app):
+        """Test a new client receives status and timer on connect."""
+        from bridge.server import socketio
+
+        mock_state = Mock()
+        mock_state.session_active = True
+        mock_state.goal = "Test goal"
+        mock_state.personality_name = "sergeant"
+        mock_state.stats = None
+        mock_controller.get_state_snapshot.return_value = mock_state
+        mock_controller.pomodoro = None
+
+        with patch("bridge.server._push_task_started", True):
+            ws_client = socketio.test_client(app)
+            received = {msg["name"]: msg["args"][0] for msg in ws_client.get_received()}
+            ws_client.disconnect()
+
+        assert received["status"]["current_goal"] == "Test goal"
+        assert received["timer"]["state"] == "stopped"
+        assert "activity" not in received
+
+    def test_activity_dirty_key_ignores_idle_seconds(self):
+        """Test activity is only re-pushed on app/window/idle transitions."""
+        from bridge.server import _push_dirty_key
+
+        first = {
+            "app": "Cursor",
+            "window_title": "a.py",
+            "idle_seconds": 1.0,
+            "is_idle": False,
+        }
+        later = {**first, "idle_seconds": 7.5}
+
+        assert _push_dirty_key("activity", first) == _push_dirty_key("activity", later)
+        assert _push_dirty_key("activity", first) != _push_dirty_key(
+            "activity", {**first, "window_title": "b.py"}
+        )
+
+
+@pytest.mark.integration
+class TestPollChannels:
+    """Tests for /api/poll/<name> dispatch."""
+
+    @patch("bridge.server.native_monitor")
+    def test_poll_activity(self, mock_monitor, client):
+        """Test a known channel returns its payload."""
+        mock_monitor.snapshot.return_value = {
+            "app": "Cursor",
+            "window_title": "test.py",
+            "idle_seconds": 0.0,
+            "is_idle": False,
+        }
+
+        response = client.get("/api/poll/activity")
+
+        assert response.status_code == 200
+        assert json.loads(response.data)["app"] == "Cursor"
+
+    def test_poll_timer_without_controller(self, client):
+        """Test a channel whose backend is missing returns 500."""
+        with patch("bridge.server.controller", None):
+            response = client.get("/api/poll/timer")
+
+        assert response.status_code == 500
+
+    def test_poll_unknown_channel(self, client):
+        """Test an unknown channel returns 404."""
+        response = client.get("/api/poll/nonexistent")
+
+        assert response.status_code == 404
+
+
+@pytest.mark.integration
+class TestEventPolling:
+    """Tests for batched event delivery on /api/events/poll."""
+
+    @pytest.fixture
+    def mock_controller(self):
+        """Patch in an idle controller and a fresh, empty event buffer."""
+        from collections import deque
+
+        mock_state = Mock()
+        mock_state.session_active = False
+        mock_state.goal = None
+        mock_state.personality_name = "sergeant"
+        mock_state.stats = None
+
+        with patch("bridge.server.controller") as mock_controller, patch(
+            "bridge.server.native_monitor", None
+        ), patch.dict("bridge.server._last_pushed", clear=True), patch(
+            "bridge.server._event_buffer", deque(maxlen=256)
+        ):
+            mock_controller.get_state_snapshot.return_value = mock_state
+            mock_controller.is_session_active.return_value = False
+            mock_controller.pomodoro = None
+            yield mock_controller
+
+    def test_poll_delivers_changes_once(self, mock_controller, client):
+        """Test changed channels are batched into one poll and not repeated."""
+        first = json.loads(client.get("/api/events/poll").data)
+        second = json.loads(client.get(f"/api/events/poll?since={first['seq']}").data)
+
+        assert [e["type"] for e in first["events"]] == ["status", "timer"]
+        assert second["events"] == []
+        assert second["seq"] == first["seq"]
+
+    def test_pollers_do_not_consume_each_others_events(self, mock_controller, client):
+        """Test each client reads from its own position in the buffer."""
+        first = json.loads(client.get("/api/events/poll").data)
+        client.get(f"/api/events/poll?since={first['seq']}")
+        other = json.loads(client.get("/api/events/poll").data)
+
+        assert [e["type"] for e in other["events"]] == ["status", "timer"]
+
+    def test_push_loop_does_not_consume_poll_events(self, mock_controller, client):
+        """Test events already pushed over Socket.IO still reach HTTP pollers."""
+        from bridge.server import _events_since, _record_changes
+
+        _record_changes()
+        pushed, _ = _events_since(0)
+        polled = json.loads(client.get("/api/events/poll").data)
+
+        assert [e["type"] for e in pushed] == ["status", "timer"]
+        assert [e["type"] for e in polled["events"]] == ["status", "timer"]
+
+
+@pytest.mark.integration
+class TestPortCheck:
+    """Tests for check_and_free_port."""
+
+    def test_free_port(self):
+        """Test a port with no listeners is reported free."""
+        from bridge.server import check_and_free_port
+
+        with patch("bridge.server._find_port_listeners", return_value=[]):
+            assert check_and_free_port(5050) is True
+
+    def test_kills_stale_python_listener(self):
+        """Test a stale Python listener is killed and the port reclaimed."""
+        from bridge.server import check_and_free_port
+
+        stale = Mock(pid=1234)
+        stale.name.return_value = "Python"
+
+        with patch(
+            "bridge.server._find_port_listeners", side_effect=[[stale], []]
+        ), patch("bridge.server.psutil.wait_procs", return_value=([stale], [])):
+            assert check_and_free_port(5050) is True
+
+        stale.kill.assert_called_once()
+
+    def test_gives_up_when_port_stays_bound(self):
+        """Test the re-check loop stops at its deadline."""
+        from bridge.server import PORT_RELEASE_BACKOFF_SEC, check_and_free_port
+
+        stale = Mock(pid=1234)
+        stale.name.return_value = "python3"
+
+        with patch(
+            "bridge.server._find_port_listeners", return_value=[stale]
+        ) as find, patch("bridge.server.psutil.wait_procs"), patch(
+            "bridge.server.time.sleep"
+        ) as sleep:
+            assert check_and_free_port(5050) is False
+
+        assert sleep.call_count == len(PORT_RELEASE_BACKOFF_SEC)
+        assert find.call_count == len(PORT_RELEASE_BACKOFF_SEC) + 1
+
+    def test_non_python_listener_is_left_alone(self):
+        """Test a non-Python listener is not killed."""
+        from bridge.server import check_and_free_port
+
+        other = Mock(pid=4321)
+        other.name.return_value = "ControlCenter"
+
+        with patch("bridge.server._find_port_listeners", return_value=[other]):
+            assert check_and_free_port(5050) is False
+
+        other.kill.assert_not_called()
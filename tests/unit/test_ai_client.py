@@ -0,0 +1,687 @@
+"""
+Unit tests for AIClient.
+
+Tests client-side behavior that doesn't need a live backend:
+- Ollama availability caching
+- Lazy SDK imports
+- Ollama connection pool settings
+- OpenAI client reuse across key updates
+- Streaming chat and sentence regrouping
+- Parallel chat_many batches
+- Multi-activity judgment batching
+- OpenAI Batch API submission and polling
+- Screenshot downsampling before vision upload
+- Vision result reuse for repeated frames
+- Judgment reuse for identical and similar inputs
+- Local blocklist/allowlist judgments
+- Constant system-prompt prefix for judgments
+- AsyncAIClient concurrent requests
+"""
+
+import asyncio
+import base64
+import io
+import json
+import os
+import sys
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from PIL import Image
+
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from code_sergeant import ai_client as ai_client_module  # noqa: E402
+from code_sergeant.ai_client import (  # noqa: E402
+    AIClient,
+    AsyncAIClient,
+    OLLAMA_KEEPALIVE_EXPIRY_SEC,
+    _ollama_pool_kwargs,
+    _shrink_image,
+    iter_sentences,
+)
+
+
+@pytest.fixture
+def client():
+    """Create an AIClient with a mocked Ollama client and no OpenAI."""
+    with patch.dict(os.environ, {"OPENAI_API_KEY": ""}):
+        ai_client = AIClient(openai_api_key=None)
+    ai_client.openai_client = None
+    ai_client.ollama_client = MagicMock()
+    return ai_client
+
+
+@pytest.fixture
+def async_client():
+    """Create an AsyncAIClient backed only by a mocked async Ollama client."""
+    with patch.dict(os.environ, {"OPENAI_API_KEY": ""}):
+        ai_client = AsyncAIClient(openai_api_key=None)
+    ai_client.async_openai_client = None
+    ai_client.async_ollama_client = MagicMock()
+    ai_client.async_ollama_client.chat = AsyncMock(
+        side_effect=lambda **kw: {"message": {"content": kw["messages"][0]["content"]}}
+    )
+    return ai_client
+
+
+@pytest.mark.unit
+class TestOllamaAvailabilityCache:
+    """Tests for the check_ollama_available TTL cache."""
+
+    def test_repeated_checks_probe_once(self, client):
+        """Test repeated checks within the TTL reuse the first probe."""
+        for _ in range(5):
+            available, _ = client.check_ollama_available()
+
+        assert available is True
+        assert client.ollama_client.list.call_count == 1
+
+    def test_check_reprobes_after_ttl(self, client):
+        """Test the probe runs again once the cached result expires."""
+        with patch("code_sergeant.ai_client.OLLAMA_STATUS_TTL_SEC", 0.0):
+            client.check_ollama_available()
+            client.check_ollama_available()
+
+        assert client.ollama_client.list.call_count == 2
+
+    def test_failure_is_cached(self, client):
+        """Test an unreachable server is not re-probed on every call."""
+        client.ollama_client.list.side_effect = Exception("Connection refused")
+
+        first = client.check_ollama_available()
+        second = client.check_ollama_available()
+
+        assert first[0] is False
+        assert first == second
+        assert client.ollama_client.list.call_count == 1
+
+    def test_failed_chat_invalidates_cache(self, client):
+        """Test an Ollama chat failure forces the next check to re-probe."""
+        client.check_ollama_available()
+        client.ollama_client.chat.side_effect = Exception("Connection refused")
+
+        with pytest.raises(RuntimeError):
+            client.chat([{"role": "user", "content": "hi"}])
+        client.check_ollama_available()
+
+        assert client.ollama_client.list.call_count == 2
+
+    def test_key_change_invalidates_cache(self, client):
+        """Test updating the OpenAI key forces a fresh probe."""
+        client.check_ollama_available()
+
+        with patch.dict(os.environ, {}), patch("openai.OpenAI"):
+            client.set_openai_key("sk-new")
+        client.check_ollama_available()
+
+        assert client.ollama_client.list.call_count == 2
+
+
+@pytest.mark.unit
+class TestLazySdkImport:
+    """Tests for the on-demand SDK imports."""
+
+    def test_openai_sdk_not_loaded_without_key(self):
+        """Test a client without an OpenAI key never imports the OpenAI SDK."""
+        with patch.dict(os.environ, {"OPENAI_API_KEY": ""}), patch(
+            "code_sergeant.ai_client._openai_sdk"
+        ) as openai_sdk:
+            AIClient(openai_api_key=None)
+
+        openai_sdk.assert_not_called()
+
+    def test_availability_flags_resolve_lazily(self):
+        """Test the availability flags are computed through module __getattr__."""
+        assert "OPENAI_AVAILABLE" not in vars(ai_client_module)
+        assert ai_client_module.OPENAI_AVAILABLE is True
+        assert ai_client_module.OLLAMA_AVAILABLE is True
+
+    def test_unknown_attribute_raises(self):
+        """Test other missing module attributes still raise AttributeError."""
+        with pytest.raises(AttributeError):
+            ai_client_module.NOT_A_REAL_NAME
+
+
+@pytest.mark.unit
+class TestOllamaPool:
+    """Tests for the Ollama httpx transport configuration."""
+
+    @pytest.mark.parametrize("async_client", [False, True])
+    def test_transport_carries_keepalive_limits(self, async_client):
+        """Test pool limits live on the transport, where httpx honours them."""
+        kwargs = _ollama_pool_kwargs(async_client=async_client)
+
+        assert set(kwargs) == {"transport"}
+        pool = kwargs["transport"]._pool
+        assert pool._keepalive_expiry == OLLAMA_KEEPALIVE_EXPIRY_SEC
+
+
+@pytest.mark.unit
+class TestSetOpenAIKey:
+    """Tests for set_openai_key()."""
+
+    def test_key_update_reuses_client(self, client):
+        """Test updating the key keeps the existing client and its pool."""
+        existing = MagicMock()
+        client.openai_client = existing
+
+        with patch.dict(os.environ, {}):
+            assert client.set_openai_key("sk-new") is True
+
+        assert client.openai_client is existing
+        assert existing.api_key == "sk-new"
+
+    def test_first_key_creates_pooled_client(self, client):
+        """Test a client is created with a pooled http client when none exists."""
+        with patch("openai.OpenAI") as openai_cls, patch(
+            "openai.DefaultHttpxClient"
+        ) as http_cls, patch.dict(os.environ, {}):
+            client.set_openai_key("sk-first")
+
+        openai_cls.assert_called_once_with(
+            api_key="sk-first", http_client=http_cls.return_value
+        )
+
+
+@pytest.mark.unit
+class TestChatStream:
+    """Tests for chat_stream() and iter_sentences()."""
+
+    def test_openai_deltas_are_yielded(self, client):
+        """Test OpenAI stream chunks are yielded as they arrive, skipping empties."""
+        chunks = [
+            MagicMock(choices=[MagicMock(delta=MagicMock(content=text))])
+            for text in ("Get ", None, "back to work.")
+        ]
+        client.openai_client = MagicMock()
+        client.openai_client.chat.completions.create.return_value = iter(chunks)
+
+        deltas = list(client.chat_stream([{"role": "user", "content": "hi"}]))
+
+        assert deltas == ["Get ", "back to work."]
+        kwargs = client.openai_client.chat.completions.create.call_args.kwargs
+        assert kwargs["stream"] is True
+
+    def test_falls_back_to_ollama_stream(self, client):
+        """Test Ollama streams when the OpenAI request can't start."""
+        client.openai_client = MagicMock()
+        client.openai_client.chat.completions.create.side_effect = Exception("down")
+        client.ollama_client.chat.return_value = iter(
+            [{"message": {"content": "Focus"}}, {"message": {"content": "!"}}]
+        )
+
+        deltas = list(client.chat_stream([{"role": "user", "content": "hi"}]))
+
+        assert deltas == ["Focus", "!"]
+
+    def test_iter_sentences_regroups_deltas(self):
+        """Test deltas are emitted as whole sentences, keeping decimals intact."""
+        deltas = ["You've done 2.", "5 hours. Nice", " work! Take a", " break"]
+
+        assert list(iter_sentences(deltas)) == [
+            "You've done 2.5 hours.",
+            "Nice work!",
+            "Take a break",
+        ]
+
+
+@pytest.mark.unit
+class TestChatMany:
+    """Tests for AIClient.chat_many()."""
+
+    def test_chat_many_returns_replies_in_order(self, client):
+        """Test batched requests come back in request order."""
+        client.ollama_client.chat.side_effect = lambda **kw: {
+            "message": {"content": kw["messages"][0]["content"].upper()}
+        }
+        batch = [[{"role": "user", "content": text}] for text in ("a", "b", "c")]
+
+        assert client.chat_many(batch) == ["A", "B", "C"]
+
+    def test_chat_many_falls_back_to_ollama(self, client):
+        """Test a request that fails on OpenAI is retried on Ollama."""
+        client.openai_client = MagicMock()
+        client.openai_client.chat.completions.create.side_effect = Exception("down")
+        client.ollama_client.chat.return_value = {"message": {"content": "local"}}
+
+        replies = client.chat_many([[{"role": "user", "content": "hi"}]])
+
+        assert replies == ["local"]
+
+
+@pytest.mark.unit
+class TestJudgeActivityCache:
+    """Tests for judge_activity's similarity cache."""
+
+    def test_similar_title_skips_llm(self, client):
+        """Test a near-identical window title reuses the previous judgment."""
+        client.ollama_client.chat.return_value = {
+            "message": {"content": '{"classification": "on_task"}'}
+        }
+
+        first = client.judge_activity("Write tests", "Notion", "main.py — CodeSergeant")
+        second = client.judge_activity(
+            "Write tests", "Notion", "● main.py — CodeSergeant"
+        )
+
+        assert first == second == {"classification": "on_task"}
+        assert client.ollama_client.chat.call_count == 1
+
+    def test_parse_failure_not_cached(self, client):
+        """Test an unparseable reply is not reused."""
+        client.ollama_client.chat.return_value = {"message": {"content": "nope"}}
+
+        client.judge_activity("Write tests", "Notion", "main.py")
+        client.judge_activity("Write tests", "Notion", "main.py")
+
+        assert client.ollama_client.chat.call_count == 2
+
+
+@pytest.mark.unit
+class TestLocalJudgment:
+    """Tests for the deterministic judgments made before the LLM."""
+
+    def test_blocklisted_site_is_off_task(self, client):
+        """Test a blocklisted site is judged off task without the LLM."""
+        result = client.judge_activity("Write tests", "Safari", "Home - YouTube")
+
+        assert result["classification"] == "off_task"
+        assert result["reason"] == "matched blocklist"
+        client.ollama_client.chat.assert_not_called()
+
+    def test_goal_naming_site_goes_to_llm(self, client):
+        """Test a goal that mentions the blocklisted site is left to the LLM."""
+        client.ollama_client.chat.return_value = {
+            "message": {"content": '{"classification": "on_task"}'}
+        }
+
+        result = client.judge_activity("Edit YouTube intro", "Safari", "YouTube Studio")
+
+        assert result == {"classification": "on_task"}
+        assert client.ollama_client.chat.call_count == 1
+
+    def test_productive_app_is_on_task(self, client):
+        """Test an editor or terminal is judged on task without the LLM."""
+        for app in ("Cursor", "Code", "Terminal", "iTerm2", "PyCharm"):
+            result = client.judge_activity("Write tests", app, "main.py")
+            assert result["classification"] == "on_task"
+        client.ollama_client.chat.assert_not_called()
+
+    def test_blocklisted_word_in_ide_title(self, client):
+        """Test a project named after a blocked site doesn't flag the editor."""
+        for app, title in (
+            ("Code", "reddit-api — main.py"),
+            ("iTerm2", "~/src/youtube-dl"),
+            ("PyCharm", "twitter-bootstrap"),
+        ):
+            result = client.judge_activity("Write tests", app, title)
+            assert result["classification"] == "on_task"
+        client.ollama_client.chat.assert_not_called()
+
+    def test_batch_skips_local_items(self, client):
+        """Test judge_activities_batch only sends undecided items to the LLM."""
+        client.ollama_client.chat.return_value = {
+            "message": {"content": '{"classification": "unknown"}'}
+        }
+
+        results = client.judge_activities_batch(
+            [
+                {"goal": "Ship", "app": "Safari", "title": "Netflix"},
+                {"goal": "Ship", "app": "Terminal", "title": "zsh"},
+                {"goal": "Ship", "app": "Notion", "title": "Roadmap"},
+            ]
+        )
+
+        assert [r["classification"] for r in results] == [
+            "off_task",
+            "on_task",
+            "unknown",
+        ]
+        assert client.ollama_client.chat.call_count == 1
+
+
+@pytest.mark.unit
+class TestPromptPrefix:
+    """Tests for the static system prompt split."""
+
+    def test_judgments_share_system_message(self, client):
+        """Test different activities send an identical system message first."""
+        client.ollama_client.chat.return_value = {
+            "message": {"content": '{"classification": "on_task"}'}
+        }
+
+        client.judge_activity("Ship", "Notion", "main.py")
+        client.judge_activity("Relax", "Safari", "Hacker News")
+
+        first, second = [
+            c.kwargs["messages"] for c in client.ollama_client.chat.call_args_list
+        ]
+        assert first[0]["role"] == "system"
+        assert first[0] == second[0]
+        assert "Window title: Hacker News" in second[1]["content"]
+
+    def test_motivation_user_message_is_dynamic_only(self, client):
+        """Test the motivation user message carries only the live metrics."""
+        client.ollama_client.chat.return_value = {
+            "message": {"content": '{"state": "flow"}'}
+        }
+
+        client.detect_motivation_state("Ship", 42, 3.4, 2, ["Cursor", "Slack"])
+
+        system, user = client.ollama_client.chat.call_args.kwargs["messages"]
+        assert "Classify their state" in system["content"]
+        assert "Time on task: 42 minutes" in user["content"]
+        assert "Classify" not in user["content"]
+
+
+@pytest.mark.unit
+class TestExactResultCache:
+    """Tests for the exact-input TTL result cache."""
+
+    def test_identical_motivation_inputs_skip_llm(self, client):
+        """Test repeated motivation checks with the same inputs call the LLM once."""
+        client.ollama_client.chat.return_value = {
+            "message": {"content": '{"state": "flow"}'}
+        }
+
+        for _ in range(3):
+            result = client.detect_motivation_state("Ship", 30, 2.0, 1, ["Cursor"])
+
+        assert result == {"state": "flow"}
+        assert client.ollama_client.chat.call_count == 1
+
+    def test_identical_judgment_skips_semantic_cache(self, client):
+        """Test an exact repeat is answered before the similarity search runs."""
+        client.ollama_client.chat.return_value = {
+            "message": {"content": '{"classification": "on_task"}'}
+        }
+        client.judge_activity("Ship", "Notion", "main.py", ["Cursor"])
+
+        with patch.object(client._judge_semantic_cache, "lookup") as lookup:
+            client.judge_activity("Ship", "Notion", "main.py", ["Cursor"])
+
+        lookup.assert_not_called()
+
+    def test_entries_expire_after_ttl(self, client):
+        """Test inputs are re-judged once the TTL has passed."""
+        client.ollama_client.chat.return_value = {
+            "message": {"content": '{"state": "flow"}'}
+        }
+
+        with patch("code_sergeant.ai_client.RESULT_CACHE_TTL_SEC", 0.0):
+            client.detect_motivation_state("Ship", 30, 2.0, 1, ["Cursor"])
+            client.detect_motivation_state("Ship", 30, 2.0, 1, ["Cursor"])
+
+        assert client.ollama_client.chat.call_count == 2
+
+    def test_sweep_drops_stale_entries(self, client):
+        """Test stale entries are swept once the cache exceeds its sweep size."""
+        cache = {("old", i): (0.0, {}) for i in range(3)}
+
+        with patch("code_sergeant.ai_client.RESULT_CACHE_SWEEP_SIZE", 2):
+            client._store_result(cache, ("new",), {"state": "flow"})
+
+        assert list(cache) == [("new",)]
+
+
+@pytest.mark.unit
+class TestJudgeActivitiesBatch:
+    """Tests for judge_activities_batch()."""
+
+    ITEMS = [
+        {"goal": "Ship", "app": "Notion", "title": "main.py"},
+        {"goal": "Ship", "app": "Safari", "title": "Hacker News"},
+    ]
+
+    def test_openai_judges_all_items_in_one_request(self, client):
+        """Test OpenAI receives a single request and results map back by id."""
+        client.openai_client = MagicMock()
+        reply = {
+            "judgments": [
+                {"id": 1, "classification": "off_task"},
+                {"id": 0, "classification": "on_task"},
+            ]
+        }
+        client.openai_client.chat.completions.create.return_value = MagicMock(
+            choices=[MagicMock(message=MagicMock(content=json.dumps(reply)))]
+        )
+
+        results = client.judge_activities_batch(self.ITEMS)
+
+        assert [r["classification"] for r in results] == ["on_task", "off_task"]
+        assert client.openai_client.chat.completions.create.call_count == 1
+
+    def test_missing_id_gets_fallback(self, client):
+        """Test an item the model skipped gets the parse fallback."""
+        client.openai_client = MagicMock()
+        reply = {"judgments": [{"id": 0, "classification": "on_task"}]}
+        client.openai_client.chat.completions.create.return_value = MagicMock(
+            choices=[MagicMock(message=MagicMock(content=json.dumps(reply)))]
+        )
+
+        results = client.judge_activities_batch(self.ITEMS)
+
+        assert results[1]["classification"] == "unknown"
+
+    def test_ollama_judges_items_separately(self, client):
+        """Test Ollama gets one request per item."""
+        client.ollama_client.chat.side_effect = lambda **kw: {
+            "message": {
+                "content": json.dumps(
+                    {
+                        "classification": "off_task"
+                        if "Window title: Hacker News" in kw["messages"][-1]["content"]
+                        else "on_task"
+                    }
+                )
+            }
+        }
+
+        results = client.judge_activities_batch(self.ITEMS)
+
+        assert [r["classification"] for r in results] == ["on_task", "off_task"]
+        assert client.ollama_client.chat.call_count == 2
+
+    def test_cached_items_are_not_resent(self, client):
+        """Test items judged within the TTL are served from the result cache."""
+        client.ollama_client.chat.return_value = {
+            "message": {"content": '{"classification": "on_task"}'}
+        }
+        client.judge_activities_batch(self.ITEMS)
+        client.judge_activities_batch(self.ITEMS)
+
+        assert client.ollama_client.chat.call_count == 2
+
+
+@pytest.mark.unit
+class TestBatchAPI:
+    """Tests for submit_batch_judgments() and poll_batch()."""
+
+    def test_submit_uploads_jsonl_and_creates_batch(self, client):
+        """Test one chat-completions line is uploaded per item."""
+        client.openai_client = MagicMock()
+        client.openai_client.files.create.return_value = MagicMock(id="file-1")
+        client.openai_client.batches.create.return_value = MagicMock(id="batch-1")
+
+        batch_id = client.submit_batch_judgments(
+            [{"goal": "Ship", "app": "Cursor", "title": "main.py"}] * 2
+        )
+
+        assert batch_id == "batch-1"
+        name, fileobj = client.openai_client.files.create.call_args.kwargs["file"]
+        lines = [json.loads(line) for line in fileobj.read().decode().splitlines()]
+        assert [line["custom_id"] for line in lines] == ["judge-0", "judge-1"]
+        assert lines[0]["url"] == "/v1/chat/completions"
+        client.openai_client.batches.create.assert_called_once_with(
+            input_file_id="file-1",
+            endpoint="/v1/chat/completions",
+            completion_window="24h",
+        )
+
+    def test_poll_running_batch_returns_none(self, client):
+        """Test an in-progress batch reports no results yet."""
+        client.openai_client = MagicMock()
+        client.openai_client.batches.retrieve.return_value = MagicMock(
+            status="in_progress"
+        )
+
+        assert client.poll_batch("batch-1") is None
+
+    def test_poll_completed_batch_orders_results(self, client):
+        """Test results are returned in submission order."""
+        client.openai_client = MagicMock()
+        client.openai_client.batches.retrieve.return_value = MagicMock(
+            status="completed",
+            output_file_id="file-out",
+            request_counts=MagicMock(total=2),
+        )
+
+        def line(index, classification):
+            content = json.dumps({"classification": classification})
+            return json.dumps(
+                {
+                    "custom_id": f"judge-{index}",
+                    "response": {
+                        "body": {"choices": [{"message": {"content": content}}]}
+                    },
+                }
+            )
+
+        client.openai_client.files.content.return_value = MagicMock(
+            text="\n".join([line(1, "off_task"), line(0, "on_task")])
+        )
+
+        results = client.poll_batch("batch-1")
+
+        assert [r["classification"] for r in results] == ["on_task", "off_task"]
+
+    def test_poll_failed_batch_raises(self, client):
+        """Test a failed batch raises."""
+        client.openai_client = MagicMock()
+        client.openai_client.batches.retrieve.return_value = MagicMock(status="failed")
+
+        with pytest.raises(RuntimeError):
+            client.poll_batch("batch-1")
+
+    def test_submit_without_openai_raises(self, client):
+        """Test batches require OpenAI."""
+        with pytest.raises(RuntimeError):
+            client.submit_batch_judgments([])
+
+
+def _png(width, height):
+    """Encode a blank RGBA PNG of the given size."""
+    buf = io.BytesIO()
+    Image.new("RGBA", (width, height), (10, 20, 30, 255)).save(buf, "PNG")
+    return buf.getvalue()
+
+
+@pytest.mark.unit
+class TestVisionImageShrink:
+    """Tests for screenshot downsampling in analyze_image()."""
+
+    def test_large_png_becomes_small_jpeg(self):
+        """Test a large screenshot is capped at 1024px and re-encoded as JPEG."""
+        shrunk = Image.open(io.BytesIO(_shrink_image(_png(2560, 1440))))
+
+        assert shrunk.format == "JPEG"
+        assert shrunk.size == (1024, 576)
+
+    def test_small_jpeg_passes_through(self):
+        """Test an already-small JPEG is not re-encoded."""
+        buf = io.BytesIO()
+        Image.new("RGB", (800, 600)).save(buf, "JPEG")
+
+        assert _shrink_image(buf.getvalue()) == buf.getvalue()
+
+    def test_unreadable_bytes_pass_through(self):
+        """Test non-image input is sent unchanged."""
+        assert _shrink_image(b"not an image") == b"not an image"
+
+    def test_openai_upload_uses_jpeg_data_url(self, client):
+        """Test the OpenAI request labels the shrunk image as JPEG."""
+        client.openai_client = MagicMock()
+        client.openai_client.chat.completions.create.return_value = MagicMock(
+            choices=[MagicMock(message=MagicMock(content="coding"))]
+        )
+
+        client.analyze_image(_png(2000, 1000), "What is this?", use_local=False)
+
+        messages = client.openai_client.chat.completions.create.call_args.kwargs[
+            "messages"
+        ]
+        url = messages[0]["content"][1]["image_url"]["url"]
+        assert url.startswith("data:image/jpeg;base64,")
+        assert base64.b64decode(url.split(",", 1)[1])[:2] == b"\xff\xd8"
+
+    def test_repeated_frame_reuses_analysis(self, client):
+        """Test an unchanged screenshot is analyzed once."""
+        client.openai_client = MagicMock()
+        client.openai_client.chat.completions.create.return_value = MagicMock(
+            choices=[MagicMock(message=MagicMock(content="coding"))]
+        )
+
+        first = client.analyze_image(_png(800, 600), "What is this?", use_local=False)
+        second = client.analyze_image(_png(800, 600), "What is this?", use_local=False)
+
+        assert first == second == "coding"
+        assert client.openai_client.chat.completions.create.call_count == 1
+
+    def test_failed_analysis_not_cached(self, client):
+        """Test a backend failure is retried on the next frame."""
+        client.openai_client = MagicMock()
+        client.openai_client.chat.completions.create.side_effect = Exception("down")
+
+        for _ in range(2):
+            with pytest.raises(RuntimeError):
+                client.analyze_image(_png(800, 600), "What is this?", use_local=False)
+
+        assert client.openai_client.chat.completions.create.call_count == 2
+
+
+@pytest.mark.unit
+class TestAsyncAIClient:
+    """Tests for the AsyncAIClient coroutines."""
+
+    def test_achat_many_preserves_order(self, async_client):
+        """Test batched chats run together and return in request order."""
+        batch = [[{"role": "user", "content": text}] for text in ("a", "b", "c")]
+
+        replies = asyncio.run(async_client.achat_many(batch))
+
+        assert replies == ["a", "b", "c"]
+        assert async_client.async_ollama_client.chat.await_count == 3
+
+    def test_achat_falls_back_to_ollama(self, async_client):
+        """Test an OpenAI failure falls through to Ollama."""
+        async_client.async_openai_client = MagicMock()
+        async_client.async_openai_client.chat.completions.create = AsyncMock(
+            side_effect=Exception("rate limited")
+        )
+
+        reply = asyncio.run(async_client.achat([{"role": "user", "content": "hi"}]))
+
+        assert reply == "hi"
+
+    def test_ajudge_activity_parses_json(self, async_client):
+        """Test ajudge_activity decodes the model's JSON reply."""
+        judgment = {"classification": "on_task", "confidence": 0.9}
+        async_client.async_ollama_client.chat = AsyncMock(
+            return_value={"message": {"content": json.dumps(judgment)}}
+        )
+
+        result = asyncio.run(
+            async_client.ajudge_activity("Write tests", "Notion", "test_ai.py")
+        )
+
+        assert result == judgment
+
+    def test_achat_without_backends_raises(self, async_client):
+        """Test achat raises when neither backend is configured."""
+        async_client.async_ollama_client = None
+
+        with pytest.raises(RuntimeError):
+            asyncio.run(async_client.achat([{"role": "user", "content": "hi"}]))
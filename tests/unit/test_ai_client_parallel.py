@@ -0,0 +1,152 @@
+"""
+Unit tests for the parallel AI request processor.
+
+Tests:
+- TokenBucket budgeting
+- Worker pool ordering, concurrency bound and 429 retries
+"""
+
+import asyncio
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from code_sergeant.ai_client_parallel import (  # noqa: E402
+    ParallelRequestProcessor,
+    TokenBucket,
+    estimate_tokens,
+    is_rate_limit_error,
+)
+
+
+class RateLimited(Exception):
+    """Stand-in for openai.RateLimitError."""
+
+    status_code = 429
+
+
+@pytest.mark.unit
+class TestTokenBucket:
+    """Tests for TokenBucket."""
+
+    def test_acquire_within_budget_is_immediate(self):
+        """Test acquiring less than capacity consumes without waiting."""
+
+        async def scenario():
+            bucket = TokenBucket(per_minute=600)
+            await bucket.acquire(100)
+            return bucket.available
+
+        assert asyncio.run(scenario()) == pytest.approx(500, abs=1)
+
+    def test_acquire_waits_for_refill(self):
+        """Test an empty bucket sleeps until enough units accrue."""
+
+        async def scenario():
+            bucket = TokenBucket(per_minute=6000)  # 100 units/sec
+            await bucket.acquire(6000)
+            start = asyncio.get_running_loop().time()
+            await bucket.acquire(5)
+            return asyncio.get_running_loop().time() - start
+
+        assert asyncio.run(scenario()) >= 0.04
+
+
+@pytest.mark.unit
+class TestParallelRequestProcessor:
+    """Tests for ParallelRequestProcessor.run()."""
+
+    def test_results_keep_item_order(self):
+        """Test results line up with inputs despite out-of-order completion."""
+
+        async def send(item):
+            await asyncio.sleep(0.01 * (3 - item))
+            return item * 10
+
+        results = asyncio.run(ParallelRequestProcessor().run([0, 1, 2], send))
+
+        assert results == [0, 10, 20]
+
+    def test_concurrency_is_bounded(self):
+        """Test no more than max_concurrency requests are in flight."""
+        in_flight = 0
+        peak = 0
+
+        async def send(item):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return item
+
+        processor = ParallelRequestProcessor(max_concurrency=2)
+        asyncio.run(processor.run(list(range(6)), send))
+
+        assert peak == 2
+
+    def test_rate_limited_request_is_retried(self):
+        """Test a 429 is requeued and succeeds on a later attempt."""
+        attempts = {"count": 0}
+
+        async def send(item):
+            attempts["count"] += 1
+            if attempts["count"] < 3:
+                raise RateLimited()
+            return "ok"
+
+        with patch("code_sergeant.ai_client_parallel.RETRY_BACKOFF_CAP_SEC", 0):
+            results = asyncio.run(ParallelRequestProcessor().run(["req"], send))
+
+        assert results == ["ok"]
+        assert attempts["count"] == 3
+
+    def test_gives_up_after_max_attempts(self):
+        """Test a persistent 429 is reported after max_attempts."""
+        attempts = {"count": 0}
+
+        async def send(item):
+            attempts["count"] += 1
+            raise RateLimited()
+
+        processor = ParallelRequestProcessor(max_attempts=3)
+        with patch("code_sergeant.ai_client_parallel.RETRY_BACKOFF_CAP_SEC", 0):
+            results = asyncio.run(processor.run(["req"], send))
+
+        assert isinstance(results[0], RateLimited)
+        assert attempts["count"] == 3
+
+    def test_other_errors_are_not_retried(self):
+        """Test non-429 failures are recorded without retrying."""
+        attempts = {"count": 0}
+
+        async def send(item):
+            attempts["count"] += 1
+            raise ValueError("bad request")
+
+        results = asyncio.run(ParallelRequestProcessor().run(["req"], send))
+
+        assert isinstance(results[0], ValueError)
+        assert attempts["count"] == 1
+
+
+@pytest.mark.unit
+class TestHelpers:
+    """Tests for token estimation and 429 detection."""
+
+    def test_estimate_tokens(self):
+        """Test estimate covers prompt characters plus completion budget."""
+        messages = [{"role": "user", "content": "x" * 400}]
+
+        assert estimate_tokens(messages, max_tokens=50) == 150
+
+    def test_is_rate_limit_error(self):
+        """Test only 429 responses count as rate limiting."""
+        assert is_rate_limit_error(RateLimited())
+        assert not is_rate_limit_error(ValueError())
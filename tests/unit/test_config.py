@@ -0,0 +1,252 @@
+"""
+Unit tests for configuration management.
+
+Tests config.json load/save behavior:
+- Round-trips and default merging
+- Secret scrubbing
+- Invalid file recovery
+- deep_merge and default-template isolation
+- mtime-keyed load cache
+- Personality accessors
+- .env updates via set_env_var
+"""
+
+import json
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from code_sergeant.config import (  # noqa: E402
+    DEFAULT_CONFIG,
+    deep_merge,
+    get_personality_name,
+    get_wake_word,
+    load_config,
+    save_config,
+    set_env_var,
+)
+
+
+@pytest.fixture
+def config_path(tmp_path):
+    """Path to a config.json inside a temp directory."""
+    return str(tmp_path / "config.json")
+
+
+@pytest.mark.unit
+class TestLoadSaveConfig:
+    """Tests for load_config() and save_config()."""
+
+    def test_missing_file_creates_defaults(self, config_path):
+        """Test a missing config file is created from defaults."""
+        config = load_config(config_path)
+
+        assert config == DEFAULT_CONFIG
+        assert os.path.exists(config_path)
+
+    def test_round_trip_merges_defaults(self, config_path):
+        """Test saved overrides load back on top of the defaults."""
+        save_config(
+            {"judge_interval_sec": 20, "ollama": {"model": "qwen"}}, config_path
+        )
+
+        config = load_config(config_path)
+
+        assert config["judge_interval_sec"] == 20
+        assert config["ollama"]["model"] == "qwen"
+        assert config["ollama"]["base_url"] == DEFAULT_CONFIG["ollama"]["base_url"]
+
+    def test_saved_file_is_indented_json(self, config_path):
+        """Test the written file stays human-editable JSON."""
+        save_config({"judge_interval_sec": 20}, config_path)
+
+        with open(config_path) as f:
+            text = f.read()
+
+        assert json.loads(text) == {"judge_interval_sec": 20}
+        assert text.startswith('{\n  "judge_interval_sec"')
+
+    def test_non_ascii_round_trips_as_utf8(self, config_path):
+        """Test non-ASCII values are written as UTF-8 bytes and read back."""
+        save_config({"personality": {"description": "Señor — 軍曹"}}, config_path)
+
+        with open(config_path, "rb") as f:
+            json.loads(f.read().decode("utf-8"))
+
+        config = load_config(config_path)
+        assert config["personality"]["description"] == "Señor — 軍曹"
+
+    def test_secrets_not_written(self, config_path):
+        """Test API keys are scrubbed before hitting disk."""
+        save_config({"openai": {"api_key": "sk-secret"}}, config_path)
+
+        with open(config_path) as f:
+            assert "sk-secret" not in f.read()
+
+    def test_invalid_json_falls_back_to_defaults(self, config_path):
+        """Test a corrupt file is replaced with defaults."""
+        with open(config_path, "w") as f:
+            f.write("{not json")
+
+        assert load_config(config_path) == DEFAULT_CONFIG
+
+
+@pytest.mark.unit
+class TestDeepMerge:
+    """Tests for deep_merge() and default isolation."""
+
+    def test_nested_override(self):
+        """Test nested keys merge while siblings are kept."""
+        base = {"a": {"x": 1, "y": {"z": 2}}, "b": 3}
+
+        merged = deep_merge(base, {"a": {"y": {"z": 9}}, "c": 4})
+
+        assert merged == {"a": {"x": 1, "y": {"z": 9}}, "b": 3, "c": 4}
+
+    def test_inputs_not_modified(self):
+        """Test neither input is mutated."""
+        base = {"a": {"x": 1}}
+        override = {"a": {"x": 2}}
+
+        deep_merge(base, override)
+
+        assert base == {"a": {"x": 1}}
+        assert override == {"a": {"x": 2}}
+
+    def test_default_top_level_is_read_only(self):
+        """Test the default template's top-level keys can't be reassigned."""
+        with pytest.raises(TypeError):
+            DEFAULT_CONFIG["poll_interval_sec"] = 1
+
+    def test_loaded_defaults_are_independent(self, config_path):
+        """Test mutating a loaded default config leaves the template intact."""
+        config = load_config(config_path)
+        config["ollama"]["model"] = "changed"
+
+        assert DEFAULT_CONFIG["ollama"]["model"] == "llama3.2"
+
+    def test_save_does_not_scrub_caller_config(self, config_path):
+        """Test scrubbing secrets for disk leaves the in-memory config alone."""
+        config = {"openai": {"api_key": "sk-secret"}}
+
+        save_config(config, config_path)
+
+        assert config["openai"]["api_key"] == "sk-secret"
+
+
+@pytest.mark.unit
+class TestConfigCache:
+    """Tests for the load_config() file cache."""
+
+    def test_unchanged_file_not_reparsed(self, config_path):
+        """Test repeated loads of an unchanged file parse it once."""
+        save_config({"judge_interval_sec": 20}, config_path)
+
+        with patch("code_sergeant.config._loads", wraps=json.loads) as loads:
+            load_config(config_path)
+            load_config(config_path)
+
+        assert loads.call_count == 1
+
+    def test_cached_copies_are_independent(self, config_path):
+        """Test callers can't corrupt the cached config."""
+        save_config({"judge_interval_sec": 20}, config_path)
+        load_config(config_path)["ollama"]["model"] = "changed"
+
+        assert load_config(config_path)["ollama"]["model"] == "llama3.2"
+
+    def test_save_invalidates_cache(self, config_path):
+        """Test a save is visible to the next load."""
+        save_config({"judge_interval_sec": 20}, config_path)
+        load_config(config_path)
+
+        save_config({"judge_interval_sec": 30}, config_path)
+
+        assert load_config(config_path)["judge_interval_sec"] == 30
+
+    def test_external_edit_is_picked_up(self, config_path):
+        """Test a file changed behind our back is re-read."""
+        save_config({"judge_interval_sec": 20}, config_path)
+        load_config(config_path)
+
+        with open(config_path, "w") as f:
+            f.write('{"judge_interval_sec": 45}')
+        os.utime(config_path, ns=(0, 1))
+
+        assert load_config(config_path)["judge_interval_sec"] == 45
+
+
+@pytest.mark.unit
+class TestPersonalityAccessors:
+    """Tests for get_wake_word() and get_personality_name()."""
+
+    def test_accessors_handle_missing_section(self):
+        """Test the dict accessors default when no personality is configured."""
+        assert get_wake_word({}) == "hey sergeant"
+        assert get_personality_name({"personality": None}) == "sergeant"
+        assert get_wake_word({"personality": {"wake_word_name": "coach"}}) == (
+            "hey coach"
+        )
+
+
+@pytest.fixture
+def env_path(tmp_path):
+    """Path to a .env inside a temp directory, with the process env restored."""
+    with patch.dict(os.environ, {}):
+        yield str(tmp_path / ".env")
+
+
+@pytest.mark.unit
+class TestSetEnvVar:
+    """Tests for set_env_var()."""
+
+    def test_creates_private_file(self, env_path):
+        """Test a new .env is created owner-only and the env var is set."""
+        set_env_var("OPENAI_API_KEY", " sk-new ", env_path)
+
+        with open(env_path) as f:
+            assert f.read() == "OPENAI_API_KEY=sk-new\n"
+        assert os.stat(env_path).st_mode & 0o777 == 0o600
+        assert os.environ["OPENAI_API_KEY"] == "sk-new"
+
+    def test_appends_new_key(self, env_path):
+        """Test a new key is appended, adding a missing trailing newline."""
+        with open(env_path, "w") as f:
+            f.write("OTHER=1")
+
+        set_env_var("OPENAI_API_KEY", "sk-new", env_path)
+
+        with open(env_path) as f:
+            assert f.read() == "OTHER=1\nOPENAI_API_KEY=sk-new\n"
+
+    def test_replaces_existing_key_in_place(self, env_path):
+        """Test an existing key is rewritten without touching other lines."""
+        with open(env_path, "w") as f:
+            f.write("A=1\nOPENAI_API_KEY=sk-old\nOPENAI_API_KEY_2=keep\n")
+
+        set_env_var("OPENAI_API_KEY", "sk-new", env_path)
+
+        with open(env_path) as f:
+            assert f.read() == "A=1\nOPENAI_API_KEY=sk-new\nOPENAI_API_KEY_2=keep\n"
+        assert not os.path.exists(env_path + ".tmp")
+
+    def test_value_with_backslashes_written_verbatim(self, env_path):
+        """Test replacement values aren't treated as regex templates."""
+        with open(env_path, "w") as f:
+            f.write("KEY=old\n")
+
+        set_env_var("KEY", r"a\1b", env_path)
+
+        with open(env_path) as f:
+            assert f.read() == "KEY=a\\1b\n"
+
+    def test_empty_key_rejected(self, env_path):
+        """Test an empty key raises."""
+        with pytest.raises(ValueError):
+            set_env_var("", "x", env_path)
@@ -6,15 +6,17 @@ Tests session lifecycle and state management:
 - State transitions
 - Event handling
 - Goal management
+- Phrase caching
+- Background config saves
 """
 
 import os
-import queue
 import sys
 import threading
 import time
+from dataclasses import asdict
 from datetime import datetime
-from unittest.mock import MagicMock, Mock, patch
+from unittest.mock import MagicMock, Mock, PropertyMock, patch
 
 import pytest
 
@@ -22,6 +24,7 @@ sys.path.insert(
     0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 )
 
+from code_sergeant.config import DEFAULT_CONFIG, deep_merge  # noqa: E402
 from code_sergeant.models import ActivityEvent, Judgment, SessionStats  # noqa: E402
 
 
@@ -84,32 +87,378 @@ class TestSessionLifecycleBasic:
         assert stats.distractions_count == 2
 
 
+@pytest.mark.unit
+class TestSessionStartup:
+    """Tests for starting session components off the caller's thread."""
+
+    @staticmethod
+    def _controller(make_controller, **config_overrides):
+        controller = make_controller(**config_overrides)
+        controller.wake_word_detector = MagicMock()
+        controller._phrase = MagicMock(return_value="")
+        controller._start_workers = MagicMock()
+        return controller
+
+    def test_start_returns_before_components_start(self, make_controller):
+        """Test a slow component start doesn't block start_session."""
+        controller = self._controller(
+            make_controller, voice_activation={"enabled": True}
+        )
+        release = threading.Event()
+        controller.wake_word_detector.start.side_effect = lambda: release.wait(5)
+
+        start = time.monotonic()
+        controller.start_session("Write tests")
+
+        assert time.monotonic() - start < 1
+        assert controller.state.session_active
+        controller._start_workers.assert_called_once()
+
+        release.set()
+        controller._wait_for_startup()
+        assert controller.state.wake_word_active
+        controller.motivation_monitor.start.assert_called_once_with("Write tests")
+        controller.pomodoro.start_work.assert_not_called()
+
+    def test_failed_component_does_not_stop_others(self, make_controller):
+        """Test one component raising is logged and the rest still start."""
+        controller = self._controller(
+            make_controller, pomodoro={"auto_start_with_session": True}
+        )
+        controller.pomodoro.start_work.side_effect = RuntimeError("no timer")
+
+        controller.start_session("Write tests")
+        controller._wait_for_startup()
+
+        controller.motivation_monitor.start.assert_called_once_with("Write tests")
+
+    def test_wait_for_startup_clears_pending(self, make_controller):
+        """Test waiting hands back control once every start has finished."""
+        controller = self._controller(make_controller)
+        controller.start_session("Write tests")
+
+        controller._wait_for_startup()
+
+        assert controller._startup_futures == []
+
+
+@pytest.mark.unit
+class TestTaskExecutor:
+    """Tests for one-shot tasks on the shared executor."""
+
+    def test_tasks_reuse_pool_threads(self, make_controller):
+        """Test repeated tasks run on the pool, not fresh threads."""
+        from code_sergeant.controller import TASK_EXECUTOR_WORKERS
+
+        controller = make_controller()
+        names = set()
+
+        for _ in range(5):
+            controller._submit_task(
+                "probe", lambda: names.add(threading.current_thread().name)
+            ).result(timeout=1)
+
+        assert len(names) <= TASK_EXECUTOR_WORKERS
+        assert threading.current_thread().name not in names
+
+    def test_task_failure_is_logged(self, make_controller, caplog):
+        """Test an exception escaping a task is logged, not lost."""
+        controller = make_controller()
+
+        def fail():
+            raise PermissionError("microphone")
+
+        future = controller._submit_task("Voice interaction", fail)
+        with pytest.raises(PermissionError):
+            future.result(timeout=1)
+        controller._executor.shutdown(wait=True)
+
+        assert "Voice interaction failed: microphone" in caplog.text
+
+    def test_shutdown_flushes_config_saves(self, make_controller):
+        """Test shutdown waits for queued config writes."""
+        controller = make_controller()
+        controller.wake_word_detector = MagicMock()
+        saved = []
+        controller._io_executor.submit(lambda: (time.sleep(0.1), saved.append(1)))
+
+        controller.shutdown()
+
+        assert saved == [1]
+        controller.wake_word_detector.stop.assert_called_once()
+        assert controller.state.wake_word_active is False
+        controller.native_monitor.stop.assert_called_once_with()
+
+
+@pytest.mark.unit
+class TestVoiceWorkerReuse:
+    """Tests for the shared, lazily built VoiceWorker."""
+
+    def test_worker_built_once(self, make_controller):
+        """Test voice and note-taking share one worker across calls."""
+        controller = make_controller()
+
+        with patch("code_sergeant.controller.VoiceWorker") as voice_worker_cls:
+            first = controller._get_voice_worker()
+            second = controller._get_voice_worker()
+
+        assert first is second
+        voice_worker_cls.assert_called_once()
+
+    def test_worker_rebuilt_on_config_change(self, make_controller):
+        """Test a changed model rebuilds the worker."""
+        from code_sergeant.controller import ControllerConfig
+
+        controller = make_controller()
+
+        with patch(
+            "code_sergeant.controller.VoiceWorker", side_effect=lambda **kw: Mock()
+        ):
+            first = controller._get_voice_worker()
+            controller.config["ollama"] = {"model": "qwen", "base_url": "x"}
+            controller.cfg = ControllerConfig.from_config(controller.config)
+            second = controller._get_voice_worker()
+
+        assert first is not second
+
+    def test_prepare_recording_overlaps_drain_and_priming(self, make_controller):
+        """Test TTS draining and mic priming run concurrently."""
+        controller = make_controller()
+        controller.tts_service.clear_queue.return_value = 2
+        controller.tts_service.wait_for_completion.side_effect = (
+            lambda timeout: time.sleep(0.2)
+        )
+        voice_worker = Mock()
+        voice_worker.prime_microphone.side_effect = lambda: time.sleep(0.2)
+
+        start = time.monotonic()
+        cleared = controller._prepare_recording(voice_worker)
+        elapsed = time.monotonic() - start
+
+        assert cleared == 2
+        voice_worker.prime_microphone.assert_called_once()
+        assert elapsed < 0.35
+
+    def test_prepare_recording_from_busy_task_pool(self, make_controller):
+        """Test priming doesn't wait on the pool the voice task runs on."""
+        from code_sergeant.controller import TASK_EXECUTOR_WORKERS
+
+        controller = make_controller()
+        controller.tts_service.clear_queue.return_value = 0
+        voice_worker = Mock()
+        release = threading.Event()
+        for _ in range(TASK_EXECUTOR_WORKERS - 1):
+            controller._executor.submit(release.wait, 5)
+
+        try:
+            future = controller._executor.submit(
+                controller._prepare_recording, voice_worker
+            )
+            future.result(timeout=1)
+        finally:
+            release.set()
+
+        voice_worker.prime_microphone.assert_called_once()
+
+    def test_mic_release_resumes_without_fixed_pause(self, make_controller):
+        """Test a released mic is reused immediately and a held one waits."""
+        controller = make_controller()
+        voice_worker = Mock()
+        voice_worker.mic_released = threading.Event()
+
+        with patch("code_sergeant.controller.time.sleep") as sleep:
+            voice_worker.mic_released.set()
+            controller._wait_for_mic_release(voice_worker)
+            sleep.assert_not_called()
+
+            voice_worker.mic_released.clear()
+            with patch("code_sergeant.controller.MIC_RELEASE_TIMEOUT_SEC", 0.01):
+                controller._wait_for_mic_release(voice_worker)
+            sleep.assert_called_once()
+
+    def test_mic_exclusive_pauses_and_resumes_wake_word(self, make_controller):
+        """Test the detector is paused up front and resumed even on errors."""
+        controller = make_controller()
+        controller.state.wake_word_active = True
+        controller.wake_word_detector = Mock()
+        controller.tts_service.clear_queue.return_value = 0
+        voice_worker = Mock()
+        voice_worker.mic_released = threading.Event()
+        voice_worker.mic_released.set()
+
+        was_active = controller._pause_wake_word("test")
+        assert controller.state.wake_word_active is False
+        controller.wake_word_detector.stop.assert_called_once()
+
+        with pytest.raises(RuntimeError):
+            with controller._mic_exclusive(voice_worker, was_active, "test"):
+                raise RuntimeError("recording failed")
+
+        controller.wake_word_detector.start.assert_called_once()
+        assert controller.state.wake_word_active is True
+
+
 @pytest.mark.unit
 class TestEventQueue:
     """Tests for event queue functionality."""
 
-    def test_event_queue_operations(self):
-        """Test basic event queue operations."""
-        event_queue = queue.Queue()
+    def test_event_queue_operations(self, make_controller):
+        """Test the controller's queue hands back events in the order queued."""
+        controller = make_controller()
 
-        # Add events
-        event_queue.put({"type": "activity_update", "data": "test"})
-        event_queue.put({"type": "judgment_update", "data": "test2"})
+        controller.event_queue.append({"type": "activity_update", "data": "test"})
+        controller.event_queue.append({"type": "judgment_update", "data": "test2"})
 
-        # Verify events
-        event1 = event_queue.get_nowait()
-        event2 = event_queue.get_nowait()
+        event1, event2 = controller.event_queue.drain()
 
         assert event1["type"] == "activity_update"
         assert event2["type"] == "judgment_update"
 
-    def test_event_queue_empty(self):
-        """Test empty event queue handling."""
-        event_queue = queue.Queue()
+    def test_event_queue_empty(self, make_controller):
+        """Test draining an empty controller queue returns no events."""
+        controller = make_controller()
+
+        assert controller.event_queue.drain() == []
+
+    def test_drain_takes_batch_in_order(self):
+        """Test drain returns queued events oldest first and empties the queue."""
+        from code_sergeant.controller import EventQueue
+
+        event_queue = EventQueue()
+        for i in range(3):
+            event_queue.append({"type": "test", "id": i})
+
+        batch = event_queue.drain()
+        event_queue.append({"type": "test", "id": 3})
+
+        assert [event["id"] for event in batch] == [0, 1, 2]
+        assert [event["id"] for event in event_queue.drain()] == [3]
+        assert len(event_queue) == 0
+
+    def test_status_updates_use_bounded_ring(self):
+        """Test activity/judgment updates keep only the newest when overfull."""
+        from code_sergeant.controller import UPDATE_RING_SIZE, EventQueue
+
+        event_queue = EventQueue()
+        for i in range(UPDATE_RING_SIZE + 5):
+            event_queue.append({"type": "activity_update", "id": i})
+        event_queue.append({"type": "error_event", "id": "err"})
+
+        batch = event_queue.drain()
+
+        assert len(batch) == UPDATE_RING_SIZE + 1
+        assert batch[0]["id"] == 5
+        assert batch[-2]["id"] == UPDATE_RING_SIZE + 4
+        assert batch[-1]["id"] == "err"
+        assert len(event_queue) == 0
+
+    def test_drain_keeps_order_across_ring_and_deque(self):
+        """Test a stats tick queued before a judgment update is handled first."""
+        from code_sergeant.controller import EventQueue
 
-        # Should raise Empty when queue is empty
-        with pytest.raises(queue.Empty):
-            event_queue.get_nowait()
+        event_queue = EventQueue()
+        event_queue.append({"type": "stats_tick", "seconds": 10})
+        event_queue.append({"type": "judgment_update", "judgment": None})
+        event_queue.append({"type": "reminder", "message": "Hydrate"})
+        event_queue.append({"type": "activity_update", "activity": None})
+
+        assert [event["type"] for event in event_queue.drain()] == [
+            "stats_tick",
+            "judgment_update",
+            "reminder",
+            "activity_update",
+        ]
+
+    def test_other_events_never_dropped(self):
+        """Test non-update events are all kept regardless of count."""
+        from code_sergeant.controller import UPDATE_RING_SIZE, EventQueue
+
+        event_queue = EventQueue()
+        for i in range(UPDATE_RING_SIZE * 2):
+            event_queue.append({"type": "voice_command", "id": i})
+
+        assert len(event_queue.drain()) == UPDATE_RING_SIZE * 2
+
+    def test_process_events_tick_drains_in_order(self, make_controller):
+        """Test process_events_tick handles every queued event in FIFO order."""
+        controller = make_controller()
+        for i in range(3):
+            controller.event_queue.append({"type": "test", "id": i})
+        handled = []
+        controller._handle_event = handled.append
+
+        controller.process_events_tick()
+
+        assert [event["id"] for event in handled] == [0, 1, 2]
+        assert len(controller.event_queue) == 0
+
+    def test_failing_event_does_not_drop_batch(self, make_controller):
+        """Test an exception in one handler doesn't lose the rest of the batch."""
+        controller = make_controller()
+        for i in range(3):
+            controller.event_queue.append({"type": "test", "id": i})
+        handled = []
+
+        def handle(event):
+            if event["id"] == 1:
+                raise ValueError("bad event")
+            handled.append(event["id"])
+
+        controller._handle_event = handle
+        controller.process_events_tick()
+
+        assert handled == [0, 2]
+
+
+@pytest.mark.unit
+class TestEventDispatch:
+    """Tests for table-driven event and voice command dispatch."""
+
+    def test_known_event_routed_to_handler(self, make_controller):
+        """Test an event reaches the handler registered for its type."""
+        controller = make_controller()
+        handler = MagicMock()
+        controller._handlers["error_event"] = handler
+        event = {"type": "error_event", "message": "boom"}
+
+        controller._handle_event(event)
+
+        handler.assert_called_once_with(event)
+
+    def test_unknown_event_ignored(self, make_controller):
+        """Test an unregistered event type is logged, not raised."""
+        controller = make_controller()
+
+        controller._handle_event({"type": "no_such_event"})
+
+    def test_voice_command_with_args(self, make_controller):
+        """Test argument commands receive their args and the event."""
+        controller = make_controller()
+        controller.save_voice_note = MagicMock()
+
+        controller._handle_voice_command(
+            {"command": "save_note", "args": "buy milk", "transcript": "note buy milk"}
+        )
+
+        controller.save_voice_note.assert_called_once_with("buy milk", "note buy milk")
+
+    def test_voice_command_missing_required_args_skipped(self, make_controller):
+        """Test commands that need args do nothing without them."""
+        controller = make_controller()
+        controller.start_session = MagicMock()
+
+        controller._handle_voice_command({"command": "start_session", "args": None})
+
+        controller.start_session.assert_not_called()
+
+    def test_voice_command_uses_current_pomodoro(self, make_controller):
+        """Test handlers resolve attributes at call time."""
+        controller = make_controller()
+        controller.pomodoro = MagicMock()
+
+        controller._handle_voice_command({"command": "skip_pomodoro"})
+
+        controller.pomodoro.skip.assert_called_once()
 
 
 @pytest.mark.unit
@@ -176,6 +525,49 @@ class TestActivityTracking:
         assert len(history) == max_history
         assert history[0].app == "App10"
 
+    def test_activity_update_keeps_recent_history(self, make_controller):
+        """Test _handle_activity_update keeps only the most recent activities."""
+        from code_sergeant.controller import ACTIVITY_HISTORY_SIZE
+
+        controller = make_controller()
+
+        for i in range(ACTIVITY_HISTORY_SIZE + 5):
+            controller._handle_activity_update(
+                {
+                    "activity": ActivityEvent(
+                        ts=datetime.now(), app=f"App{i}", title=f"Window{i}"
+                    )
+                }
+            )
+
+        assert len(controller.activity_history) == ACTIVITY_HISTORY_SIZE
+        assert controller.activity_history[0].app == "App5"
+        assert controller.current_activity.app == f"App{ACTIVITY_HISTORY_SIZE + 4}"
+
+    def test_activity_strings_are_interned(self, make_controller):
+        """Test repeated app/title strings share one object, long titles excepted."""
+        from code_sergeant.controller import INTERN_TITLE_MAX_LEN
+
+        controller = make_controller()
+        long_title = "x" * INTERN_TITLE_MAX_LEN
+
+        for title in ("main.py", long_title):
+            for _ in range(2):
+                controller._handle_activity_update(
+                    {
+                        "activity": {
+                            "ts": datetime.now(),
+                            "app": "".join(["Co", "de"]),
+                            "title": title[:1] + title[1:],
+                        }
+                    }
+                )
+
+        first, second, third, fourth = controller.activity_history
+        assert first.app is second.app is third.app
+        assert first.title is second.title
+        assert third.title is not fourth.title
+
 
 @pytest.mark.unit
 class TestJudgmentTracking:
@@ -221,6 +613,236 @@ class TestJudgmentTracking:
         assert last_judgment.classification == "off_task"
 
 
+@pytest.mark.unit
+class TestJudgmentStatusText:
+    """Tests for the cached judgment status formatter."""
+
+    def test_matches_percent_format(self):
+        """Test the cached text matches the inline f-string it replaced."""
+        from code_sergeant.controller import _format_judgment
+
+        assert _format_judgment("on_task", 0.9) == "on_task (90%)"
+        assert _format_judgment("off_task", 0.955) == f"off_task ({0.955:.0%})"
+
+    def test_repeat_inputs_hit_cache(self):
+        """Test repeated judgments reuse the formatted string."""
+        from code_sergeant.controller import _format_judgment
+
+        _format_judgment.cache_clear()
+        for _ in range(5):
+            _format_judgment("thinking", 0.8)
+
+        assert _format_judgment.cache_info().hits == 4
+
+
+@pytest.mark.unit
+class TestJudgmentUpdate:
+    """Tests for _handle_judgment_update."""
+
+    @pytest.fixture
+    def controller(self, make_controller):
+        controller = make_controller()
+        controller._start_drill_worker = MagicMock()
+        controller._stop_drill_worker = MagicMock()
+        return controller
+
+    @staticmethod
+    def _judgment(**overrides):
+        fields = dict(
+            classification="off_task",
+            confidence=0.9,
+            reason="Video site",
+            say="Back to work!",
+            action="warn",
+        )
+        fields.update(overrides)
+        return Judgment(**fields)
+
+    def test_repeat_keeps_displayed_judgment(self, controller):
+        """Test a near-identical repeat leaves the display state untouched."""
+        first = self._judgment()
+        controller._handle_judgment_update({"judgment": first})
+
+        repeat = self._judgment(confidence=0.91, say="Eyes front!", reason="Video")
+        controller._handle_judgment_update({"judgment": repeat})
+
+        assert controller.state.last_judgment_obj is first
+        assert controller.last_judgment is first
+        assert controller.state.last_judgment == "off_task (90%)"
+
+    def test_repeat_counts_but_does_not_rewarn(self, controller):
+        """Test a repeated off-task judgment counts without re-firing the drill."""
+        for _ in range(2):
+            controller._handle_judgment_update({"judgment": self._judgment()})
+
+        assert controller.state.stats.distractions_count == 2
+        controller.tts_service.speak.assert_called_once_with("Back to work!")
+        controller._start_drill_worker.assert_called_once()
+
+    def test_confidence_shift_is_not_a_repeat(self, controller):
+        """Test a confidence change beyond the tolerance updates the display."""
+        controller._handle_judgment_update({"judgment": self._judgment()})
+
+        update = self._judgment(confidence=0.8)
+        controller._handle_judgment_update({"judgment": update})
+
+        assert controller.state.last_judgment_obj is update
+        assert controller.tts_service.speak.call_count == 2
+
+    def test_changed_judgment_updates_display(self, controller):
+        """Test a different judgment replaces the displayed one."""
+        controller._handle_judgment_update({"judgment": self._judgment()})
+
+        update = self._judgment(
+            classification="on_task", confidence=0.8, action="none", say=""
+        )
+        controller._handle_judgment_update({"judgment": update})
+
+        assert controller.state.last_judgment_obj is update
+        assert controller.state.last_judgment == "on_task (80%)"
+        controller._stop_drill_worker.assert_called_once()
+
+
+@pytest.mark.unit
+class TestJudgeAndStatsWorkers:
+    """Tests for event-driven judging and interval stats accumulation."""
+
+    @staticmethod
+    def _judgment(classification, action="none"):
+        return Judgment(
+            classification=classification,
+            confidence=0.9,
+            reason="",
+            say="",
+            action=action,
+        )
+
+    def test_judges_only_on_activity_change(self, make_controller):
+        """Test the judge worker waits for a change and skips repeats."""
+        controller = make_controller(judge_interval_sec=60)
+        controller.state.goal = "Write tests"
+        controller.native_monitor.wait_for_change.side_effect = (
+            lambda timeout: controller.stop_event.wait(timeout)
+        )
+        controller.current_activity = ActivityEvent(
+            ts=datetime.now(), app="Code", title="main.py"
+        )
+        controller.activity_history.append(controller.current_activity)
+        controller.judge.judge.return_value = self._judgment("on_task")
+
+        with patch("code_sergeant.controller.JUDGE_DEBOUNCE_SEC", 0.01):
+            controller._start_workers()
+            try:
+                time.sleep(0.1)
+                assert controller.judge.judge.call_count == 0
+
+                controller._activity_changed.set()
+                time.sleep(0.1)
+                controller._activity_changed.set()
+                time.sleep(0.1)
+            finally:
+                controller.stop_event.set()
+                controller._activity_changed.set()
+                controller._join_workers(timeout=2.0)
+
+        assert controller.judge.judge.call_count == 1
+        judgments = [
+            event["judgment"]
+            for event in controller.event_queue.drain()
+            if event["type"] == "judgment_update"
+        ]
+        assert judgments == [controller.judge.judge.return_value]
+
+    def test_activity_identity_tracks_app_and_title(self):
+        """Test the identity ignores everything but app and title."""
+        first = ActivityEvent(ts=datetime.now(), app="Code", title="main.py")
+        again = ActivityEvent(
+            ts=datetime.now(), app="Code", title="main.py", is_afk=True
+        )
+        other = ActivityEvent(ts=datetime.now(), app="Code", title="test.py")
+
+        assert first.identity == again.identity
+        assert first.identity != other.identity
+        assert first == ActivityEvent(ts=first.ts, app="Code", title="main.py")
+
+    def test_activity_event_round_trips_through_asdict(self):
+        """Test identity is not a field, so asdict() output rebuilds the event."""
+        event = ActivityEvent(ts=datetime.now(), app="Code", title="main.py")
+
+        assert ActivityEvent(**asdict(event)) == event
+
+    def test_poller_emits_only_on_identity_change(self, make_controller):
+        """Test the poller posts an update only when app or title changes."""
+        polls = [("Code", "main.py"), ("Code", "main.py"), ("Code", "test.py")]
+        controller = make_controller()
+        controller.stop_event = Mock()
+        controller.stop_event.is_set.side_effect = [False] * len(polls) + [True]
+        controller.native_monitor.get_current_activity.side_effect = [
+            ActivityEvent(ts=datetime.now(), app=app, title=title)
+            for app, title in polls
+        ]
+
+        controller._activity_poller_loop()
+
+        titles = [event["activity"].title for event in controller.event_queue.drain()]
+        assert titles == ["main.py", "test.py"]
+
+    def test_stats_ticks_measure_elapsed_time(self, make_controller):
+        """Test ticks report measured time, carrying sub-second remainders."""
+        controller = make_controller(judge_interval_sec=10)
+        controller.stop_event = Mock()
+        controller.stop_event.wait.side_effect = [False, False, True]
+
+        with patch(
+            "code_sergeant.controller.time.monotonic_ns",
+            side_effect=[0, 10_600_000_000, 20_000_000_000],
+        ):
+            controller._stats_worker_loop()
+
+        ticks = [event["seconds"] for event in controller.event_queue.drain()]
+        assert ticks == [10, 10]
+
+    def test_stats_tick_credits_latest_judgment(self, make_controller):
+        """Test a tick event adds its seconds on the event thread."""
+        controller = make_controller()
+        controller.state.session_active = True
+        controller.current_activity = ActivityEvent(
+            ts=datetime.now(), app="Code", title="main.py"
+        )
+
+        controller._handle_event({"type": "stats_tick", "seconds": 10})
+        controller.last_judgment = self._judgment("on_task")
+        controller._handle_event({"type": "stats_tick", "seconds": 10})
+
+        assert controller.state.stats.focus_seconds == 10
+
+    def test_focus_time_builds_streak(self, make_controller):
+        """Test on-task and thinking time extend the focus streak."""
+        controller = make_controller()
+
+        controller._accumulate_stats(self._judgment("on_task"), 10)
+        controller._accumulate_stats(self._judgment("thinking"), 10)
+
+        stats = controller.state.stats
+        assert stats.focus_seconds == 10
+        assert stats.thinking_seconds == 10
+        assert stats.best_focus_streak_seconds == 20
+
+    def test_distraction_resets_streak(self, make_controller):
+        """Test idle/off-task time resets the streak but keeps the best."""
+        controller = make_controller()
+
+        controller._accumulate_stats(self._judgment("on_task"), 10)
+        controller._accumulate_stats(self._judgment("off_task", "warn"), 10)
+        controller._accumulate_stats(self._judgment("idle"), 10)
+
+        stats = controller.state.stats
+        assert stats.off_task_seconds == 10
+        assert stats.idle_seconds == 10
+        assert stats.current_focus_streak_seconds == 0
+        assert stats.best_focus_streak_seconds == 10
+
+
 @pytest.mark.unit
 class TestCooldownLogic:
     """Tests for cooldown logic."""
@@ -306,6 +928,33 @@ class TestWorkerRegistry:
 
         workers["test_worker"].join.assert_called_once()
 
+    def test_join_workers_waits_in_parallel(self, make_controller):
+        """Test slow joins overlap instead of adding up."""
+        controller = make_controller()
+        for i in range(3):
+            worker = Mock()
+            worker.is_alive.return_value = True
+            worker.join.side_effect = lambda timeout: time.sleep(0.3)
+            controller.workers[f"worker_{i}"] = worker
+
+        start = time.monotonic()
+        controller._join_workers(timeout=5.0)
+
+        assert time.monotonic() - start < 0.8
+        for worker in controller.workers.values():
+            worker.join.assert_called_once_with(timeout=5.0)
+
+    def test_join_workers_skips_dead_workers(self, make_controller):
+        """Test finished workers aren't joined."""
+        controller = make_controller()
+        worker = Mock()
+        worker.is_alive.return_value = False
+        controller.workers = {"done": worker}
+
+        controller._join_workers(timeout=5.0)
+
+        worker.join.assert_not_called()
+
 
 @pytest.mark.unit
 class TestStateSnapshot:
@@ -327,6 +976,48 @@ class TestStateSnapshot:
         assert hasattr(state, "stats")
         assert hasattr(state, "pomodoro_state")
 
+    @pytest.fixture
+    def controller(self, make_controller):
+        controller = make_controller()
+        controller.state.session_active = True
+        controller.state.goal = "Test goal"
+        controller.pomodoro = None
+        return controller
+
+    def test_snapshot_reused_until_state_changes(self, controller):
+        """Test polling an unchanged state returns the same snapshot."""
+
+        first = controller.get_state_snapshot()
+        assert controller.get_state_snapshot() is first
+
+        controller.state.goal = "New goal"
+        second = controller.get_state_snapshot()
+
+        assert second is not first
+        assert second.goal == "New goal"
+        assert first.goal == "Test goal"
+
+    def test_snapshot_is_read_only(self, controller):
+        """Test a shared snapshot can't be changed by one of its readers."""
+        import dataclasses
+
+        snapshot = controller.get_state_snapshot()
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            snapshot.goal = "Changed"
+        assert controller.get_state_snapshot().goal == "Test goal"
+
+    def test_snapshot_rebuilt_on_new_judgment(self, controller):
+        """Test a new judgment object invalidates the cached snapshot."""
+        first = controller.get_state_snapshot()
+
+        controller.last_judgment = Mock()
+
+        assert controller.get_state_snapshot() is not first
+        assert controller.get_state_snapshot().last_judgment_obj is (
+            controller.last_judgment
+        )
+
 
 @pytest.mark.unit
 class TestPersonalityIntegration:
@@ -355,6 +1046,271 @@ class TestPersonalityIntegration:
         assert state.personality_name == "buddy"
         assert state.wake_word == "hey buddy"
 
+    def test_set_personality_reads_wake_word_once(self, make_controller):
+        """Test the new wake word is computed once and reused from state."""
+        controller = make_controller()
+        controller._io_executor = MagicMock()
+        wake_word = PropertyMock(return_value="hey buddy")
+        type(controller.personality_manager).wake_word = wake_word
+        controller.wake_word_detector = MagicMock()
+
+        with patch(
+            "code_sergeant.controller.update_personality",
+            return_value=deep_merge(DEFAULT_CONFIG, {}),
+        ):
+            controller.set_personality("buddy")
+
+        assert controller.state.wake_word == "hey buddy"
+        controller.wake_word_detector.set_wake_words.assert_called_once_with(
+            ["hey buddy"]
+        )
+        wake_word.assert_called_once_with()
+
+
+@pytest.mark.unit
+class TestPhraseCache:
+    """Tests for the controller's per-personality phrase cache."""
+
+    @staticmethod
+    def _controller(make_controller, pool):
+        controller = make_controller()
+        controller.personality_manager.get_phrase_pool.return_value = pool
+        return controller
+
+    def test_pool_resolved_once(self, make_controller):
+        """Test repeated phrases of one type look the pool up once."""
+        controller = self._controller(make_controller, ("Move it!", "Eyes front!"))
+
+        phrases = {controller._phrase("off_task_drill") for _ in range(20)}
+
+        assert phrases <= {"Move it!", "Eyes front!"}
+        controller.personality_manager.get_phrase_pool.assert_called_once_with(
+            "off_task_drill"
+        )
+
+    def test_empty_pool_returns_empty_string(self, make_controller):
+        """Test a personality without phrases yields "" so callers fall back."""
+        controller = self._controller(make_controller, ())
+
+        assert controller._phrase("reminder") == ""
+
+    def test_empty_pool_not_cached(self, make_controller):
+        """Test an empty pool (failed generation) is retried on the next use."""
+        controller = self._controller(make_controller, ())
+        assert controller._phrase("reminder") == ""
+
+        controller.personality_manager.get_phrase_pool.return_value = ("Drink!",)
+
+        assert controller._phrase("reminder") == "Drink!"
+        assert controller.personality_manager.get_phrase_pool.call_count == 2
+
+    def test_personality_change_resets_cache(self, make_controller):
+        """Test set_personality drops phrases of the previous personality."""
+        controller = self._controller(make_controller, ("Move it!",))
+        controller._phrase("off_task_drill")
+        controller._io_executor = MagicMock()
+
+        with patch(
+            "code_sergeant.controller.update_personality",
+            return_value=deep_merge(DEFAULT_CONFIG, {}),
+        ):
+            controller.set_personality("buddy")
+
+        assert controller._phrase_cache == {}
+
+
+@pytest.mark.unit
+class TestConfigPersistence:
+    """Tests for saving config off the calling thread."""
+
+    @pytest.fixture
+    def controller(self, make_controller):
+        return make_controller(voice_activation={"enabled": False})
+
+    def test_toggle_wake_word_saves_snapshot_in_background(self, controller):
+        """Test the saved config is a snapshot written on the I/O thread."""
+        saved = []
+
+        def fake_save(config):
+            saved.append((config, threading.current_thread()))
+
+        with patch("code_sergeant.controller.save_config", side_effect=fake_save):
+            controller.toggle_wake_word(False)
+            controller.config["voice_activation"]["enabled"] = True
+            controller._io_executor.shutdown(wait=True)
+
+        ((config, thread),) = saved
+        assert config["voice_activation"] == {"enabled": False, "sensitivity": 0.5}
+        assert thread is not threading.current_thread()
+
+    def test_saves_keep_call_order(self, controller):
+        """Test queued saves land in the order they were requested."""
+        saved = []
+
+        with patch(
+            "code_sergeant.controller.save_config",
+            side_effect=lambda config: saved.append(
+                config["voice_activation"]["enabled"]
+            ),
+        ):
+            for enabled in (True, False, True):
+                controller.config["voice_activation"]["enabled"] = enabled
+                controller._save_config_async()
+            controller._io_executor.shutdown(wait=True)
+
+        assert saved == [True, False, True]
+
+    def test_toggle_wake_word_rebuilds_cfg(self, controller):
+        """Test the flattened config follows the dict after a toggle."""
+        with patch("code_sergeant.controller.save_config"):
+            controller.toggle_wake_word(False)
+            controller._io_executor.shutdown(wait=True)
+        assert controller.cfg.voice_activation_enabled is False
+
+        controller.wake_word_detector = MagicMock()
+        with patch("code_sergeant.controller.save_config"):
+            controller._io_executor = MagicMock()
+            controller.toggle_wake_word(True)
+        assert controller.cfg.voice_activation_enabled is True
+
+
+@pytest.mark.unit
+class TestControllerConfig:
+    """Tests for the flattened ControllerConfig view."""
+
+    def test_from_default_config(self):
+        """Test nested defaults are flattened into attributes."""
+        from code_sergeant.controller import ControllerConfig
+
+        cfg = ControllerConfig.from_config(deep_merge(DEFAULT_CONFIG, {}))
+
+        assert cfg.cooldown_seconds == 30
+        assert cfg.ollama_model == "llama3.2"
+        assert cfg.voice_activation_enabled is False
+        assert cfg.motivation_check_interval == 3
+        assert cfg.reminder_intervals_sec == (300, 600, 900)
+
+    def test_optional_sections_use_defaults(self):
+        """Test missing optional sections fall back like the old .get() chains."""
+        from code_sergeant.controller import ControllerConfig
+
+        config = deep_merge(DEFAULT_CONFIG, {})
+        for section in ("voice_activation", "pomodoro", "motivation"):
+            del config[section]
+
+        cfg = ControllerConfig.from_config(config)
+
+        assert cfg.wake_word_sensitivity == 0.5
+        assert cfg.pomodoro_auto_start is False
+        assert cfg.motivation_enabled is True
+
+    def test_is_frozen(self):
+        """Test the snapshot can't be modified in place."""
+        import dataclasses
+
+        from code_sergeant.controller import ControllerConfig
+
+        cfg = ControllerConfig.from_config(deep_merge(DEFAULT_CONFIG, {}))
+
+        with pytest.raises(dataclasses.FrozenInstanceError):
+            cfg.cooldown_seconds = 0
+
+
+@pytest.mark.unit
+class TestDrillWakeup:
+    """Tests for waking the drill worker on activity changes."""
+
+    @pytest.fixture
+    def controller(self, make_controller):
+        controller = make_controller()
+        controller.drill_interval = 5
+        controller.state.last_judgment_obj = Judgment(
+            classification="off_task",
+            confidence=0.9,
+            reason="",
+            say="",
+            action="none",
+        )
+        return controller
+
+    def test_activity_update_wakes_drill_without_judging(self, controller):
+        """Test the activity handler only signals the drill worker."""
+        controller.drill_worker = MagicMock()
+        controller.drill_worker.is_alive.return_value = True
+        controller._trigger_immediate_judgment = MagicMock()
+
+        controller._handle_activity_update(
+            {"activity": ActivityEvent(ts=datetime.now(), app="Code", title="x.py")}
+        )
+
+        assert controller._drill_wake.is_set()
+        controller._trigger_immediate_judgment.assert_not_called()
+
+    def test_wake_ends_pause_when_back_on_task(self, controller):
+        """Test a wake is judged on the drill thread and ends the wait early."""
+
+        def judge():
+            controller.state.last_judgment_obj = Judgment(
+                classification="on_task",
+                confidence=0.9,
+                reason="",
+                say="",
+                action="none",
+            )
+
+        controller._trigger_immediate_judgment = MagicMock(side_effect=judge)
+        controller._drill_wake.set()
+
+        start = time.monotonic()
+        controller._drill_pause()
+
+        assert time.monotonic() - start < 1
+        controller._trigger_immediate_judgment.assert_called_once()
+        assert not controller._drill_wake.is_set()
+
+    def test_wake_keeps_cadence_while_off_task(self, controller):
+        """Test a wake that is still off task waits out the interval."""
+        controller.drill_interval = 0.2
+        controller._trigger_immediate_judgment = MagicMock()
+        controller._drill_wake.set()
+
+        start = time.monotonic()
+        controller._drill_pause()
+
+        assert time.monotonic() - start >= 0.2
+        controller._trigger_immediate_judgment.assert_called_once()
+
+    def test_drill_loop_nags_until_back_on_task(self, controller):
+        """Test the drill loop speaks while off task and exits once on task."""
+        controller.drill_interval = 0.01
+        controller.state.session_active = True
+        controller._phrase = MagicMock(return_value="Move it!")
+        controller.tts_service = MagicMock()
+
+        def speak(phrase):
+            if controller.tts_service.speak.call_count == 2:
+                controller.state.last_judgment_obj = None
+
+        controller.tts_service.speak.side_effect = speak
+
+        controller._drill_loop()
+
+        assert controller.tts_service.speak.call_count == 2
+
+    def test_stop_interrupts_pause(self, controller):
+        """Test stopping the drill ends the wait without judging."""
+        controller._trigger_immediate_judgment = MagicMock()
+        threading.Timer(
+            0.05,
+            lambda: (controller.drill_stop_event.set(), controller._drill_wake.set()),
+        ).start()
+
+        start = time.monotonic()
+        controller._drill_pause()
+
+        assert time.monotonic() - start < 1
+        controller._trigger_immediate_judgment.assert_not_called()
+
 
 @pytest.mark.unit
 class TestEdgeCases:
@@ -372,12 +1328,14 @@ class TestEdgeCases:
 
     def test_concurrent_event_handling(self):
         """Test concurrent event handling."""
-        event_queue = queue.Queue()
+        from code_sergeant.controller import EventQueue
+
+        event_queue = EventQueue()
 
         # Simulate concurrent event additions
         def add_events():
             for i in range(100):
-                event_queue.put({"type": "test", "id": i})
+                event_queue.append({"type": "test", "id": i})
 
         threads = [threading.Thread(target=add_events) for _ in range(5)]
 
@@ -388,4 +1346,4 @@ class TestEdgeCases:
             t.join()
 
         # All events should be queued
-        assert event_queue.qsize() == 500
+        assert len(event_queue) == 500
@@ -7,6 +7,7 @@ Tests edge cases and core functionality of the judgment system:
 - Cooldown logic
 - Fallback classifier
 - Confidence scoring
+- Judgment reuse for repeated activities
 """
 
 import os
@@ -203,7 +204,7 @@ class TestActivityJudgeCooldown:
             goal="coding",
             activity=sample_activity_off_task,
             history=[],
-            last_yell_time=time.time(),  # Just yelled
+            last_yell_time=time.monotonic(),  # Just yelled
             cooldown_seconds=30,
         )
 
@@ -221,7 +222,7 @@ class TestActivityJudgeCooldown:
 
     def test_cooldown_expired_allows_yell(self, judge, sample_activity_off_task):
         """Test that expired cooldown allows warnings again."""
-        old_yell_time = time.time() - 60  # 60 seconds ago
+        old_yell_time = time.monotonic() - 60  # 60 seconds ago
 
         result = judge.judge(
             goal="coding",
@@ -426,3 +427,68 @@ class TestActivityJudgeValidOutput:
 
         valid_actions = ["none", "warn", "yell"]
         assert result.action in valid_actions
+
+
+@pytest.mark.unit
+class TestActivityJudgeCache:
+    """Tests for reusing LLM judgments of repeated activities."""
+
+    @pytest.fixture
+    def ai_client(self):
+        """Real AIClient whose chat always judges off_task with a yell."""
+        from code_sergeant.ai_client import AIClient
+
+        with patch.dict(os.environ, {"OPENAI_API_KEY": ""}):
+            client = AIClient(openai_api_key=None)
+        client.chat = MagicMock(
+            return_value=(
+                '{"classification": "off_task", "confidence": 0.9, '
+                '"reason": "video", "say": "Back to work!", "action": "yell"}'
+            )
+        )
+        return client
+
+    @staticmethod
+    def _activity(title="Cat videos"):
+        return ActivityEvent(ts=datetime.now(), app="Safari", title=title)
+
+    def test_repeat_activity_skips_llm(self, ai_client):
+        """Test returning to the same window reuses the judgment."""
+        judge = ActivityJudge(ai_client=ai_client)
+
+        first = judge.judge("coding", self._activity(), [])
+        second = judge.judge("coding", self._activity(), [])
+
+        assert first.classification == second.classification == "off_task"
+        assert ai_client.chat.call_count == 1
+
+    def test_different_title_is_judged(self, ai_client):
+        """Test a new window title goes to the LLM."""
+        judge = ActivityJudge(ai_client=ai_client)
+
+        judge.judge("coding", self._activity("Cat videos"), [])
+        judge.judge("coding", self._activity("Dog videos"), [])
+
+        assert ai_client.chat.call_count == 2
+
+    def test_cooldown_applies_to_reused_judgment(self, ai_client):
+        """Test a cached yell is still downgraded during the cooldown."""
+        judge = ActivityJudge(ai_client=ai_client)
+        judge.judge("coding", self._activity(), [])
+
+        result = judge.judge(
+            "coding", self._activity(), [], last_yell_time=time.monotonic()
+        )
+
+        assert result.action == "warn"
+        assert judge.judge("coding", self._activity(), []).action == "yell"
+
+    def test_entries_expire_with_client_cache(self, ai_client):
+        """Test judgments follow the AIClient result cache TTL."""
+        judge = ActivityJudge(ai_client=ai_client)
+
+        with patch("code_sergeant.ai_client.RESULT_CACHE_TTL_SEC", 0.0):
+            judge.judge("coding", self._activity(), [])
+            judge.judge("coding", self._activity(), [])
+
+        assert ai_client.chat.call_count == 2
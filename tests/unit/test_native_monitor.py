@@ -0,0 +1,161 @@
+"""
+Unit tests for NativeMonitor.
+
+macOS APIs are patched out so these run on any platform:
+- Combined snapshot() query and its TTL cache
+- Window title cache across polls
+- wait_for_change() app-switch wakeups
+- Removing the app-activation observer on stop()
+"""
+
+import os
+import sys
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from code_sergeant.native_monitor import NativeMonitor  # noqa: E402
+
+
+@pytest.fixture
+def monitor():
+    """Create a NativeMonitor with the macOS queries patched."""
+    native_monitor = NativeMonitor()
+    with patch("code_sergeant.native_monitor.MACOS_AVAILABLE", True), patch.object(
+        native_monitor, "get_frontmost_app", return_value="Cursor"
+    ) as frontmost, patch.object(
+        native_monitor, "_get_window_title_for", return_value="main.py"
+    ) as title, patch.object(
+        native_monitor, "get_idle_seconds", return_value=12.0
+    ) as idle:
+        native_monitor.frontmost_mock = frontmost
+        native_monitor.idle_mock = idle
+        native_monitor.title_mock = title
+        yield native_monitor
+
+
+@pytest.mark.unit
+class TestSnapshot:
+    """Tests for NativeMonitor.snapshot()."""
+
+    def test_snapshot_fields(self, monitor):
+        """Test snapshot returns all activity fields."""
+        snap = monitor.snapshot()
+
+        assert snap == {
+            "app": "Cursor",
+            "window_title": "main.py",
+            "idle_seconds": 12.0,
+            "is_idle": False,
+        }
+
+    def test_snapshot_reused_within_ttl(self, monitor):
+        """Test repeated snapshots within the TTL query macOS once."""
+        monitor.snapshot()
+        monitor.snapshot()
+        monitor.is_user_idle()
+
+        assert monitor.frontmost_mock.call_count == 1
+        assert monitor.idle_mock.call_count == 1
+
+    def test_snapshot_refreshes_after_ttl(self, monitor):
+        """Test an expired snapshot is re-queried."""
+        monitor.SNAPSHOT_TTL = 0.0
+
+        monitor.snapshot()
+        monitor.snapshot()
+
+        assert monitor.frontmost_mock.call_count == 2
+
+
+@pytest.mark.unit
+class TestWindowTitleCache:
+    """Tests for reusing the window title between polls."""
+
+    def test_title_reused_while_app_unchanged(self, monitor):
+        """Test polls of the same app skip the window list query."""
+        monitor.get_current_activity()
+        activity = monitor.get_current_activity()
+
+        assert activity.title == "main.py"
+        assert monitor.title_mock.call_count == 1
+
+    def test_app_switch_requeries(self, monitor):
+        """Test a different frontmost app reads its own title."""
+        monitor.get_current_activity()
+        monitor.frontmost_mock.return_value = "Safari"
+
+        monitor.get_current_activity()
+
+        monitor.title_mock.assert_called_with("Safari")
+        assert monitor.title_mock.call_count == 2
+
+    def test_title_refreshed_after_interval(self, monitor):
+        """Test same-app title changes are still picked up."""
+        monitor.TITLE_REFRESH_INTERVAL = 0.0
+
+        monitor.get_current_activity()
+        monitor.get_current_activity()
+
+        assert monitor.title_mock.call_count == 2
+
+
+@pytest.mark.unit
+class TestWaitForChange:
+    """Tests for NativeMonitor.wait_for_change()."""
+
+    def test_times_out_without_change(self, monitor):
+        """Test the wait returns False after the timeout."""
+        assert monitor.wait_for_change(timeout=0.01) is False
+
+    def test_app_switch_wakes_waiter(self, monitor):
+        """Test a notification ends the wait early and refreshes the snapshot."""
+        monitor.snapshot()
+        threading.Timer(0.05, monitor._changed.set).start()
+
+        start = time.monotonic()
+        assert monitor.wait_for_change(timeout=5.0) is True
+        assert time.monotonic() - start < 1
+
+        monitor.snapshot()
+        assert monitor.frontmost_mock.call_count == 2
+
+    def test_burst_coalesced_into_one_wakeup(self, monitor):
+        """Test notifications during the debounce window don't wake again."""
+        monitor._changed.set()
+        threading.Timer(monitor.CHANGE_DEBOUNCE / 2, monitor._changed.set).start()
+
+        assert monitor.wait_for_change(timeout=1.0) is True
+        assert monitor.wait_for_change(timeout=0.01) is False
+
+    def test_wake_interrupts_wait(self, monitor):
+        """Test wake() releases a pending wait."""
+        monitor.wake()
+
+        assert monitor.wait_for_change(timeout=5.0) is True
+
+
+@pytest.mark.unit
+class TestStop:
+    """Tests for NativeMonitor.stop()."""
+
+    def test_stop_removes_observer_once(self, monitor):
+        """Test stop() unregisters the observer and is safe to call again."""
+        observer = object()
+        monitor._app_observer = observer
+
+        with patch(
+            "code_sergeant.native_monitor.NSWorkspace", create=True
+        ) as workspace:
+            monitor.stop()
+            monitor.stop()
+
+        center = workspace.sharedWorkspace.return_value.notificationCenter.return_value
+        center.removeObserver_.assert_called_once_with(observer)
+        assert monitor._app_observer is None
@@ -0,0 +1,79 @@
+"""
+Unit tests for PersonalityManager.
+
+Tests phrase pools:
+- Predefined templates
+- Several generated variations for custom personalities
+- Empty pool when generation fails
+"""
+
+import os
+import sys
+from unittest.mock import Mock
+
+import pytest
+
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from code_sergeant.personality import (  # noqa: E402
+    CUSTOM_PHRASE_POOL_SIZE,
+    PERSONALITY_PHRASES,
+    PersonalityManager,
+)
+
+
+@pytest.fixture
+def custom_manager():
+    """PersonalityManager with a custom personality and a mocked Ollama client."""
+    manager = PersonalityManager(
+        {"personality": {"name": "custom", "description": "a pirate captain"}}
+    )
+    manager.ollama_client = Mock()
+    return manager
+
+
+@pytest.mark.unit
+class TestPhrasePool:
+    """Tests for get_phrase_pool()."""
+
+    def test_predefined_pool_is_templates(self):
+        """Test a predefined personality returns its templates without the LLM."""
+        manager = PersonalityManager({"personality": {"name": "sergeant"}})
+        manager.ollama_client = Mock()
+
+        pool = manager.get_phrase_pool("reminder")
+
+        assert pool == tuple(PERSONALITY_PHRASES["sergeant"]["reminder"])
+        manager.ollama_client.generate.assert_not_called()
+
+    def test_custom_pool_has_several_phrases(self, custom_manager):
+        """Test one LLM call yields several distinct, cleaned-up variations."""
+        custom_manager.ollama_client.generate.return_value = {
+            "response": '1. "Back to the helm!"\n2. Eyes on the horizon!\n'
+            "- Back to the helm!\n\n* Hoist the sails, matey!"
+        }
+
+        pool = custom_manager.get_phrase_pool("off_task_warning")
+
+        assert pool == (
+            "Back to the helm!",
+            "Eyes on the horizon!",
+            "Hoist the sails, matey!",
+        )
+        custom_manager.ollama_client.generate.assert_called_once()
+        prompt = custom_manager.ollama_client.generate.call_args.kwargs["prompt"]
+        assert f"Write {CUSTOM_PHRASE_POOL_SIZE} different versions" in prompt
+
+    def test_custom_pool_empty_on_failure(self, custom_manager):
+        """Test a failed generation yields () rather than another personality."""
+        custom_manager.ollama_client.generate.side_effect = ConnectionError
+
+        assert custom_manager.get_phrase_pool("reminder") == ()
+
+    def test_custom_pool_empty_on_blank_response(self, custom_manager):
+        """Test a blank generation yields () so the caller keeps its fallback."""
+        custom_manager.ollama_client.generate.return_value = {"response": "\n  \n"}
+
+        assert custom_manager.get_phrase_pool("session_end") == ()
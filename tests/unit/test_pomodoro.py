@@ -292,6 +292,25 @@ class TestPomodoroTimerDisplay:
 
         assert emoji == "☕"
 
+    def test_total_seconds_per_state(self):
+        """Test total_seconds follows the current period."""
+        state = PomodoroState(work_duration_minutes=30, short_break_minutes=5)
+
+        assert state.total_seconds == 0
+        state.current_state = "work"
+        assert state.total_seconds == 1800
+        state.current_state = "short_break"
+        assert state.total_seconds == 300
+
+    def test_total_seconds_tracks_duration_changes(self):
+        """Test total_seconds is recomputed after a duration is reassigned."""
+        state = PomodoroState(current_state="work")
+        assert state.total_seconds == 1500
+
+        state.work_duration_minutes = 50
+
+        assert state.total_seconds == 3000
+
     def test_get_status_text(self):
         """Test status text generation."""
         timer = PomodoroTimer()
@@ -0,0 +1,93 @@
+"""
+Unit tests for PromptCache.
+
+Tests:
+- Similar-title hits and dissimilar-title misses
+- Partition isolation, TTL expiry and LRU eviction
+"""
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from code_sergeant.prompt_cache import (  # noqa: E402
+    PromptCache,
+    hashed_trigram_embedding,
+)
+
+JUDGMENT = {"classification": "on_task", "confidence": 0.9}
+PARTITION = ("Write tests", "Cursor")
+
+
+@pytest.mark.unit
+class TestEmbedding:
+    """Tests for hashed_trigram_embedding."""
+
+    def test_embedding_is_unit_length(self):
+        """Test embeddings are normalized so dot product is cosine similarity."""
+        vec = hashed_trigram_embedding("main.py — CodeSergeant")
+
+        assert float(vec @ vec) == pytest.approx(1.0)
+
+    def test_empty_text_embeds_to_zero(self):
+        """Test empty text does not divide by zero."""
+        assert not hashed_trigram_embedding("").any()
+
+
+@pytest.mark.unit
+class TestPromptCache:
+    """Tests for PromptCache lookup/store."""
+
+    def test_similar_title_hits(self):
+        """Test a lightly edited title reuses the cached judgment."""
+        cache = PromptCache()
+        cache.store(PARTITION, "main.py — CodeSergeant", JUDGMENT)
+
+        assert cache.lookup(PARTITION, "● main.py — CodeSergeant") == JUDGMENT
+
+    def test_different_title_misses(self):
+        """Test a different file in the same app is judged afresh."""
+        cache = PromptCache()
+        cache.store(PARTITION, "main.py — CodeSergeant", JUDGMENT)
+
+        assert cache.lookup(PARTITION, "server.py — CodeSergeant") is None
+
+    def test_partitions_do_not_mix(self):
+        """Test the same title under another app never matches."""
+        cache = PromptCache()
+        cache.store(PARTITION, "main.py", JUDGMENT)
+
+        assert cache.lookup(("Write tests", "Safari"), "main.py") is None
+
+    def test_expired_entry_misses(self):
+        """Test entries older than the TTL are ignored."""
+        cache = PromptCache(ttl_sec=0.0)
+        cache.store(PARTITION, "main.py", JUDGMENT)
+
+        assert cache.lookup(PARTITION, "main.py") is None
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted at capacity."""
+        cache = PromptCache(max_entries=2)
+        cache.store(PARTITION, "alpha.py", JUDGMENT)
+        cache.store(PARTITION, "beta.py", JUDGMENT)
+        cache.lookup(PARTITION, "alpha.py")
+        cache.store(PARTITION, "gamma.py", JUDGMENT)
+
+        assert len(cache) == 2
+        assert cache.lookup(PARTITION, "alpha.py") == JUDGMENT
+        assert cache.lookup(PARTITION, "beta.py") is None
+
+    def test_lookup_returns_copy(self):
+        """Test callers can't mutate the cached response."""
+        cache = PromptCache()
+        cache.store(PARTITION, "main.py", JUDGMENT)
+
+        cache.lookup(PARTITION, "main.py")["classification"] = "off_task"
+
+        assert cache.lookup(PARTITION, "main.py") == JUDGMENT
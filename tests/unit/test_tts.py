@@ -102,6 +102,16 @@ class TestTTSServiceQueue:
         assert cleared == 3
         assert tts_service.speak_queue.empty()
 
+    def test_queue_usable_after_clear(self, tts_service):
+        """Test messages enqueued after a clear are delivered normally."""
+        tts_service.speak("Message 1")
+        tts_service.clear_queue()
+
+        tts_service.speak("Message 2")
+
+        assert tts_service.speak_queue.get_nowait()[0] == "Message 2"
+        assert tts_service.speak_queue.empty()
+
     def test_clear_empty_queue(self, tts_service):
         """Test clearing an empty queue."""
         cleared = tts_service.clear_queue()
@@ -186,6 +196,35 @@ class TestTTSServiceCancelAll:
 
         assert count == 3
 
+    def test_repeated_cancel_is_noop(self, tts_service):
+        """Test a second cancel with nothing new enqueued skips the work."""
+        tts_service.speak("Message 1")
+        tts_service.cancel_all()
+
+        with patch.object(tts_service, "stop_current_audio") as stop:
+            assert tts_service.cancel_all() == 0
+
+        stop.assert_not_called()
+
+    def test_cancel_after_new_speech_runs(self, tts_service):
+        """Test speech enqueued after a cancel is cancelled by the next one."""
+        tts_service.cancel_all()
+        tts_service.speak("Message 1")
+
+        assert tts_service.cancel_all() == 1
+        assert tts_service.speak_queue.empty()
+
+    def test_cancel_while_speaking_runs(self, tts_service):
+        """Test a cancel is never skipped while audio is playing."""
+        tts_service.cancel_all()
+        tts_service._speaking.set()
+
+        with patch.object(tts_service, "stop_current_audio") as stop:
+            tts_service.cancel_all()
+
+        stop.assert_called_once()
+        assert not tts_service.is_speaking()
+
 
 @pytest.mark.unit
 class TestTTSServicePauseResume:
@@ -283,6 +322,80 @@ class TestTTSServiceWorker:
         assert tts_service.stop_event.is_set()
 
 
+@pytest.mark.unit
+class TestTTSServiceOnDone:
+    """Tests for speak() completion callbacks."""
+
+    @pytest.fixture
+    def tts_service(self):
+        """Create TTS service with mocked engine."""
+        with patch("code_sergeant.tts.pyttsx3") as mock_pyttsx3:
+            mock_engine = MagicMock()
+            mock_pyttsx3.init.return_value = mock_engine
+            mock_engine.getProperty.return_value = []
+
+            service = TTSService()
+            service.engine = mock_engine
+            yield service
+
+    def test_called_after_playback(self, tts_service):
+        """Test on_done fires once the provider has finished speaking."""
+        done = threading.Event()
+        played = []
+        tts_service._speak_pyttsx3 = played.append
+
+        tts_service.start()
+        try:
+            tts_service.speak("Go ahead.", on_done=done.set)
+            assert done.wait(timeout=2.0)
+        finally:
+            tts_service.stop()
+
+        assert played == ["Go ahead."]
+
+    def test_called_when_cleared(self, tts_service):
+        """Test a message cleared before playing still releases its waiter."""
+        done = threading.Event()
+        tts_service.speak("Go ahead.", on_done=done.set)
+
+        tts_service.cancel_all()
+
+        assert done.is_set()
+
+    def test_called_for_empty_text(self, tts_service):
+        """Test ignored empty text doesn't leave the caller waiting."""
+        done = threading.Event()
+
+        tts_service.speak("  ", on_done=done.set)
+
+        assert done.is_set()
+        assert tts_service.speak_queue.empty()
+
+    def test_enqueue_future_tracks_own_message(self, tts_service):
+        """Test enqueue()'s future resolves when its own message has played."""
+        played = []
+        tts_service._speak_pyttsx3 = played.append
+
+        tts_service.start()
+        try:
+            first = tts_service.enqueue("Warning")
+            second = tts_service.enqueue("Go ahead.")
+            second.result(timeout=2.0)
+        finally:
+            tts_service.stop()
+
+        assert first.done()
+        assert played == ["Warning", "Go ahead."]
+
+    def test_enqueue_future_resolves_when_cleared(self, tts_service):
+        """Test a cleared message's future doesn't leave its caller hanging."""
+        future = tts_service.enqueue("Go ahead.")
+
+        tts_service.clear_queue()
+
+        assert future.result(timeout=0) is None
+
+
 @pytest.mark.unit
 class TestTTSServiceVoice:
     """Tests for voice configuration."""
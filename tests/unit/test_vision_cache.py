@@ -0,0 +1,117 @@
+"""
+Unit tests for VisionResultCache.
+
+Tests:
+- dHash fingerprints of similar and different frames
+- Near-frame hits, prompt isolation, TTL expiry and LRU eviction
+"""
+
+import io
+import os
+import sys
+from unittest.mock import patch
+
+import pytest
+from PIL import Image, ImageDraw
+
+sys.path.insert(
+    0, os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+)
+
+from code_sergeant.vision_cache import (  # noqa: E402
+    VisionResultCache,
+    image_fingerprint,
+)
+
+PROMPT = "What is the user doing?"
+
+
+def _frame(cursor_x=None, dark_left=True):
+    """Encode a two-tone 800x600 screenshot, optionally with a small cursor."""
+    img = Image.new("RGB", (800, 600), (240, 240, 240))
+    draw = ImageDraw.Draw(img)
+    draw.rectangle(
+        (0, 0, 400, 600) if dark_left else (400, 0, 800, 600), fill=(30, 30, 30)
+    )
+    if cursor_x is not None:
+        draw.rectangle((cursor_x, 300, cursor_x + 2, 316), fill=(255, 255, 255))
+    buf = io.BytesIO()
+    img.save(buf, "PNG")
+    return buf.getvalue()
+
+
+@pytest.mark.unit
+class TestFingerprint:
+    """Tests for image_fingerprint."""
+
+    def test_identical_frames_match(self):
+        """Test the same image always hashes the same."""
+        assert image_fingerprint(_frame()) == image_fingerprint(_frame())
+
+    def test_cursor_blink_flips_few_bits(self):
+        """Test a tiny local change stays within the default distance."""
+        distance = (
+            image_fingerprint(_frame()) ^ image_fingerprint(_frame(cursor_x=600))
+        ).bit_count()
+
+        assert distance <= 4
+
+    def test_different_layout_flips_many_bits(self):
+        """Test a different screen is far away."""
+        a = image_fingerprint(_frame(dark_left=True))
+        b = image_fingerprint(_frame(dark_left=False))
+
+        assert (a ^ b).bit_count() > 4
+
+    def test_unreadable_bytes_use_digest(self):
+        """Test non-image input still gets a stable 64-bit fingerprint."""
+        fingerprint = image_fingerprint(b"not an image")
+
+        assert fingerprint == image_fingerprint(b"not an image")
+        assert fingerprint.bit_length() <= 64
+
+
+@pytest.mark.unit
+class TestVisionResultCache:
+    """Tests for VisionResultCache lookup/store."""
+
+    def test_near_frame_hits(self):
+        """Test a fingerprint a few bits away reuses the analysis."""
+        cache = VisionResultCache()
+        cache.store(PROMPT, 0b1011, "coding")
+
+        assert cache.lookup(PROMPT, 0b0010) == "coding"
+
+    def test_distant_frame_misses(self):
+        """Test a fingerprint past max_distance is a miss."""
+        cache = VisionResultCache(max_distance=4)
+        cache.store(PROMPT, 0, "coding")
+
+        assert cache.lookup(PROMPT, 0b11111) is None
+
+    def test_prompts_are_isolated(self):
+        """Test the same frame under another prompt is a miss."""
+        cache = VisionResultCache()
+        cache.store(PROMPT, 42, "coding")
+
+        assert cache.lookup("Is the user idle?", 42) is None
+
+    def test_entries_expire(self):
+        """Test entries older than the TTL are ignored."""
+        cache = VisionResultCache(ttl_sec=60)
+        with patch("code_sergeant.vision_cache.time.monotonic", return_value=0.0):
+            cache.store(PROMPT, 42, "coding")
+        with patch("code_sergeant.vision_cache.time.monotonic", return_value=61.0):
+            assert cache.lookup(PROMPT, 42) is None
+
+    def test_lru_eviction(self):
+        """Test the least recently used entry is evicted at capacity."""
+        cache = VisionResultCache(max_distance=0, max_entries=2)
+        cache.store(PROMPT, 1, "a")
+        cache.store(PROMPT, 2, "b")
+        cache.lookup(PROMPT, 1)
+        cache.store(PROMPT, 4, "c")
+
+        assert len(cache) == 2
+        assert cache.lookup(PROMPT, 2) is None
+        assert cache.lookup(PROMPT, 1) == "a"